@@ -1,5 +1,6 @@
 import streamlit as st
-from utils import set_bg_hack, show_footer, hide_header
+from utils import set_bg_hack, show_footer
+import theme
 
 st.set_page_config(
     page_title="한국금융투자기술",
@@ -8,51 +9,9 @@ st.set_page_config(
     initial_sidebar_state="collapsed",
 )
 
-hide_header()
+theme.apply("home")  # 공통(base) + 네비게이션 스타일 (assets/css)
 set_bg_hack("background.jpg")
 
-# 사이드바 강제 숨김
-st.markdown(
-    """
-    <style>
-    [data-testid="stSidebar"] {display: none;}
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
-
-# 네비게이션 스타일
-st.markdown(
-    """
-    <style>
-    [data-testid="stPageLink-NavLink"] {
-        background-color: transparent !important;
-        border: none !important;
-        box-shadow: none !important;
-        padding: 0px 10px !important;
-        margin: 0 !important;
-        text-decoration: none !important;
-    }
-    [data-testid="stPageLink-NavLink"] p {
-        color: #FFFFFF !important;
-        font-size: 1.3rem !important;
-        font-weight: 700 !important;
-        margin: 0 !important;
-        padding: 5px 10px !important;
-        text-shadow: 0px 2px 4px rgba(0,0,0,0.9), 0px 0px 10px rgba(0,0,0,0.7);
-    }
-    [data-testid="stPageLink-NavLink"]:hover p {
-        color: #FFD700 !important;
-        font-weight: 900 !important;
-        transform: scale(1.05);
-        text-shadow: 0px 0px 15px rgba(255, 215, 0, 0.8), 0px 2px 5px rgba(0,0,0,1);
-        transition: all 0.2s ease-in-out;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
-
 # 상단 네비게이션
 col_nav1, col_nav2, col_empty = st.columns([0.2, 0.2, 0.6])
 with col_nav1:
@@ -0,0 +1,77 @@
+import importlib
+import logging
+import sys
+import threading
+import time
+
+# ==========================================
+# 솔루션 앱 지연 로더 (pages/Service.py)
+# ==========================================
+# 선택된 앱 모듈만 import 하고, 첫 화면이 그려진 뒤 나머지 무거운 의존성은
+# 백그라운드 스레드에서 미리 import 해 둔다 (다음 선택 시 바로 뜨도록).
+
+logger = logging.getLogger(__name__)
+
+# selectbox 표시 이름 → 모듈 경로 (순서 = 메뉴 순서)
+APP_REGISTRY = {
+    "Wannabe Life Plan": "apps.Wannabe_Life_Plan",
+    "Wannabe Tax": "apps.Wannabe_Tax",
+    "Wannabe Golf": "apps.Wannabe_Golf",
+}
+# 앱 모듈이 공통으로 끌어오는 무거운 라이브러리
+HEAVY_MODULES = ("numpy", "plotly.graph_objects")
+# 백그라운드가 아니라 load_app 에서 먼저 import 하는 모듈.
+# plotly 는 sys.modules 에 pandas 가 있으면 초기화 중이어도 그대로 참조하므로, 어느 세션이든 그래프를
+# 그리기 전에 pandas import 가 끝나 있어야 한다 (Golf 앱 모듈을 미리 import 해도 pandas 가 따라온다).
+MAIN_PATH_MODULES = ("pandas",)
+
+_timings = {}  # 모듈 → 최초 import 소요 시간(초)
+_timings_lock = threading.Lock()
+_prewarm_started = False
+
+
+def _timed_import(module_name):
+    '''모듈 import (처음 로드될 때만 소요 시간 기록)'''
+    # 이미 로드된 경우에도 import_module을 거쳐야 다른 스레드가 import 중인 모듈을 기다린다
+    if module_name in sys.modules:
+        return importlib.import_module(module_name)
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    elapsed = time.perf_counter() - start
+    with _timings_lock:
+        _timings.setdefault(module_name, elapsed)
+    logger.info("cold import %s: %.1f ms", module_name, elapsed * 1000)
+    return module
+
+
+def load_app(name):
+    '''selectbox에서 고른 앱의 모듈을 반환 (필요할 때 import)'''
+    for module_name in MAIN_PATH_MODULES:
+        _timed_import(module_name)  # 프로세스 첫 세션만 실제로 import
+    return _timed_import(APP_REGISTRY[name])
+
+
+def prewarm(exclude=()):
+    '''나머지 의존성/앱 모듈을 백그라운드에서 미리 import (프로세스당 한 번)'''
+    global _prewarm_started
+    with _timings_lock:
+        if _prewarm_started:
+            return
+        _prewarm_started = True
+
+    targets = list(HEAVY_MODULES) + [m for name, m in APP_REGISTRY.items() if name not in exclude]
+
+    def run():
+        for module_name in targets:
+            try:
+                _timed_import(module_name)
+            except Exception:
+                logger.exception("prewarm import failed: %s", module_name)
+
+    threading.Thread(target=run, name="kfit-prewarm", daemon=True).start()
+
+
+def import_timings():
+    '''모듈별 최초 import 소요 시간 (ms)'''
+    with _timings_lock:
+        return {name: round(seconds * 1000, 1) for name, seconds in _timings.items()}
@@ -4,53 +4,20 @@ import numpy as np
 from datetime import datetime
 from utils import send_data_to_api, render_common_form 
 from models import GolfData
+from cache import RESULT_CACHE
+from profiling import stage
+import theme
+from kfit.engine.golf import TARGET_AGE, funding_status, project_golf_fund, result_message, what_if_grid
+
+COST_OPTIONS = [20, 30, 35, 40, 50, 70]   # 회당 비용 선택지 (만원)
+ROUNDS_OPTIONS = list(range(1, 11))       # What-if 표의 월 라운딩 횟수
 
 def app(input_col):
     # --------------------------------------------------------------------------
     # [UI 함수] 통일된 스타일 적용 및 함수 단순화
     # --------------------------------------------------------------------------
-    st.markdown("""
-        <style>
-        /* 메인 타이틀 색상을 Primary Color로 통일 (다크모드 대응) */
-        .responsive-title { 
-            font-size: clamp(1.8rem, 6vw, 4rem); 
-            font-weight: 900; 
-            color: var(--primary-color); /* 브랜드 색상 통일 */
-            white-space: nowrap; 
-            text-align: center; 
-            line-height: 1.2;
-            margin-bottom: 20px; 
-        }
-        /* 좌측 프레임 제목 스타일 (Life Plan과 통일) */
-        .sidebar-title { 
-            font-size: clamp(1.2rem, 13cqw, 2.5rem); 
-            font-weight: 900; 
-            color: var(--primary-color); 
-            text-align: center; 
-        } 
-        /* 입력 항목 캡션 및 라벨 폰트 크기 통일 */
-        .stSlider label p, .stNumberInput label p, .stSelectbox label p {
-            font-size: clamp(0.9rem, 1.2vw, 1.1rem) !important;
-            font-weight: 500;
-        }
-        /* 결과 텍스트 */
-        .result_unified { 
-            font-size: clamp(20px, 6vw, 40px); 
-            font-weight: 900; 
-            line-height: 1.3; 
-            letter-spacing: -1px; 
-            text-align: center; 
-        }
-        /* 서브헤더 (자산 현황) 중앙 정렬 스타일 */
-        .subheader_golf {
-            font-size: clamp(1.2rem, 4vw, 1.5rem);
-            font-weight: 700;
-            text-align: center; 
-            margin-top: 40px; 
-            margin-bottom: 10px;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    with stage("css"):
+        theme.apply("golf")  # assets/css/golf.css
     
     # 함수를 CSS 기반으로 단순화
     def display_title(text, type="title"):
@@ -77,36 +44,10 @@ def app(input_col):
         </div>
         """, unsafe_allow_html=True)
 
-    # --------------------------------------------------------------------------
-    # [로직] 핵심 계산 엔진 (원본 그대로 유지)
-    # --------------------------------------------------------------------------
-    def calculate_golf_life(current_age, retire_age, target_age, assets, saving, rounds, cost_per_round):
-        inflation_rate = 0.03
-        roi_rate = 0.04
-        balance = assets
-        bankruptcy_age = target_age + 1
-        status = "SAFE"
-        history = []
-        
-        for age in range(current_age, target_age + 5):
-            annual_income = (saving * 12) if age < retire_age else 0
-            years_passed = age - current_age
-            current_annual_cost = rounds * cost_per_round * 12
-            inflated_cost = current_annual_cost * ((1 + inflation_rate) ** years_passed)
-            
-            balance = balance * (1 + roi_rate) + annual_income - inflated_cost
-            history.append({"age": age, "balance": int(balance)})
-            
-            if balance < 0 and status == "SAFE":
-                bankruptcy_age = age
-                status = "DANGER"
-        
-        return bankruptcy_age, status, pd.DataFrame(history)
-
     # --------------------------------------------------------------------------
     # [UI] 입력창 배치 (왼쪽 프레임 input_col 로 이동)
     # --------------------------------------------------------------------------
-    with input_col:
+    with input_col, stage("inputs"):
         # Client Info 타이틀
         st.markdown("""
             <div class="sidebar-container">
@@ -119,7 +60,7 @@ def app(input_col):
         rounds = st.slider("월 라운딩 횟수 (회)", 0, 10, 4)
         cost = st.select_slider(
             "회당 비용 (그늘집 포함)",
-            options=[20, 30, 35, 40, 50, 70],
+            options=COST_OPTIONS,
             value=35,
         ) * 10000
         
@@ -129,7 +70,7 @@ def app(input_col):
         
         # [수정 완료] 억 단위로 변경
         assets_eok = st.slider("현재 골프 자금 (억)", 0.0, 5.0, 1.0, step=0.1, format="%.1f") 
-        assets = assets_eok * 100000000 # 원 단위로 환산하여 계산에 사용
+        assets = round(assets_eok * 100000000) # 원 단위로 환산하여 계산에 사용 (2.3억 → 229999999.99999997 같은 오차 제거)
         saving = st.slider("월 추가 저축액 (만원)", 0, 500, 0, step=10) * 10000
 
     # --------------------------------------------------------------------------
@@ -140,33 +81,30 @@ def app(input_col):
     st.divider()
 
     # 계산 실행
-    target_age = 85
-    bankruptcy_age, status, df_history = calculate_golf_life(current_age, retire_age, target_age, assets, saving, rounds, cost)
+    target_age = TARGET_AGE
+    golf_inputs = (current_age, retire_age, target_age, assets, saving, rounds, cost)
+    with stage("engine"):
+        projection = RESULT_CACHE.get_or_compute(
+            "golf", golf_inputs, lambda: project_golf_fund(*golf_inputs)
+        )
+    bankruptcy_age = projection.bankruptcy_age
 
     # 결과 표시
     display_title("📊 진단 결과", type="result") # CSS 기반 결과
     display_title(f"예상 골프 수명: {bankruptcy_age}세", type="result") # CSS 기반 결과
 
-    total_years = target_age - current_age
-    survive_years = bankruptcy_age - current_age
-    battery_percent = min(100, max(0, int((survive_years / total_years) * 100)))
+    battery_percent, status_code = funding_status(current_age, target_age, bankruptcy_age)
+    shortfall = projection.balance_at(target_age)
+    result_msg = result_message(status_code, target_age, shortfall)
 
     st.progress(battery_percent / 100)
 
-    if battery_percent >= 100:
+    if status_code == "SAFE":
         msg = f"완벽합니다!<br>{target_age}세까지 거뜬합니다!"
-        status_code = "SAFE"
-        result_msg = "자산 충분 (건강 리스크 대비 필요)"
-    elif battery_percent >= 70:
+    elif status_code == "WARNING":
         msg = f"아슬아슬합니다.<br>{bankruptcy_age}세에 바닥납니다."
-        status_code = "WARNING"
-        shortfall = df_history[df_history['age'] == target_age]['balance'].values[0]
-        result_msg = f"85세까지 {abs(shortfall):,.0f}원 부족"
     else:
         msg = f"위험합니다!<br>{bankruptcy_age}세부터 파산입니다."
-        status_code = "DANGER"
-        shortfall = df_history[df_history['age'] == target_age]['balance'].values[0]
-        result_msg = f"85세까지 {abs(shortfall):,.0f}원 부족"
 
     emphasized_box(msg, status=status_code)
 
@@ -175,6 +113,25 @@ def app(input_col):
     else:
         st.markdown(f"<div style='text-align: center; font-size: 1.2em; font-weight: bold; color: gray;'>📈 자금은 충분합니다. 이제 건강을 지키세요.</div>", unsafe_allow_html=True)
 
+    # --------------------------------------------------------------------------
+    # [What-if] 라운딩 횟수 × 회당 비용별 예상 골프 수명
+    # --------------------------------------------------------------------------
+    grid_inputs = (current_age, retire_age, target_age, assets, saving)
+    with stage("what_if"):
+        grid = RESULT_CACHE.get_or_compute(
+            "golf_grid", grid_inputs,
+            lambda: what_if_grid(*grid_inputs, ROUNDS_OPTIONS, [c * 10000 for c in COST_OPTIONS])
+        )
+    with st.expander("🔍 What-if: 라운딩 횟수 × 회당 비용별 골프 수명"):
+        df_grid = pd.DataFrame(
+            [[f"{target_age}세+" if age > target_age else f"{age}세" for age in row] for row in grid.tolist()],
+            index=[f"월 {r}회" for r in ROUNDS_OPTIONS],
+            columns=[f"{c}만원" for c in COST_OPTIONS],
+        )
+        with stage("what_if_table"):
+            st.dataframe(df_grid, width="stretch")
+        st.caption(f"현재 자산·저축 조건에서 자금이 바닥나는 나이 ({target_age}세+ = {target_age}세까지 유지)")
+
     # --------------------------------------------------------------------------
     # 공통 상담 폼 호출
     # --------------------------------------------------------------------------
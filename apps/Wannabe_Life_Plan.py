@@ -1,186 +1,160 @@
 import streamlit as st
-import pandas as pd
+from dataclasses import asdict
 import plotly.graph_objects as go
 from datetime import datetime
 from utils import send_data_to_api, render_common_form
 from models import LifeData
-import json 
+from kfit.engine.life import LifeInputs, PropertyLedger, WannabeEngine, annual_hobby_cost, simulate_scenarios
+from kfit.engine.portfolio import Portfolio
+from cache import RESULT_CACHE
+from charts import FigureTemplate, hline
+from profiling import stage
+import theme
+
+MC_PATHS = 10000  # 몬테카를로 시나리오 수
+MC_SEED = 2025    # 재실행마다 같은 분포가 나오도록 고정
+MAX_SCENARIOS = 4  # 비교용으로 고정할 수 있는 입력 변형 수 (현재 입력 제외)
+SCENARIO_COLORS = ('#2e7d32', '#1565c0', '#ef6c00', '#6a1b9a', '#00838f')  # 현재 입력 → 고정 순서
+
+# 그래프 스타일 (프로세스당 한 번 검증, 재실행마다 숫자 배열만 교체)
+TRAJECTORY_CHART = FigureTemplate(
+    "plotly_white",
+    traces=[
+        # 1) 부동산(순자산) - hover 텍스트 1, 2줄 담당
+        go.Scatter(
+            name='부동산(순자산)',
+            line=dict(color='#8d6e63', width=3, dash='dash'),
+            fill='tozeroy',
+            fillcolor='rgba(141, 110, 99, 0.1)',
+            hovertemplate="<b>%{x}세</b><br>부동산(순자산): %{y:.1f}억<extra></extra>"
+        ),
+        # 2) 현금 자산 - hover 텍스트 3줄 담당
+        go.Scatter(
+            name='현금 자산',
+            line=dict(color='#2e7d32', width=4),
+            mode='lines',
+            hovertemplate="현금 자산: %{y:.1f}억<extra></extra>"
+        ),
+    ],
+    # hover 시 점선 + unified 박스
+    height=400,
+    margin=dict(l=20, r=20, t=50, b=50),
+    legend=dict(
+        orientation="h",
+        yanchor="bottom", y=1.02,
+        xanchor="right", x=1
+    ),
+    dragmode=False,
+    xaxis=dict(
+        fixedrange=True,
+        title="경과나이 (세)",
+        showspikes=True,
+        spikemode="across",
+        spikethickness=1.5,
+        spikedash="dot",
+        spikecolor="rgba(120,120,120,0.8)",
+    ),
+    yaxis=dict(
+        fixedrange=True,
+        title="금액단위 (억원)",
+        showspikes=True,
+        spikemode="across",
+        spikethickness=1.5,
+        spikedash="dot",
+        spikecolor="rgba(120,120,120,0.4)",
+    ),
+    hovermode="x unified",
+    hoverlabel=dict(
+        bgcolor="rgba(255, 255, 255, 0.9)",
+        font_size=12,
+        font_color="black",
+    ),
+)
+
+MC_CHART = FigureTemplate(
+    "plotly_white",
+    traces=[
+        go.Scatter(
+            name='상위 10% (P90)',
+            line=dict(color='rgba(46, 125, 50, 0.4)', width=1),
+            hovertemplate="P90: %{y:.1f}억<extra></extra>"
+        ),
+        go.Scatter(
+            name='하위 10% (P10)',
+            line=dict(color='rgba(46, 125, 50, 0.4)', width=1),
+            fill='tonexty', fillcolor='rgba(46, 125, 50, 0.15)',
+            hovertemplate="P10: %{y:.1f}억<extra></extra>"
+        ),
+        go.Scatter(
+            name='중앙값 (P50)',
+            line=dict(color='#2e7d32', width=4),
+            hovertemplate="<b>%{x}세</b><br>P50: %{y:.1f}억<extra></extra>"
+        ),
+        go.Scatter(
+            name='고갈 확률(%)',
+            line=dict(color='#E53935', width=2, dash='dot'),
+            yaxis='y2',
+            hovertemplate="고갈 확률: %{y:.1f}%<extra></extra>"
+        ),
+    ],
+    height=400,
+    margin=dict(l=20, r=20, t=50, b=50),
+    legend=dict(
+        orientation="h",
+        yanchor="bottom", y=1.02,
+        xanchor="right", x=1
+    ),
+    dragmode=False,
+    xaxis=dict(fixedrange=True, title="경과나이 (세)"),
+    yaxis=dict(fixedrange=True, title="금액단위 (억원)"),
+    yaxis2=dict(
+        fixedrange=True, title="고갈 확률 (%)",
+        overlaying="y", side="right", range=[0, 100], showgrid=False,
+    ),
+    hovermode="x unified",
+)
+
+# 시나리오 비교: 현재 입력(실선) + 고정한 변형(점선)의 현금 자산 궤적
+SCENARIO_CHART = FigureTemplate(
+    "plotly_white",
+    traces=[
+        go.Scatter(
+            mode='lines',
+            line=dict(color=color, width=4 if i == 0 else 2, dash='solid' if i == 0 else 'dash'),
+            hovertemplate="%{fullData.name}: %{y:.1f}억<extra></extra>"
+        )
+        for i, color in enumerate(SCENARIO_COLORS)
+    ],
+    height=400,
+    margin=dict(l=20, r=20, t=50, b=50),
+    legend=dict(
+        orientation="h",
+        yanchor="bottom", y=1.02,
+        xanchor="right", x=1
+    ),
+    dragmode=False,
+    xaxis=dict(fixedrange=True, title="경과나이 (세)"),
+    yaxis=dict(fixedrange=True, title="현금 자산 (억원)"),
+    hovermode="x unified",
+)
 
 def app(input_col):
     # ==============================================================================
     # 0. 설정 및 CSS
     # ==============================================================================
-    st.markdown("""
-        <style>
-        /* 메인 타이틀 색상을 Primary Color로 통일 (다크모드 대응) */
-        .responsive-title { 
-            font-size: clamp(1.5rem, 5vw, 2.5rem); 
-            font-weight: 900; 
-            color: var(--primary-color);
-            white-space: nowrap; 
-            text-align: center; 
-            margin-bottom: 20px; 
-        }
-        .metric-container { 
-            display: flex; 
-            flex-direction: column; 
-            align-items: center; 
-            justify-content: center; 
-            background: white; 
-            border-radius: 15px; 
-            padding: 20px; 
-            box-shadow: 0 5px 15px rgba(0,0,0,0.08); 
-            border: 1px solid #e0e0e0; 
-            height: 140px; 
-        }
-        .metric-label { 
-            font-size: 1.2rem; 
-            color: #333333; 
-            font-weight: 800; 
-            margin-bottom: 10px; 
-            letter-spacing: -0.5px; 
-            white-space: nowrap; 
-        }
-        .metric-value { 
-            font-size: 2.2rem; 
-            font-weight: 900; 
-            color: #000000; 
-            line-height: 1; 
-        }
-        .val-safe { color: #2E8B57 !important; }
-        .val-warn { color: #FF8C00 !important; }
-        .val-danger { color: #E53935 !important; }
-        .val-blue { color: #1E88E5 !important; }
-        .val-purple { color: #8E24AA !important; }
-        
-        /* 자산 카드 스타일 */
-        .prop-card-sell { 
-            background-color: #e8f5e9 !important; 
-            border-left: 5px solid #2e7d32; 
-            padding: 10px; 
-            border-radius: 5px; 
-            margin-bottom: 8px; 
-        }
-        .prop-card-inherit { 
-            background-color: #e3f2fd !important; 
-            border-left: 5px solid #1565c0; 
-            padding: 10px; 
-            border-radius: 5px; 
-            margin-bottom: 8px; 
-        }
-        .prop-card-sell div, 
-        .prop-card-inherit div, 
-        .prop-title { 
-            color: #000000 !important; 
-            font-family: sans-serif; 
-        }
-        .prop-title { 
-            font-weight: bold; 
-            font-size: 14px; 
-        }
-        
-        /* Client Info 타이틀도 Primary Color로 통일 */
-        .sidebar-title { 
-            font-size: 2rem; 
-            font-weight: 900; 
-            color: var(--primary-color); 
-            text-align: center; 
-        } 
-        .sidebar-subtitle { 
-            font-size: 12px; 
-            color: #666; 
-            text-align: center; 
-            margin-bottom: 20px; 
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    with stage("css"):
+        theme.apply("life")  # assets/css/life.css
 
-    if 'properties' not in st.session_state:
-        st.session_state.properties = []
-
-    # ==============================================================================
-    # 1. 로직 엔진
-    # ==============================================================================
-    class WannabeEngine:
-        def __init__(self, current_age, retire_age, death_age):
-            self.current_age = current_age
-            self.retire_age = retire_age
-            self.death_age = death_age
-            self.period = death_age - current_age + 1
-
-        def run_simulation(
-            self, liquid_billions, monthly_save, monthly_spend,
-            inflation, return_rate, properties_list, annual_hobby_cost
-        ):
-            liquid = liquid_billions * 100000000
-            annual_save = monthly_save * 12 * 10000
-            base_annual_spend = (monthly_spend * 12 * 10000) + annual_hobby_cost
-
-            ages, liquid_history, real_estate_history = [], [], []
-            props = [p.copy() for p in properties_list]
-            current_liquid = liquid
-            shortfall_age = None
-            
-            for i in range(self.period):
-                age = self.current_age + i
-                ages.append(age)
-
-                # 1) 수익 반영
-                current_liquid = current_liquid * (1 + return_rate)
-
-                # 2) 저축/지출 반영
-                if age < self.retire_age:
-                    current_liquid += annual_save
-                else:
-                    current_liquid -= base_annual_spend * ((1 + inflation) ** i)
-                
-                # 3) 부동산 평가 + 매각 처리
-                current_re_net_val = 0
-                for p in props:
-                    if p.get('is_sold', False):
-                        continue
-
-                    years = age - self.current_age
-                    gross_val = (p['current_val'] * 100000000) * ((1 + inflation) ** years)
-                    loan_amt = p.get('loan', 0) * 100000000
-                    net_equity = max(0, gross_val - loan_amt)
-                    
-                    if p['strategy'] == '매각 (Sell)' and age == p['sell_age']:
-                        purchase_val = p['purchase_price'] * 100000000
-                        capital_gain = gross_val - purchase_val
-                        tax = capital_gain * 0.25 if capital_gain > 0 else 0
-                        current_liquid += (gross_val - loan_amt - tax)
-                        p['is_sold'] = True
-                        net_equity = 0
-
-                    current_re_net_val += net_equity
-                
-                if current_liquid < 0 and shortfall_age is None:
-                    shortfall_age = age
-
-                liquid_history.append(current_liquid / 100000000)
-                real_estate_history.append(current_re_net_val / 100000000)
-
-            return ages, liquid_history, real_estate_history, shortfall_age
-
-        def calculate_score(self, shortfall_age):
-            if shortfall_age is None:
-                return 100, "완벽 (Perfect)"
-
-            gap = self.death_age - shortfall_age
-            if gap <= 0:
-                return 90, "안정 (Stable)"
-            elif gap <= 5:
-                return 70, "주의 (Caution)"
-            elif gap <= 10:
-                return 50, "위험 (Danger)"
-            else:
-                return 30, "심각 (Critical)"
+    # 부동산 목록은 열 단위 배열로 보관 (이전 버전 세션의 dict 목록은 변환)
+    if not isinstance(st.session_state.get('properties'), Portfolio):
+        st.session_state.properties = Portfolio.from_records(st.session_state.get('properties') or [])
+    if 'scenarios' not in st.session_state:
+        st.session_state.scenarios = []  # [(이름, LifeInputs)] 비교용으로 고정한 입력
 
     # ==============================================================================
     # 2. [왼쪽 프레임] 입력 UI
     # ==============================================================================
-    with input_col:
+    with input_col, stage("inputs"):
         # Client Info 타이틀
         st.markdown("""
             <div class="sidebar-container">
@@ -234,15 +208,14 @@ def app(input_col):
                         warning_placeholder.error("⚠️ 자산명칭을 입력해주세요.")
                     else:
                         strat_code = "매각 (Sell)" if "매각" in p_strat else "상속 (Inherit)"
-                        st.session_state.properties.append({
-                            "name": p_name,
-                            "current_val": p_curr,
-                            "loan": p_loan,
-                            "purchase_price": p_buy,
-                            "strategy": strat_code,
-                            "sell_age": p_sell,
-                            "is_sold": False
-                        })
+                        st.session_state.properties.append(
+                            name=p_name,
+                            current_val=p_curr,
+                            loan=p_loan,
+                            purchase_price=p_buy,
+                            strategy=strat_code,
+                            sell_age=p_sell,
+                        )
                         warning_placeholder.empty()
                         st.rerun()
 
@@ -290,19 +263,70 @@ def app(input_col):
             c2.caption("회당 400만원")
             inflation = st.select_slider("물가상승률", ["안정(2%)", "보통(3.5%)", "심각(5%)"], value="보통(3.5%)")
 
+        # 2-5. 몬테카를로 (변동성 시나리오)
+        with st.expander("5. 몬테카를로 (Monte Carlo)", expanded=False):
+            mc_enabled = st.toggle("수익률·물가 변동성 반영", value=False)
+            c1, c2 = st.columns(2)
+            mc_return_vol = c1.slider("수익률 변동성(%)", 0, 30, 10, step=1, disabled=not mc_enabled) / 100
+            mc_inflation_vol = c2.slider("물가 변동성(%)", 0.0, 3.0, 1.0, step=0.5, disabled=not mc_enabled) / 100
+            st.caption(f"{MC_PATHS:,}개 시나리오를 동시에 계산합니다.")
+
+        # 2-6. 시나리오 비교
+        with st.expander("6. 시나리오 비교 (Compare)", expanded=False):
+            with st.form("scenario_form", clear_on_submit=True):
+                scenario_name = st.text_input("시나리오 이름", placeholder=f"예: 은퇴 {age_retire}세")
+                pin_clicked = st.form_submit_button(
+                    "📌 현재 입력 고정", width="stretch",
+                    disabled=len(st.session_state.scenarios) >= MAX_SCENARIOS,
+                )
+            st.caption(f"입력을 바꿔 가며 최대 {MAX_SCENARIOS}개까지 고정해 현재 입력과 함께 비교합니다.")
+
+            for i, (label, pinned) in enumerate(st.session_state.scenarios):
+                col_info, col_btn = st.columns([9, 1])
+                col_info.markdown(
+                    f"📌 **{label}** · 은퇴 {pinned.retire_age}세 · 저축 {pinned.monthly_save}만 · 부동산 {len(pinned.properties)}건"
+                )
+                if col_btn.button("X", key=f"scenario_del_{i}"):
+                    st.session_state.scenarios.pop(i)
+                    st.rerun()
+
     # ==============================================================================
     # 3. [오른쪽 프레임] 메인 화면
     # ==============================================================================
-    golf_map = {"안 함": 0, "월 1회": 12, "월 2회": 24, "월 4회": 48, "VIP": 100}
-    travel_map = {"안 함": 0, "연 1회": 1, "연 2회": 2, "분기별": 4}
-    annual_hobby_cost = (golf_map[golf_freq] * 400000) + (travel_map[travel_freq] * 4000000)
+    hobby_cost = annual_hobby_cost(golf_freq, travel_freq)
     inf_val = {"안정(2%)": 0.02, "보통(3.5%)": 0.035, "심각(5%)": 0.05}[inflation]
 
+    def current_inputs():
+        '''현재 입력값 스냅샷 (시나리오 고정/비교용, 부동산은 dict 사본)'''
+        return LifeInputs(
+            age_curr, age_retire, age_death, liquid_asset, monthly_save, monthly_spend,
+            inf_val, return_rate, hobby_cost, tuple(st.session_state.properties),
+        )
+
+    if pin_clicked:
+        label = scenario_name.strip() or f"시나리오 {len(st.session_state.scenarios) + 1}"
+        st.session_state.scenarios.append((label, current_inputs()))
+        st.rerun()
+
+    # 입력값이 같으면 캐시된 궤적/그래프를 재사용 (부동산 목록은 변경 시에만 다시 만드는 JSON 문자열)
+    sim_inputs = {
+        "ages": (age_curr, age_retire, age_death),
+        "liquid": liquid_asset, "save": monthly_save, "spend": monthly_spend,
+        "inflation": inf_val, "return": return_rate, "hobby": hobby_cost,
+        "properties": st.session_state.properties.to_json(),
+    }
     engine = WannabeEngine(age_curr, age_retire, age_death)
-    ages, liq_norm, re_norm, ob_norm = engine.run_simulation(
-        liquid_asset, monthly_save, monthly_spend,
-        inf_val, return_rate, st.session_state.properties, annual_hobby_cost
-    )
+
+    # 부동산별 기여 벡터는 세션에 보관: 자산을 추가/삭제하면 그 한 건만 계산해 합계에 반영
+    ledger = st.session_state.get("property_ledger")
+    if ledger is None or not ledger.matches(age_curr, age_death, inf_val):
+        ledger = st.session_state.property_ledger = PropertyLedger(age_curr, age_death, inf_val)
+
+    with stage("engine"):
+        ages, liq_norm, re_norm, ob_norm = RESULT_CACHE.get_or_compute("life", sim_inputs, lambda: engine.run_simulation(
+            liquid_asset, monthly_save, monthly_spend,
+            inf_val, return_rate, st.session_state.properties, hobby_cost, ledger=ledger
+        ))
     score, grade = engine.calculate_score(ob_norm)
 
     st.markdown("""
@@ -355,94 +379,38 @@ def app(input_col):
     st.write("")
     st.subheader("📈 자산별 생애 궤적")
     
-    fig = go.Figure()
-
-    # 1) 부동산(순자산) - hover 텍스트 1, 2줄 담당
-    fig.add_trace(go.Scatter(
-        x=ages,
-        y=re_norm,
-        name='부동산(순자산)',
-        line=dict(color='#8d6e63', width=3, dash='dash'),
-        fill='tozeroy',
-        fillcolor='rgba(141, 110, 99, 0.1)',
-        hovertemplate="<b>%{x}세</b><br>부동산(순자산): %{y:.1f}억<extra></extra>"
-    ))
-
-    # 2) 현금 자산 - hover 텍스트 3줄 담당
-    fig.add_trace(go.Scatter(
-        x=ages,
-        y=liq_norm,
-        name='현금 자산',
-        line=dict(color='#2e7d32', width=4),
-        mode='lines',
-        hovertemplate="현금 자산: %{y:.1f}억<extra></extra>"
-    ))
-
-    # 기준선 (0억)
-    fig.add_shape(
-        type="line",
-        x0=age_curr, y0=0,
-        x1=age_death, y1=0,
-        line=dict(color="red", width=1)
-    )
-
-    # 부동산 매각 시점 말풍선
-    for p in st.session_state.properties:
-        if "매각" in p['strategy'] and p['sell_age'] <= age_death:
-            idx = p['sell_age'] - age_curr
-            if 0 <= idx < len(liq_norm):
-                fig.add_annotation(
-                    x=p['sell_age'],
-                    y=liq_norm[idx],
-                    text=f"↗ {p['name']}",
-                    showarrow=True,
-                    arrowhead=2,
-                    ay=-30,
-                    font=dict(color="#2e7d32", size=10)
-                )
-
-    # hover 시 점선 + unified 박스 (원래 설정 유지했다면 여기에)
-    fig.update_layout(
-        template="plotly_white",
-        height=400,
-        margin=dict(l=20, r=20, t=50, b=50),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom", y=1.02,
-            xanchor="right", x=1
-        ),
-        dragmode=False,
-        xaxis=dict(
-            fixedrange=True,
-            title="경과나이 (세)",
-            showspikes=True,
-            spikemode="across",
-            spikethickness=1.5,
-            spikedash="dot",
-            spikecolor="rgba(120,120,120,0.8)",
-        ),
-        yaxis=dict(
-            fixedrange=True,
-            title="금액단위 (억원)",
-            showspikes=True,
-            spikemode="across",
-            spikethickness=1.5,
-            spikedash="dot",
-            spikecolor="rgba(120,120,120,0.4)",
-        ),
-        hovermode="x unified",
-        hoverlabel=dict(
-            bgcolor="rgba(255, 255, 255, 0.9)",
-            font_size=12,
-            font_color="black",
-        ),
-    )
+    def build_trajectory_figure():
+        # 부동산 매각 시점 말풍선
+        annotations = []
+        for p in st.session_state.properties:
+            if "매각" in p['strategy'] and p['sell_age'] <= age_death:
+                idx = p['sell_age'] - age_curr
+                if 0 <= idx < len(liq_norm):
+                    annotations.append(dict(
+                        x=p['sell_age'],
+                        y=liq_norm[idx],
+                        text=f"↗ {p['name']}",
+                        showarrow=True,
+                        arrowhead=2,
+                        ay=-30,
+                        font=dict(color="#2e7d32", size=10)
+                    ))
+
+        return TRAJECTORY_CHART.figure(
+            {"x": ages, "y": re_norm},
+            {"x": ages, "y": liq_norm},
+            shapes=[hline(0, age_curr, age_death, color="red", width=1)],  # 기준선 (0억)
+            annotations=annotations,
+        )
 
-    st.plotly_chart(
-        fig,
-        use_container_width=True,
-        config={'displayModeBar': False, 'scrollZoom': False}
-    )
+    with stage("figure"):
+        fig = RESULT_CACHE.get_or_compute("life_fig", sim_inputs, build_trajectory_figure)
+    with stage("chart"):
+        st.plotly_chart(
+            fig,
+            use_container_width=True,
+            config={'displayModeBar': False, 'scrollZoom': False}
+        )
 
     st.info("""
     💡 **그래프 해석 가이드**
@@ -455,6 +423,89 @@ def app(input_col):
        한 박스에 정리되어 표시됩니다.
     """)
 
+    # ==============================================================================
+    # 3-1. 몬테카를로 자산 분포 (옵션)
+    # ==============================================================================
+    if mc_enabled:
+        mc_inputs = dict(
+            sim_inputs, n_paths=MC_PATHS, seed=MC_SEED,
+            return_vol=mc_return_vol, inflation_vol=mc_inflation_vol,
+        )
+        with stage("mc_engine"):
+            mc = RESULT_CACHE.get_or_compute("life_mc", mc_inputs, lambda: engine.run_monte_carlo(
+                liquid_asset, monthly_save, monthly_spend,
+                inf_val, return_rate, st.session_state.properties, hobby_cost,
+                n_paths=MC_PATHS, return_vol=mc_return_vol,
+                inflation_vol=mc_inflation_vol, seed=MC_SEED
+            ))
+        depletion_pct = mc.depletion_prob[-1] * 100
+
+        st.subheader("🎲 몬테카를로 현금 자산 분포")
+        st.markdown(f"**{age_death}세까지 현금이 고갈될 확률: {depletion_pct:.1f}%**")
+
+        def build_mc_figure():
+            return MC_CHART.figure(
+                {"x": mc.ages, "y": mc.p90},
+                {"x": mc.ages, "y": mc.p10},
+                {"x": mc.ages, "y": mc.p50},
+                {"x": mc.ages, "y": mc.depletion_prob * 100},
+                shapes=[hline(0, age_curr, age_death, color="red", width=1)],
+            )
+
+        with stage("mc_figure"):
+            fig_mc = RESULT_CACHE.get_or_compute("life_mc_fig", mc_inputs, build_mc_figure)
+        with stage("mc_chart"):
+            st.plotly_chart(
+                fig_mc,
+                use_container_width=True,
+                config={'displayModeBar': False, 'scrollZoom': False}
+            )
+        st.caption(f"음영: {MC_PATHS:,}개 시나리오 중 하위 10% ~ 상위 10% 구간 / 점선: 해당 나이까지 현금이 고갈된 시나리오 비율")
+
+    # ==============================================================================
+    # 3-2. 시나리오 비교 (현재 입력 + 고정한 변형)
+    # ==============================================================================
+    if st.session_state.scenarios:
+        labels = ["현재 입력"] + [label for label, _ in st.session_state.scenarios]
+        variants = [current_inputs()] + [pinned for _, pinned in st.session_state.scenarios]
+
+        with stage("scenario_engine"):
+            # 변형별로 캐시: 처음 보는 변형만 모아 엔진을 한 번 호출
+            projections = RESULT_CACHE.get_many_or_compute(
+                "life_scenario", [asdict(v) for v in variants],
+                lambda missing: simulate_scenarios([LifeInputs(**m) for m in missing]),
+            )
+
+        st.subheader("🔀 시나리오 비교")
+        with stage("scenario_figure"):
+            fig_scenario = SCENARIO_CHART.figure(
+                *({"x": p.ages, "y": p.liquid, "name": label} for label, p in zip(labels, projections)),
+                shapes=[hline(
+                    0, min(v.current_age for v in variants), max(v.death_age for v in variants),
+                    color="red", width=1,
+                )],
+            )
+        with stage("scenario_chart"):
+            st.plotly_chart(
+                fig_scenario,
+                use_container_width=True,
+                config={'displayModeBar': False, 'scrollZoom': False}
+            )
+            st.dataframe(
+                {
+                    "시나리오": labels,
+                    "은퇴": [f"{v.retire_age}세" for v in variants],
+                    "월 저축(만원)": [v.monthly_save for v in variants],
+                    "월 생활비(만원)": [v.monthly_spend for v in variants],
+                    "수익률": [f"{v.return_rate * 100:.0f}%" for v in variants],
+                    "부동산": [f"{len(v.properties)}건" for v in variants],
+                    "점수": [p.score for p in projections],
+                    "현금 고갈": [f"{p.shortfall_age}세" if p.shortfall_age else "Safe" for p in projections],
+                },
+                hide_index=True, width="stretch",
+            )
+
+
 
 
     # ==============================================================================
@@ -548,7 +599,7 @@ def app(input_col):
     # ==============================================================================
     props_str = ", ".join([p['name'] for p in st.session_state.properties]) if st.session_state.properties else "없음"
     re_asset = sum([p['current_val'] for p in st.session_state.properties])
-    props_json = json.dumps(st.session_state.properties, ensure_ascii=False)
+    props_json = st.session_state.properties.to_json()
     inflation_label = inflation
 
     simulation_data = {
@@ -1,75 +1,94 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 import requests
 import json
 from utils import send_data_to_api, render_common_form # [NEW]
 from models import TaxData  # 모델 사용
+from cache import RESULT_CACHE
+from charts import FigureTemplate, vline
+from profiling import stage
+import theme
+from kfit.engine.tax import BASIC_DEDUCTION, inheritance_tax, optimize_spouse_share, project_estates, spouse_deduction as calc_spouse_deduction
+
+# 그래프 스타일 (프로세스당 한 번 검증, 재실행마다 숫자 배열만 교체)
+ESTATE_CHART = FigureTemplate(
+    "plotly_dark",
+    traces=[
+        # 1. 배경: 총 자산
+        go.Scatter(
+            mode='lines',
+            name='총 자산',
+            line=dict(width=1, color='rgba(160, 160, 160, 0.5)'),
+            fill='tozeroy',
+            fillcolor='rgba(128, 128, 128, 0.3)',
+            hovertemplate="<b>%{x}년 후</b><br>총자산: %{y:.1f}억<extra></extra>"
+        ),
+        # 2. 기준선: 금융자산 (보유 현금)
+        go.Scatter(
+            mode='lines', name='보유 현금',
+            line=dict(width=4, color='#00BFFF', dash='solid'),
+            hovertemplate='보유현금: %{y:.1f}억<extra></extra>'
+        ),
+        # 3. 막대: 상속세
+        go.Bar(
+            name='예상 상속세',
+            marker_color='#EF4444', opacity=0.9,
+            hovertemplate='예상상속세: %{y:.1f}억<extra></extra>'
+        ),
+    ],
+    height=550,
+    hovermode="x unified",
+    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+    margin=dict(t=120, b=50, l=20, r=20),
+    xaxis=dict(title="경과 기간(년)", fixedrange=True, tickmode='linear', tick0=0, dtick=5, showgrid=True, gridcolor='#374151'),
+    yaxis=dict(title="금액 단위(억원)", fixedrange=True, tickformat=".1f", showgrid=True, gridcolor='#374151'),
+    dragmode=False,
+)
+
+SHARE_CHART = FigureTemplate(
+    "plotly_dark",
+    traces=[
+        go.Scatter(
+            mode='lines', name='1차 상속세',
+            line=dict(width=2, color='#00BFFF'),
+            hovertemplate='1차: %{y:.1f}억<extra></extra>'
+        ),
+        go.Scatter(
+            mode='lines', name='2차 상속세',
+            line=dict(width=2, color='#EF4444'),
+            hovertemplate='2차: %{y:.1f}억<extra></extra>'
+        ),
+        go.Scatter(
+            mode='lines', name='합계',
+            line=dict(width=4, color='#FFFF00'),
+            hovertemplate='합계: %{y:.1f}억<extra></extra>'
+        ),
+        go.Scatter(
+            mode='markers', name='최소',
+            marker=dict(size=14, color='#4CAF50', line=dict(width=2, color='white')),
+            hovertemplate='최소: %{x:.1f}%<extra></extra>'
+        ),
+    ],
+    height=450,
+    hovermode="x unified",
+    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+    margin=dict(t=80, b=50, l=20, r=20),
+    xaxis=dict(title="배우자 상속 비율(%)", fixedrange=True, ticksuffix="%", showgrid=True, gridcolor='#374151'),
+    yaxis=dict(title="금액 단위(억원)", fixedrange=True, tickformat=".1f", showgrid=True, gridcolor='#374151'),
+    dragmode=False,
+)
 
 def app(input_col):
     # ==========================================
     # CSS 스타일링 (원본 100% 유지)
     # ==========================================
-    st.markdown("""
-    <style>
-    .main { background-color: #0E1117 !important; color: #FAFAFA !important; }
-    html, body, [class*="css"], .stMarkdown, .stButton, .stNumberInput, .stSlider, .stTextInput, .stTextArea {
-        font-family: 'Helvetica Neue', sans-serif;
-        font-size: 16px !important;
-    }
-    .title-container { width: 100%; text-align: center; margin-bottom: 20px; padding: 10px 0; }
-    .responsive-title {
-        font-weight: 900; color: #4CAF50; white-space: nowrap;
-        font-size: clamp(1.8rem, 6vw, 3.5rem); line-height: 1.2;
-    }
-    .sidebar-container { width: 100%; margin-bottom: 10px; text-align: center; }
-    .responsive-sidebar-title {
-        font-weight: 800; color: #4CAF50; white-space: nowrap;
-        font-size: clamp(1.2rem, 13cqw, 2rem); 
-        line-height: 1.2;
-    }
-    .big-number-box {
-        background-color: #1F2937; padding: 2vw; border-radius: 12px;
-        border: 1px solid #374151; text-align: center; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.3);
-        margin-bottom: 10px; min-height: 140px;
-        display: flex; flex-direction: column; justify-content: center; align-items: center;
-        container-type: inline-size; 
-    }
-    .big-number-label { color: #E5E7EB; font-weight: 600; white-space: nowrap; font-size: clamp(0.8rem, 5cqw, 1.2rem); margin-bottom: 5px; }
-    .big-number-value { color: #FAFAFA; font-weight: 800; line-height: 1.1; white-space: nowrap; font-size: clamp(1.2rem, 15cqw, 3.5rem); }
-    .sub-text-wrapper { white-space: nowrap; overflow: hidden; text-overflow: ellipsis; width: 100%; }
-    .sub-text-positive { color: #4ADE80; font-weight: bold; font-size: clamp(0.7rem, 4cqw, 1rem); margin-top: 5px; }
-    .sub-text-negative { color: #FF7F50; font-weight: bold; font-size: clamp(0.7rem, 4cqw, 1rem); margin-top: 5px; }
-    .sub-text-highlight { color: #FFFF00; font-weight: 800; text-shadow: 0px 0px 5px rgba(255, 255, 0, 0.3); font-size: clamp(0.8rem, 5cqw, 1.3rem); margin-top: 5px; }
-    .val-positive { color: #34D399; } 
-    .val-negative { color: #F87171; } 
-    .warning-box { background-color: #450a0a; color: #fca5a5; padding: 20px; border-radius: 12px; border-left: 8px solid #ef4444; margin-top: 20px; line-height: 1.5; font-size: clamp(0.9rem, 1.5vw, 1.2rem); }
-    .safe-box { background-color: #064e3b; color: #6ee7b7; padding: 20px; border-radius: 12px; border-left: 8px solid #10b981; margin-top: 20px; line-height: 1.5; font-size: clamp(0.9rem, 1.5vw, 1.2rem); }
-    .stSlider label p, .stNumberInput label p, .stToggle label p, .stTextInput label p, .stTextArea label p {
-        font-size: clamp(0.8rem, 1.2vw, 1.1rem) !important;
-        white-space: nowrap !important;
-    }
-    .stCheckbox label p {
-        font-size: clamp(11px, 4.5cqw, 14px) !important;
-        white-space: nowrap !important; 
-        width: 100%;
-        overflow: visible;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    with stage("css"):
+        theme.apply("tax")  # assets/css/tax.css
 
     # ==========================================
     # 함수 정의
     # ==========================================
-    def calculate_tax(tax_base):
-        if tax_base <= 0: return 0
-        elif tax_base <= 100000000: return tax_base * 0.1
-        elif tax_base <= 500000000: return tax_base * 0.2 - 10000000
-        elif tax_base <= 1000000000: return tax_base * 0.3 - 60000000
-        elif tax_base <= 3000000000: return tax_base * 0.4 - 160000000
-        else: return tax_base * 0.5 - 460000000
-
     def format_krw_display(value):
         eok = value / 100000000
         return f"{eok:,.1f}억"
@@ -77,7 +96,7 @@ def app(input_col):
     # ==========================================
     # [왼쪽 프레임] 입력창 구성 (상담폼 제거됨)
     # ==========================================
-    with input_col:
+    with input_col, stage("inputs"):
         st.markdown("""
             <div class="sidebar-container">
                 <div class="responsive-sidebar-title">🧮 Client Info</div>
@@ -104,7 +123,8 @@ def app(input_col):
             slider_years_label = "시뮬레이션 기간 (본인 생존 가정)"
             pct_disabled = True
             
-        spouse_share_pct = st.slider("배우자 상속 비율 (%)", 0, 100, 60, disabled=pct_disabled)
+        optimize_share = st.toggle("🔎 세금 최소 비율 자동 적용", value=False, disabled=pct_disabled)
+        spouse_share_pct = st.slider("배우자 상속 비율 (%)", 0, 100, 60, disabled=pct_disabled or optimize_share)
         sim_years = st.slider(slider_years_label, 0, 40, 20)
         
         st.markdown("---")
@@ -119,25 +139,38 @@ def app(input_col):
     # ==========================================
     # 메인 로직 및 계산
     # ==========================================
-    basic_deduction = 500000000 
+    basic_deduction = BASIC_DEDUCTION
     spouse_deduction = 0
 
     if not has_spouse:
         spouse_share_pct = 0 
 
+    # 배우자 상속 비율 0~100% 전체에 대한 (1차 + 2차) 상속세 곡선
+    share_curve = None
     if has_spouse:
-        actual_spouse_take = total_estate * (spouse_share_pct / 100)
-        spouse_deduction = min(max(actual_spouse_take, 500000000), 3000000000)
+        curve_inputs = {
+            "estate": (real_estate_billions, financial_billions),
+            "years": sim_years,
+            "growth": (inflation_real_estate, inflation_financial),
+        }
+        with stage("optimizer"):
+            share_curve = RESULT_CACHE.get_or_compute(
+                "tax_share", curve_inputs,
+                lambda: optimize_spouse_share(
+                    real_estate_billions * 100000000, financial_billions * 100000000,
+                    sim_years, inflation_real_estate, inflation_financial,
+                ),
+            )
+        if optimize_share:
+            spouse_share_pct = share_curve.best_share_pct
+
+    if has_spouse:
+        spouse_deduction = float(calc_spouse_deduction(total_estate, spouse_share_pct / 100))
 
     tax_base_1_now = total_estate - basic_deduction - spouse_deduction
-    tax_1_now = calculate_tax(tax_base_1_now)
+    tax_1_now = inheritance_tax(tax_base_1_now)
 
     years = list(range(sim_years + 1))
-    assets_re = []
-    assets_fin = []
-    taxes = []
-    crisis_year = None
-    shortage_amount = 0
 
     if has_spouse:
         simulation_title = "배우자 기준 2차 상속세 (Liquidity Death Cross)"
@@ -155,21 +188,27 @@ def app(input_col):
         curr_fin_val = financial_billions * 100000000
         deduction_future = 500000000 
 
-    for y in years:
-        curr_total = curr_re_val + curr_fin_val
-        curr_base = curr_total - deduction_future
-        curr_tax = calculate_tax(curr_base)
-        
-        assets_re.append(curr_re_val)
-        assets_fin.append(curr_fin_val)
-        taxes.append(curr_tax)
-        
-        if curr_tax > curr_fin_val and crisis_year is None:
-            crisis_year = y
-            shortage_amount = curr_tax - curr_fin_val
-        
-        curr_re_val *= (1 + inflation_real_estate)
-        curr_fin_val *= (1 + inflation_financial)
+    def simulate_years(curr_re_val, curr_fin_val):
+        # 연도별 자산/상속세와 위기 연차를 벡터로 한 번에 계산 (kfit.engine.tax)
+        projection = project_estates(
+            curr_re_val, curr_fin_val, deduction_future, sim_years,
+            inflation_real_estate, inflation_financial,
+        )
+        crisis_year = int(projection.crisis_year) if projection.crisis_year >= 0 else None
+        return (projection.real_estate, projection.financial, projection.taxes,
+                crisis_year, float(projection.shortage))
+
+    # 입력값이 같으면 캐시된 연도별 결과/그래프를 재사용
+    tax_inputs = {
+        "start": (curr_re_val, curr_fin_val),
+        "deduction": deduction_future,
+        "years": sim_years,
+        "growth": (inflation_real_estate, inflation_financial),
+    }
+    with stage("engine"):
+        assets_re, assets_fin, taxes, crisis_year, shortage_amount = RESULT_CACHE.get_or_compute(
+            "tax", tax_inputs, lambda: simulate_years(curr_re_val, curr_fin_val)
+        )
 
     final_tax_simulated = taxes[-1]
     final_financial_simulated = assets_fin[-1]
@@ -285,69 +324,34 @@ def app(input_col):
     st.markdown(f"### 🎯 {simulation_title}")
     st.caption(simulation_desc)
 
-    df_chart = pd.DataFrame({
-        "Year": years,
-        "RealEstate": [x / 100000000 for x in assets_re],
-        "Financial": [x / 100000000 for x in assets_fin],
-        "Tax": [x / 100000000 for x in taxes]
-    })
-
-    fig = go.Figure()
-
-# 1. 배경: 총 자산
-    fig.add_trace(go.Scatter(
-        x=df_chart["Year"],
-        y=df_chart["RealEstate"] + df_chart["Financial"],
-        mode='lines',
-        name='총 자산',
-        line=dict(width=1, color='rgba(160, 160, 160, 0.5)'),
-        fill='tozeroy',
-        fillcolor='rgba(128, 128, 128, 0.3)',
-        # 🔧 여기 수정: hoverinfo 대신 hovertemplate 사용
-        hovertemplate="<b>%{x}년 후</b><br>총자산: %{y:.1f}억<extra></extra>"
-    ))
-
-
-    # 2. 기준선: 금융자산 (보유 현금)
-    fig.add_trace(go.Scatter(
-        x=df_chart["Year"], y=df_chart["Financial"],
-        mode='lines', name='보유 현금',
-        line=dict(width=4, color='#00BFFF', dash='solid'),
-        hovertemplate='보유현금: %{y:.1f}억<extra></extra>'
-    ))
-
-    # 3. 막대: 상속세
-    fig.add_trace(go.Bar(
-        x=df_chart["Year"], y=df_chart["Tax"],
-        name='예상 상속세',
-        marker_color='#EF4444', opacity=0.9,
-        hovertemplate='예상상속세: %{y:.1f}억<extra></extra>'
-    ))
-
-    # 4. 핀포인트 텍스트
-    if liquidity_crisis and crisis_year is not None:
-        crisis_tax_val = df_chart.loc[crisis_year, "Tax"]
-        fig.add_annotation(
-            x=crisis_year,
-            y=crisis_tax_val,
-            text=f"🚨 <b>{crisis_year}년후 부족!</b>",
-            showarrow=True, arrowhead=2, arrowsize=2.0, arrowwidth=2, arrowcolor="#FFFF00",
-            ax=0, ay=-40, bgcolor="#0054FF", bordercolor="#FFFF00",
-            font=dict(size=15, color="white", family="sans-serif")
+    def build_tax_figure():
+        real_estate = assets_re / 100000000
+        financial = assets_fin / 100000000
+        tax = taxes / 100000000
+
+        # 4. 핀포인트 텍스트
+        annotations = []
+        if liquidity_crisis and crisis_year is not None:
+            annotations.append(dict(
+                x=crisis_year,
+                y=tax[crisis_year],
+                text=f"🚨 <b>{crisis_year}년후 부족!</b>",
+                showarrow=True, arrowhead=2, arrowsize=2.0, arrowwidth=2, arrowcolor="#FFFF00",
+                ax=0, ay=-40, bgcolor="#0054FF", bordercolor="#FFFF00",
+                font=dict(size=15, color="white", family="sans-serif")
+            ))
+
+        return ESTATE_CHART.figure(
+            {"x": years, "y": real_estate + financial},
+            {"x": years, "y": financial},
+            {"x": years, "y": tax},
+            annotations=annotations,
         )
 
-    # 차트 레이아웃
-    fig.update_layout(
-        template="plotly_dark", height=550,
-        hovermode="x unified",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        margin=dict(t=120, b=50, l=20, r=20),
-        xaxis=dict(title="경과 기간(년)", fixedrange=True, tickmode='linear', tick0=0, dtick=5, showgrid=True, gridcolor='#374151'),
-        yaxis=dict(title="금액 단위(억원)", fixedrange=True, tickformat=".1f", showgrid=True, gridcolor='#374151'),
-        dragmode=False,
-    )
-
-    st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+    with stage("figure"):
+        fig = RESULT_CACHE.get_or_compute("tax_fig", tax_inputs, build_tax_figure)
+    with stage("chart"):
+        st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
 
     st.info("""
     💡 **그래프 해석 가이드**:
@@ -356,6 +360,33 @@ def app(input_col):
     3. **빨간 막대**: 자녀가 낼 세금 (빨간 막대가 파란 선을 넘으면 위험)
     """)
 
+    # ==========================================
+    # 8. 배우자 상속 비율별 총 상속세 곡선
+    # ==========================================
+    if share_curve is not None:
+        st.markdown("<br>", unsafe_allow_html=True)
+        st.markdown("### 📉 배우자 상속 비율별 총 상속세 (1차 + 2차)")
+        st.caption(
+            f"※ 최소 지점: 배우자 {share_curve.best_share_pct:.1f}% → 총 {format_krw_display(share_curve.best_total_tax)}"
+            f" (현재 {spouse_share_pct:.1f}% → 총 {format_krw_display(tax_1_now + final_tax_simulated)})"
+        )
+
+        def build_share_figure():
+            return SHARE_CHART.figure(
+                {"x": share_curve.shares_pct, "y": share_curve.first_tax / 100000000},
+                {"x": share_curve.shares_pct, "y": share_curve.second_tax / 100000000},
+                {"x": share_curve.shares_pct, "y": share_curve.total_tax / 100000000},
+                {"x": [share_curve.best_share_pct], "y": [share_curve.best_total_tax / 100000000]},
+                shapes=[vline(spouse_share_pct, width=1, dash="dash", color="gray")],
+            )
+
+        with stage("share_figure"):
+            share_fig = RESULT_CACHE.get_or_compute(
+                "tax_share_fig", dict(curve_inputs, current=spouse_share_pct), build_share_figure
+            )
+        with stage("share_chart"):
+            st.plotly_chart(share_fig, use_container_width=True, config={'displayModeBar': False})
+
     # --------------------------------------------------------------------------
     # [수정됨] 공통 상담 폼 호출 + 진단 결과 데이터 추가 저장
     # --------------------------------------------------------------------------
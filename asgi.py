@@ -0,0 +1,21 @@
+'''
+ASGI 진입점: Streamlit 앱 + 이미지 변형본 라우트
+
+    uvicorn asgi:app --host 0.0.0.0 --port 8501
+
+streamlit run Home.py 와 같은 앱이고, /img/<파일> 을 추가로 서빙한다
+(메모리 바이트 캐시 + 1년 immutable 캐시 헤더 → 재방문 시 이미지 요청 자체가 없음).
+streamlit run 으로 띄우면 이미지는 app/static/img/ 에서 ETag 재검증으로 서빙된다.
+'''
+import os
+
+os.environ.setdefault("KFIT_IMAGE_URL", "/img/")  # images 모듈이 읽기 전에 설정
+
+import streamlit as st  # noqa: E402
+
+import images  # noqa: E402
+import utils  # noqa: E402
+
+images.build_all()  # 첫 요청 전에 변형본/manifest 준비
+utils.start_outbox_worker()  # 첫 세션을 기다리지 않고 남은 대기열부터 전송
+app = st.App("Home.py", routes=[images.route()])
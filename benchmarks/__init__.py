@@ -0,0 +1,10 @@
+'''
+KFIT 성능 벤치마크
+
+    python -m benchmarks.run                                  # 전체 실행 → benchmarks/results/latest.json
+    python -m benchmarks.run --only engines --save baseline   # 엔진만, 기준값으로 저장
+    python -m benchmarks.run --compare benchmarks/results/baseline.json --threshold 20
+
+engines: 계산 엔진(kfit.engine) 마이크로 벤치마크 (입력 격자별)
+pages:   AppTest로 Service 페이지의 각 앱 스크립트 전체 실행 시간
+'''
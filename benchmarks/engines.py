@@ -0,0 +1,83 @@
+import numpy as np
+
+from kfit.engine import golf, life, tax
+
+# 입력 격자 (화면 슬라이더 범위 기준)
+AGES = (30, 55, 80)
+PROPERTY_COUNTS = (0, 10, 50)
+SIM_YEARS = (0, 20, 40)
+BATCH_ROWS = 10000
+MC_PATHS = 10000
+
+
+def _properties(n, current_age):
+    '''절반은 매각, 절반은 보유하는 부동산 목록'''
+    return [
+        {
+            "name": f"p{i}", "current_val": 5 + i % 7, "loan": i % 3, "purchase_price": 3 + i % 5,
+            "strategy": life.SELL_STRATEGY if i % 2 else "보유 (Hold)",
+            "sell_age": current_age + 5 + i % 20, "is_sold": False,
+        }
+        for i in range(n)
+    ]
+
+
+def _life_profiles(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    current = rng.integers(30, 81, rows)
+    return np.column_stack([
+        current, np.maximum(current, rng.integers(50, 81, rows)), rng.integers(85, 101, rows),
+        rng.uniform(0, 30, rows), rng.integers(0, 500, rows), rng.integers(100, 800, rows),
+        rng.choice([0.02, 0.035, 0.05], rows), rng.uniform(0, 0.1, rows), rng.integers(0, 5, rows) * 4800000,
+    ])
+
+
+def cases():
+    '''(이름, 인자 없는 함수) 목록'''
+    for age in AGES:
+        for n_props in PROPERTY_COUNTS:
+            engine = life.WannabeEngine(age, max(age, 60), 100)
+            props = _properties(n_props, age)
+            yield (f"life.run_simulation[age={age},props={n_props}]",
+                   lambda e=engine, p=props: e.run_simulation(5, 300, 400, 0.03, 0.04, p, 9600000))
+
+    engine = life.WannabeEngine(30, 60, 100)
+    props = _properties(10, 30)
+    yield (f"life.run_monte_carlo[paths={MC_PATHS},years=71]",
+           lambda: engine.run_monte_carlo(5, 300, 400, 0.03, 0.04, props, 9600000, n_paths=MC_PATHS, seed=1))
+
+    # 시나리오 비교: 은퇴 나이만 다른 변형 5개 (부동산 10건)
+    variants = [
+        life.LifeInputs(55, retire, 100, 5, 300, 400, 0.03, 0.04, 9600000, tuple(_properties(10, 55)))
+        for retire in (58, 60, 62, 65, 68)
+    ]
+    yield f"life.simulate_scenarios[variants={len(variants)},props=10]", lambda: life.simulate_scenarios(variants)
+
+    profiles = _life_profiles(BATCH_ROWS)
+    yield f"life.run_batch[rows={BATCH_ROWS}]", lambda: life.run_batch(profiles)
+
+    for years in SIM_YEARS:
+        yield (f"tax.project_estates[years={years}]",
+               lambda y=years: tax.project_estates(2.4e9, 8e8, tax.BASIC_DEDUCTION, y, 0.05, 0.02))
+    yield "tax.optimize_spouse_share[step=0.5,years=40]", lambda: tax.optimize_spouse_share(3e9, 1e9, 40, 0.05, 0.02)
+
+    rng = np.random.default_rng(1)
+    estates = dict(
+        real_estate=rng.uniform(0, 8e9, BATCH_ROWS), financial=rng.uniform(0, 4e9, BATCH_ROWS),
+        has_spouse=rng.random(BATCH_ROWS) < 0.5, spouse_share=rng.random(BATCH_ROWS),
+        sim_years=rng.integers(0, 41, BATCH_ROWS),
+        growth_re=rng.integers(0, 11, BATCH_ROWS) / 100, growth_fin=rng.integers(0, 11, BATCH_ROWS) / 100,
+    )
+    yield f"tax.inheritance_scenarios[rows={BATCH_ROWS}]", lambda: tax.inheritance_scenarios(**estates)
+
+    for age in AGES:
+        yield (f"golf.project_golf_fund[age={age}]",
+               lambda a=age: golf.project_golf_fund(a, max(a, 60), golf.TARGET_AGE, 1e8, 0, 4, 350000))
+    yield ("golf.what_if_grid[10x6]",
+           lambda: golf.what_if_grid(54, 60, golf.TARGET_AGE, 1e8, 0, range(1, 11), [c * 10000 for c in (20, 30, 35, 40, 50, 70)]))
+
+    current = rng.integers(30, 81, BATCH_ROWS)
+    golfers = (current, rng.integers(50, 76, BATCH_ROWS), rng.uniform(0, 5e8, BATCH_ROWS),
+               rng.integers(0, 50, BATCH_ROWS) * 1e5, rng.integers(0, 11, BATCH_ROWS),
+               rng.choice([20, 30, 35, 40, 50, 70], BATCH_ROWS) * 1e4)
+    yield f"golf.project_golf_batch[rows={BATCH_ROWS}]", lambda: golf.project_golf_batch(*golfers)
@@ -0,0 +1,69 @@
+import os
+import time
+
+from benchmarks.timing import summarize
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGE_TIMEOUT = 120
+
+
+def _session():
+    '''Home → Service 페이지까지 띄운 AppTest 세션'''
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file(os.path.join(ROOT, "Home.py"), default_timeout=PAGE_TIMEOUT)
+    at.run()
+    at.switch_page("pages/Service.py")
+    at.run()
+    return at
+
+
+def _timed(action):
+    start = time.perf_counter()
+    at = action()
+    elapsed = (time.perf_counter() - start) * 1000
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return elapsed
+
+
+def _changed_values(slider, count):
+    '''슬라이더의 현재 값과 다른 값 count개 (매번 캐시를 비껴가도록)'''
+    values, value = [], slider.min
+    while len(values) < count and value <= slider.max:
+        if value != slider.value:
+            values.append(type(slider.value)(value))
+        value += slider.step
+    return values
+
+
+def cases(repeat=5):
+    '''
+    앱별 (이름, 측정 결과) 목록
+    render:  새 세션에서 앱을 처음 고른 뒤 전체 스크립트 실행
+    rerun:   같은 입력으로 재실행 (결과/그래프 캐시 적중)
+    changed: 첫 번째 슬라이더를 바꿔 재실행 (캐시 미스, 엔진+그래프 재계산)
+    '''
+    from app_loader import APP_REGISTRY
+
+    cwd = os.getcwd()
+    os.chdir(ROOT)  # 앱이 상대 경로로 배경 이미지 등을 읽는다
+    try:
+        # 모듈 import 등 프로세스당 1회 비용은 제외
+        for name in APP_REGISTRY:
+            _session().selectbox[0].select(name).run()
+
+        for name in APP_REGISTRY:
+            key = name.replace(" ", "_")
+            render = []
+            for _ in range(repeat):
+                at = _session()
+                render.append(_timed(lambda: at.selectbox[0].select(name).run()))
+            yield f"page.{key}.render", summarize(render)
+
+            yield f"page.{key}.rerun", summarize([_timed(at.run) for _ in range(repeat)])
+
+            slider = at.slider[0]
+            changed = [_timed(lambda v=v: at.slider[0].set_value(v).run()) for v in _changed_values(slider, repeat)]
+            yield f"page.{key}.changed", summarize(changed)
+    finally:
+        os.chdir(cwd)
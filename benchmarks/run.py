@@ -0,0 +1,72 @@
+import argparse
+import os
+import sys
+
+from benchmarks import engines, pages
+from benchmarks.timing import compare, load, measure, save
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+DEFAULT_THRESHOLD = 15.0  # 중앙값이 이 비율(%) 이상 느려지면 회귀로 판정
+
+
+def run(only=None, repeat=5, pattern=None):
+    results = {}
+    if only in (None, "engines"):
+        for name, fn in engines.cases():
+            if pattern and pattern not in name:
+                continue
+            results[name] = measure(fn, repeat=repeat)
+            print(f"{name:<55} {results[name]['median_ms']:>10.3f} ms", flush=True)
+    if only in (None, "pages"):
+        # AppTest 실행 중 나오는 Streamlit 경고 로그는 숨김
+        from streamlit import logger as st_logger
+        st_logger.set_log_level("error")
+        for name, result in pages.cases(repeat=repeat):
+            if pattern and pattern not in name:
+                continue
+            results[name] = result
+            print(f"{name:<55} {result['median_ms']:>10.3f} ms", flush=True)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="KFIT 엔진/페이지 벤치마크")
+    parser.add_argument("--only", choices=("engines", "pages"), help="한쪽만 실행")
+    parser.add_argument("-k", dest="pattern", help="이름에 이 문자열이 포함된 항목만")
+    parser.add_argument("--repeat", type=int, default=5, help="항목당 측정 횟수")
+    parser.add_argument("--save", default="latest", help="결과 이름 (benchmarks/results/<이름>.json) 또는 경로")
+    parser.add_argument("--compare", help="비교할 기준 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="회귀 판정 기준 (%%)")
+    args = parser.parse_args(argv)
+
+    path = args.save if args.save.endswith(".json") else os.path.join(RESULTS_DIR, f"{args.save}.json")
+    baseline = None
+    if args.compare:
+        # 새 결과로 기준 파일을 덮어쓰면 자기 자신과 비교하게 되므로 막는다
+        if os.path.abspath(args.compare) == os.path.abspath(path):
+            parser.error(f"--compare 와 --save 가 같은 파일입니다 ({path}): --save 에 다른 이름을 주세요")
+        baseline = load(args.compare)  # 측정 전에 읽어 두어 경로 오류를 바로 알린다
+
+    results = run(args.only, args.repeat, args.pattern)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    save(path, results)
+    print(f"\nsaved: {path}")
+
+    if baseline is None:
+        return 0
+
+    rows, regressions = compare(baseline, results, args.threshold)
+    print(f"\n{'benchmark':<55} {'base ms':>10} {'now ms':>10} {'change':>8}")
+    for name, base, cur, change in rows:
+        mark = "  << REGRESSION" if name in regressions else ""
+        print(f"{name:<55} {base:>10.3f} {cur:>10.3f} {change:>+7.1f}%{mark}")
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) slower than baseline by more than {args.threshold:.0f}%")
+        return 1
+    print(f"\nno regressions over {args.threshold:.0f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
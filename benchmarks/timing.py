@@ -0,0 +1,83 @@
+import json
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime
+
+MIN_SAMPLE_TIME = 0.05  # 샘플 하나가 이 시간 이상 되도록 반복 횟수를 늘린다 (초)
+
+
+def _time_once(fn, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return time.perf_counter() - start
+
+
+def measure(fn, repeat=5, warmup=True):
+    '''fn 1회 실행 시간 측정 (ms): 최소/중앙값'''
+    if warmup:
+        fn()
+    number = 1
+    while True:
+        elapsed = _time_once(fn, number)
+        if elapsed >= MIN_SAMPLE_TIME or number >= 100000:
+            break
+        number *= 10
+    samples = [_time_once(fn, number) / number * 1000 for _ in range(repeat)]
+    return summarize(samples, number)
+
+
+def summarize(samples_ms, number=1):
+    return {
+        "min_ms": round(min(samples_ms), 4),
+        "median_ms": round(statistics.median(samples_ms), 4),
+        "repeat": len(samples_ms),
+        "number": number,
+    }
+
+
+def environment():
+    '''결과 파일에 같이 남기는 실행 환경'''
+    import numpy
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=10,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+    }
+
+
+def save(path, results):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"env": environment(), "results": results}, f, ensure_ascii=False, indent=2)
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def compare(baseline, current, threshold_pct):
+    '''
+    중앙값 기준 비교. threshold_pct 이상 느려진 항목 목록을 반환
+    :return: [(이름, 기준 ms, 현재 ms, 변화율 %)] (모든 공통 항목), [회귀 항목 이름]
+    '''
+    rows, regressions = [], []
+    for name in sorted(set(baseline) & set(current)):
+        base = baseline[name]["median_ms"]
+        cur = current[name]["median_ms"]
+        change = (cur - base) / base * 100 if base > 0 else 0.0
+        rows.append((name, base, cur, change))
+        if change > threshold_pct:
+            regressions.append(name)
+    return rows, regressions
@@ -0,0 +1,115 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+# ==========================================
+# 시뮬레이션 결과 캐시 (세 앱 공용, 프로세스 단위)
+# ==========================================
+# Streamlit은 위젯을 건드릴 때마다 스크립트 전체를 다시 실행하므로,
+# 입력값이 그대로면 엔진 계산/그래프 생성 결과를 재사용한다.
+# 캐시된 객체는 여러 세션이 함께 쓰므로 꺼내 쓴 쪽에서 수정하면 안 된다.
+
+
+def make_key(namespace, inputs):
+    '''
+    입력값 → 정규화된 해시 키 (dict 순서와 무관)
+    숫자 타입은 구분한다: 3 과 3.0 은 다른 키 (결과의 타입/표시가 입력 타입을 따를 수 있으므로)
+    '''
+    canonical = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=_to_jsonable)
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return f"{namespace}:{digest}"
+
+
+def _to_jsonable(obj):
+    if hasattr(obj, "tolist"):  # numpy 배열/스칼라
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    return repr(obj)
+
+
+class ResultCache:
+    '''크기(LRU) + 유효시간(TTL) 제한 결과 캐시'''
+
+    def __init__(self, maxsize=256, ttl=600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()  # key -> (만료 시각, 값)
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, namespace, inputs, compute):
+        '''캐시에 있으면 그대로 반환, 없으면 compute()를 실행해 저장'''
+        key = make_key(namespace, inputs)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > now:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        # 계산은 잠금 밖에서 (다른 세션을 막지 않도록)
+        value = compute()
+        with self._lock:
+            self._store(key, value, now)
+        return value
+
+    def get_many_or_compute(self, namespace, inputs_list, compute_missing):
+        '''
+        여러 입력을 한 번에 조회: 캐시에 없는 입력만 모아 compute_missing 을 한 번 호출하고 각각 저장
+        :param compute_missing: 빠진 입력 목록 → 같은 순서의 결과 목록
+        :return: inputs_list 순서의 결과 목록
+        '''
+        keys = [make_key(namespace, inputs) for inputs in inputs_list]
+        now = time.monotonic()
+        results = [None] * len(keys)
+        missing = {}  # 키 → 결과가 들어갈 위치 (같은 입력은 한 번만 계산)
+        with self._lock:
+            for i, key in enumerate(keys):
+                entry = self._data.get(key)
+                if entry is not None and entry[0] > now:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    results[i] = entry[1]
+                else:
+                    self.misses += 1
+                    missing.setdefault(key, []).append(i)
+
+        if missing:
+            values = compute_missing([inputs_list[positions[0]] for positions in missing.values()])
+            with self._lock:
+                for (key, positions), value in zip(missing.items(), values):
+                    for i in positions:
+                        results[i] = value
+                    self._store(key, value, now)
+        return results
+
+    def _store(self, key, value, now):
+        '''잠금을 잡은 상태에서 호출'''
+        self._data[key] = (now + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._data),
+            }
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+
+RESULT_CACHE = ResultCache()
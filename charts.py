@@ -0,0 +1,94 @@
+import functools
+import threading
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+# ==========================================
+# 그래프 템플릿 (Life Plan / Tax 공용)
+# ==========================================
+# 앱의 그래프는 스타일(layout, trace 모양)이 고정이고 숫자 배열만 바뀐다.
+# 스타일은 프로세스당 한 번 검증된 dict 로 만들어 두고, 재실행마다 x/y 배열만 바꿔 끼워
+# 검증 없이 Figure 를 만든다 (Figure 생성 시간의 대부분이 템플릿 검증/복사).
+# 숫자는 작은 typed array(int16 / float32)로 넣어 JSON 에 base64 로 실린다.
+
+TRACE_TYPES = ("scatter", "bar")  # 앱 그래프가 쓰는 trace 종류 (템플릿에서 나머지 종류 기본값은 뺀다)
+
+
+@functools.lru_cache(maxsize=None)
+def trimmed_template(name):
+    '''plotly 기본 템플릿에서 layout 과 scatter/bar 기본값만 남긴 사본 (쓰지 않는 trace 종류 설정 제거)'''
+    source = pio.templates[name]
+    return go.layout.Template(layout=source.layout, data={kind: source.data[kind] for kind in TRACE_TYPES})
+
+
+def typed(values):
+    '''숫자 목록 → 작은 typed array (정수: int16/int32, 실수: float32). 숫자가 아니면 그대로'''
+    if isinstance(values, str):
+        return values
+    array = np.asarray(values)
+    if array.dtype.kind in "iu":
+        small = array.size == 0 or np.abs(array).max() < 2 ** 15
+        return array.astype(np.int16 if small else np.int32)
+    if array.dtype.kind == "f":
+        return array.astype(np.float32)
+    return values
+
+
+def payload_bytes(fig):
+    '''st.plotly_chart 가 브라우저로 보내는 JSON 크기 (바이트)'''
+    return len(pio.to_json(fig.to_dict(), validate=False).encode("utf-8"))
+
+
+class FigureTemplate:
+    '''고정 스타일을 한 번 검증해 두고 재실행마다 숫자 배열만 바꿔 go.Figure 를 만든다'''
+
+    def __init__(self, template, traces, **layout):
+        '''
+        :param template: plotly 기본 템플릿 이름 ("plotly_white" / "plotly_dark")
+        :param traces: 데이터 없이 스타일만 지정한 trace 목록 (go.Scatter(name=..., line=...) 등)
+        :param layout: update_layout 에 넘기던 고정 레이아웃 값
+        '''
+        self.template = template
+        self._traces = traces
+        self._layout = layout
+        self._base = None
+        self._lock = threading.Lock()
+
+    def base(self):
+        '''검증을 거친 {"data": [...], "layout": {...}} (처음 호출 때 한 번 생성, 수정 금지)'''
+        with self._lock:
+            if self._base is None:
+                fig = go.Figure(data=self._traces, layout=dict(self._layout, template=trimmed_template(self.template)))
+                self._base = fig.to_dict()
+            return self._base
+
+    def figure(self, *data, shapes=(), annotations=()):
+        '''
+        :param data: trace 순서대로 이번 실행의 값 (예: {"x": ages, "y": liquid}); 숫자 배열은 typed() 변환
+        :param shapes: 이번 실행에만 붙는 도형 dict 목록
+        :param annotations: 이번 실행에만 붙는 말풍선 dict 목록
+        '''
+        base = self.base()
+        traces = [
+            dict(style, **{key: typed(value) for key, value in values.items()})
+            for style, values in zip(base["data"], data)
+        ]
+        layout = dict(base["layout"])
+        if shapes:
+            layout["shapes"] = list(shapes)
+        if annotations:
+            layout["annotations"] = list(annotations)
+        # 스타일은 base() 에서 검증했고 여기서 더하는 값은 숫자 배열/도형뿐이라 검증을 건너뛴다
+        return go.Figure({"data": traces, "layout": layout}, _validate=False)
+
+
+def hline(y, x0, x1, **line):
+    '''fig.add_shape(type="line", ...) 가로 기준선'''
+    return dict(type="line", x0=x0, y0=y, x1=x1, y1=y, line=line)
+
+
+def vline(x, **line):
+    '''fig.add_vline(x=...) 과 같은 세로선 (y 축 전체 높이)'''
+    return dict(type="line", x0=x, x1=x, xref="x", y0=0, y1=1, yref="y domain", line=line)
@@ -0,0 +1,104 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# ==========================================
+# GAS 전송용 공용 HTTP 세션 (keep-alive 커넥션 풀)
+# ==========================================
+# 요청마다 TCP+TLS 연결을 새로 맺지 않도록 프로세스당 Session 하나를 재사용한다.
+# 설정은 환경변수로 조정 가능.
+
+logger = logging.getLogger(__name__)
+
+POOL_SIZE = int(os.environ.get("KFIT_HTTP_POOL_SIZE", "10"))               # 호스트당 최대 연결 수
+CONNECT_TIMEOUT = float(os.environ.get("KFIT_HTTP_CONNECT_TIMEOUT", "5"))   # 초
+READ_TIMEOUT = float(os.environ.get("KFIT_HTTP_READ_TIMEOUT", "30"))        # 초
+RETRIES = int(os.environ.get("KFIT_HTTP_RETRIES", "2"))                     # 연결 실패 재시도 횟수
+LATENCY_WINDOW = 1000  # 지연 통계에 쓰는 최근 요청 수
+LATENCY_LOG_EVERY = 100  # n건마다 p50/p95를 로그로 남김
+
+
+class LatencyStats:
+    '''최근 요청의 소요 시간 (p50/p95 계산용)'''
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.errors = 0
+
+    def record(self, seconds, ok=True):
+        with self._lock:
+            self._samples.append(seconds)
+            self.count += 1
+            if not ok:
+                self.errors += 1
+
+    def summary(self):
+        with self._lock:
+            samples = sorted(self._samples)
+            count, errors = self.count, self.errors
+        if not samples:
+            return {"count": count, "errors": errors, "p50_ms": None, "p95_ms": None, "max_ms": None}
+
+        def pct(p):
+            return samples[min(len(samples) - 1, int(p / 100 * len(samples)))] * 1000
+
+        return {
+            "count": count,
+            "errors": errors,
+            "p50_ms": round(pct(50), 1),
+            "p95_ms": round(pct(95), 1),
+            "max_ms": round(samples[-1] * 1000, 1),
+        }
+
+
+LATENCY = LatencyStats()
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    '''프로세스 공용 Session (처음 호출 시 생성)'''
+    global _session
+    with _session_lock:
+        if _session is None:
+            # 요청을 보내기 전의 연결 실패만 여기서 재시도한다.
+            # 보낸 뒤의 실패(read 끊김, 5xx 응답 등)는 GAS 가 이미 행을 기록했을 수 있으므로
+            # 재전송하지 않고 실패로 돌려준다 (outbox 가 백오프 후 묶음을 다시 보낸다)
+            retry = Retry(
+                total=RETRIES, connect=RETRIES, read=0, status=0, other=0, redirect=0,
+                allowed_methods=None, backoff_factor=0.5, raise_on_status=False,
+            )
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE, max_retries=retry)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({"Content-Type": "application/json"})
+            _session = session
+    return _session
+
+
+def post_json(url, payload, timeout=None):
+    '''JSON POST (공용 세션 사용) + 소요 시간 기록'''
+    start = time.perf_counter()
+    ok = False
+    try:
+        response = get_session().post(
+            url, data=json.dumps(payload),
+            timeout=timeout or (CONNECT_TIMEOUT, READ_TIMEOUT),
+        )
+        ok = response.status_code == 200
+        return response
+    finally:
+        LATENCY.record(time.perf_counter() - start, ok)
+        if LATENCY.count % LATENCY_LOG_EVERY == 0:
+            logger.info("GAS submission latency: %s", LATENCY.summary())
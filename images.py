@@ -0,0 +1,221 @@
+import functools
+import hashlib
+import json
+import os
+import threading
+
+import streamlit as st
+
+# ==========================================
+# 페이지 이미지 변형본 (반응형 크기 × AVIF/WebP/JPEG, 내용 해시 파일명)
+# ==========================================
+# 원본 사진을 그대로 st.image 로 보내면 재실행마다 원본을 읽고, 브라우저는 캐시 헤더 없는
+# /media/ 주소에서 원본 전체(수 MB)를 매번 다시 받는다.
+# 대신 표시 폭의 1x/2x/3x 변형본을 포맷별로 미리 만들어 static/img/ 에 두고(tools/build_assets.py,
+# 없으면 프로세스당 한 번 자동 생성), <picture srcset> 으로 내려보내 브라우저가 화면 폭/배율과
+# 지원 포맷에 맞는 파일 하나만 받게 한다.
+# 서빙: streamlit run → app/static/img/ (ETag 재검증)
+#       uvicorn asgi:app → /img/ (메모리 바이트 캐시 + 1년 immutable 캐시 헤더)
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+IMAGE_DIR = os.path.join(ROOT, "static", "img")
+MANIFEST_PATH = os.path.join(IMAGE_DIR, "manifest.json")
+URL_PREFIX = os.environ.get("KFIT_IMAGE_URL", "app/static/img/")  # asgi.py 가 "/img/" 로 바꾼다
+
+# 원본 → 만들 가로 폭 (px, 화면 표시 폭의 1x / 2x / 3x)
+IMAGE_ASSETS = {
+    "pages/ceo.jpg": (220, 440, 660),
+}
+# (포맷, MIME, 저장 옵션) — 앞쪽이 우선 (<source> 순서), 마지막 포맷이 <img> 기본값
+FORMATS = (
+    ("avif", "image/avif", {"quality": 50}),
+    ("webp", "image/webp", {"quality": 80}),
+    ("jpeg", "image/jpeg", {"quality": 82, "optimize": True, "progressive": True}),
+)
+EXTENSIONS = {"avif": "avif", "webp": "webp", "jpeg": "jpg"}
+CACHE_CONTROL = "public, max-age=31536000, immutable"  # 파일명이 내용 해시라 바뀌지 않는다
+
+_build_lock = threading.Lock()
+
+
+def _supported_formats():
+    '''설치된 Pillow 가 저장할 수 있는 포맷만 (AVIF/WebP 는 빌드에 따라 빠질 수 있다)'''
+    from PIL import features
+    return [f for f in FORMATS if f[0] == "jpeg" or features.check(f[0])]
+
+
+def _file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def load_manifest():
+    '''static/img/manifest.json → {원본 경로: 항목} (없거나 깨졌으면 빈 dict)'''
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_manifest(manifest):
+    os.makedirs(IMAGE_DIR, exist_ok=True)
+    tmp = f"{MANIFEST_PATH}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, MANIFEST_PATH)
+
+
+def build_variants(source, widths):
+    '''
+    원본 하나 → 폭 × 포맷 변형본 파일 (이미 있으면 건너뜀)
+    :return: manifest 항목 {"source_hash", "width", "height", "variants": [{"format", "mime", "width", "file", "bytes"}]}
+    '''
+    import io
+    from PIL import Image, ImageOps
+
+    path = os.path.join(ROOT, source)
+    source_hash = _file_hash(path)
+    img = ImageOps.exif_transpose(Image.open(path)).convert("RGB")
+    stem = os.path.splitext(os.path.basename(source))[0]
+    # 원본보다 큰 폭은 만들지 않는다 (모두 크면 원본 폭 하나)
+    targets = sorted({min(w, img.width) for w in widths})
+
+    os.makedirs(IMAGE_DIR, exist_ok=True)
+    variants = []
+    for width in targets:
+        height = round(img.height * width / img.width)
+        resized = img.resize((width, height), Image.LANCZOS)
+        for fmt, mime, options in _supported_formats():
+            buf = io.BytesIO()
+            resized.save(buf, fmt.upper(), **options)
+            data = buf.getvalue()
+            name = f"{stem}-{width}.{hashlib.sha256(data).hexdigest()[:12]}.{EXTENSIONS[fmt]}"
+            target = os.path.join(IMAGE_DIR, name)
+            if not os.path.exists(target):
+                tmp = f"{target}.{os.getpid()}.tmp"  # 다른 세션이 반쯤 쓴 파일을 받지 않도록 바꿔치기
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, target)
+            variants.append({"format": fmt, "mime": mime, "width": width, "file": name, "bytes": len(data)})
+    return {"source_hash": source_hash, "width": img.width, "height": img.height, "variants": variants}
+
+
+def _is_current(entry, source, widths):
+    '''manifest 항목이 지금 원본/폭 설정으로 만든 것이고 파일도 모두 있는지'''
+    return (
+        entry is not None
+        and entry["source_hash"] == _file_hash(os.path.join(ROOT, source))
+        and {v["width"] for v in entry["variants"]} == {min(w, entry["width"]) for w in widths}
+        and all(os.path.exists(os.path.join(IMAGE_DIR, v["file"])) for v in entry["variants"])
+    )
+
+
+def build_all(assets=None, force=False):
+    '''IMAGE_ASSETS 전체 변형본 생성 + manifest 갱신 (tools/build_assets.py / 런타임 첫 사용 시)'''
+    assets = IMAGE_ASSETS if assets is None else assets
+    with _build_lock:
+        manifest = load_manifest()
+        changed = False
+        for source, widths in assets.items():
+            if force or not _is_current(manifest.get(source), source, widths):
+                manifest[source] = build_variants(source, widths)
+                changed = True
+        if changed:
+            write_manifest(manifest)
+    return manifest
+
+
+@functools.lru_cache(maxsize=32)
+def _entry(source, mtime):
+    '''원본의 manifest 항목 (프로세스당 한 번 확인, 원본이 바뀌면 mtime 으로 무효화)'''
+    return build_all({source: IMAGE_ASSETS[source]})[source]
+
+
+def picture_html(source, width, alt=""):
+    '''
+    <picture> HTML: 포맷별 <source srcset> + 기본 <img> (브라우저가 폭/배율/포맷에 맞는 파일 하나 선택)
+    :param width: 화면 표시 폭 (CSS px)
+    '''
+    entry = _entry(source, os.path.getmtime(os.path.join(ROOT, source)))
+    by_format = {}
+    for v in entry["variants"]:
+        by_format.setdefault(v["format"], []).append(v)
+    fallback = by_format.pop("jpeg")
+    sizes = f"{width}px"
+
+    def srcset(variants):
+        return ", ".join(f"{URL_PREFIX}{v['file']} {v['width']}w" for v in variants)
+
+    sources = "".join(
+        f'<source type="{variants[0]["mime"]}" srcset="{srcset(variants)}" sizes="{sizes}">'
+        for variants in by_format.values()
+    )
+    height = round(entry["height"] * width / entry["width"])
+    return (
+        f'<picture>{sources}'
+        f'<img src="{URL_PREFIX}{fallback[0]["file"]}" srcset="{srcset(fallback)}" sizes="{sizes}" '
+        f'width="{width}" height="{height}" alt="{alt}" decoding="async" '
+        f'style="max-width: 100%; height: auto;"></picture>'
+    )
+
+
+def _static_off():
+    '''기본 URL(app/static/)인데 정적 서빙이 꺼져 있으면 True'''
+    return URL_PREFIX.startswith("app/static/") and not st.get_option("server.enableStaticServing")
+
+
+def image(source, width, alt=""):
+    '''
+    st.image(source, width=...) 대신: 변형본 <picture>.
+    정적 서빙이 꺼져 있으면 2x JPEG 변형본을 st.image 로, Pillow 가 없으면 원본을 st.image 로
+    '''
+    try:
+        if _static_off():
+            entry = _entry(source, os.path.getmtime(os.path.join(ROOT, source)))
+            jpegs = [v for v in entry["variants"] if v["format"] == "jpeg"]
+            best = next((v for v in jpegs if v["width"] >= 2 * width), jpegs[-1])
+            st.image(os.path.join(IMAGE_DIR, best["file"]), width=width)
+            return
+        html = picture_html(source, width, alt)
+    except ImportError:
+        st.image(os.path.join(ROOT, source), width=width)
+        return
+    st.markdown(html, unsafe_allow_html=True)
+
+
+# ==========================================
+# uvicorn asgi:app 으로 실행할 때의 /img/ 라우트 (메모리 바이트 캐시)
+# ==========================================
+_served = {}  # 파일명 → (MIME, 바이트): manifest 에 있는 변형본만, 한 번 읽으면 메모리에 유지
+
+
+def variant(name):
+    '''변형본 파일명 → (MIME, 바이트). manifest 에 없는 이름이면 None'''
+    hit = _served.get(name)
+    if hit is None:
+        for entry in load_manifest().values():
+            for v in entry["variants"]:
+                if v["file"] == name:
+                    with open(os.path.join(IMAGE_DIR, name), "rb") as f:
+                        _served[name] = hit = (v["mime"], f.read())
+    return hit
+
+
+def route(path="/img/{name}"):
+    '''starlette Route: 변형본을 메모리에서 1년 immutable 캐시 헤더로 서빙'''
+    from starlette.responses import Response
+    from starlette.routing import Route
+
+    async def endpoint(request):
+        name = request.path_params["name"]
+        hit = variant(name)
+        if hit is None:
+            return Response("not found", status_code=404)
+        headers = {"Cache-Control": CACHE_CONTROL, "ETag": f'"{name}"'}
+        if request.headers.get("if-none-match") == headers["ETag"]:
+            return Response(status_code=304, headers=headers)
+        mime, data = hit
+        return Response(data, media_type=mime, headers=headers)
+
+    return Route(path, endpoint, methods=["GET"])
@@ -0,0 +1 @@
+'''KFIT 시뮬레이션 코어 (Streamlit 없이 import 가능한 계산 모듈)'''
@@ -0,0 +1,374 @@
+'''
+상담 이력 일괄 재계산 (시트 내보내기 CSV/Parquet → 결과 파일)
+
+    python -m kfit.batch life life_export.csv -o life_rescored.csv --workers 8
+    python -m kfit.batch tax tax_export.parquet -o tax_rescored.parquet --payload-order
+
+입력 컬럼은 models.py 필드명(기본) 또는 to_payload 순서(--payload-order: 시트를 그대로 내보낸 경우).
+부모 프로세스는 입력을 파싱하지 않고 구간만 나눈다 (CSV: 레코드 경계의 바이트 구간, Parquet: 행 그룹).
+워커가 자기 구간을 읽고 재계산해 부분 파일을 직접 쓴다.
+결과: CSV 는 부분 파일을 입력 순서대로 이어 붙인 파일 하나,
+      Parquet 은 부분 파일 폴더 (-o out.parquet → out.parquet/part-00000.parquet, ...; 폴더째 읽으면 입력 순서).
+'''
+import argparse
+import codecs
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from kfit.engine import golf, life, tax
+from models import GolfData, LifeData, TaxData
+
+EOK = 100000000
+DEFAULT_CHUNK_SIZE = 20000
+CSV_ENCODING = "utf-8-sig"  # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+TEXT_COLUMNS = {"name": str, "phone": str, "memo": str}
+
+
+# ==========================================
+# 행 종류별 재계산 (결과 열만 새 값으로 덮어씀)
+# ==========================================
+def _score_life(rows):
+    profiles, properties = life.profiles_from_life_rows(rows)
+    result = life.run_batch(profiles, properties)
+    rows["score"] = result.score
+    rows["grade"] = result.grade
+    rows["shortfall_txt"] = [f"{int(age)}세" if age == age else "Safe" for age in result.shortfall_age]
+    return rows
+
+
+def _score_golf(rows):
+    bankruptcy_age, at_target = golf.project_golf_batch(
+        rows["current_age"], rows["retire_age"], rows["assets"],
+        rows["saving"], rows["rounds"], rows["cost"],
+    )
+    rows["bankruptcy_age"] = bankruptcy_age
+    rows["result_msg"] = [
+        golf.result_message(golf.funding_status(current, golf.TARGET_AGE, age)[1], golf.TARGET_AGE, balance)
+        for current, age, balance in zip(rows["current_age"], bankruptcy_age.tolist(), at_target.tolist())
+    ]
+    return rows
+
+
+def _score_tax(rows):
+    result = tax.inheritance_scenarios(
+        rows["real_estate_billions"] * EOK, rows["financial_billions"] * EOK,
+        rows["has_spouse_str"].eq("있음"), rows["spouse_pct"] / 100, rows["sim_years"],
+        rows["inflation_re_pct"] / 100, rows["inflation_fin_pct"] / 100,
+    )
+    rows["calculated_tax_now"] = result.tax_now
+    rows["calculated_future_tax"] = result.future_tax
+    rows["calculated_future_cash"] = result.future_cash
+    rows["is_liquidity_crisis"] = np.where(result.liquidity_crisis, "위험(흑자부도)", "안전")
+    rows["shortage_amount"] = result.shortage
+    return rows
+
+
+# app_type → (데이터 모델, 재계산 함수)
+ROW_TYPES = {
+    "life": (LifeData, _score_life),
+    "golf": (GolfData, _score_golf),
+    "tax": (TaxData, _score_tax),
+}
+
+
+def score_chunk(kind, rows):
+    '''워커 프로세스에서 실행되는 청크 단위 재계산'''
+    return ROW_TYPES[kind][1](rows)
+
+
+# ==========================================
+# 입력 나누기: 부모는 구간만 정하고, 읽기/재계산/쓰기는 워커가 한다
+# ==========================================
+BLOCK_SIZE = 16 * 1024 * 1024   # CSV 경계를 찾을 때 한 번에 읽는 바이트
+SAMPLE_SIZE = 1024 * 1024       # 행당 바이트 추정에 쓰는 앞부분 크기
+
+
+def _csv_header(path, fields, payload_order, header):
+    '''(데이터 시작 위치, 열 이름). 헤더 줄은 이름에만 쓰고 데이터 구간에서 뺀다'''
+    if not header:
+        return 0, list(fields)
+    with open(path, "rb") as f:
+        first = f.readline()
+    if payload_order:
+        return len(first), list(fields)
+    names = pd.read_csv(io.BytesIO(first), encoding=CSV_ENCODING, nrows=0).columns.tolist()
+    return len(first), names
+
+
+def _csv_ranges(path, data_start, chunk_bytes):
+    '''
+    CSV 를 약 chunk_bytes 마다 레코드 경계에서 자른 (시작, 끝) 구간을 찾는 대로 내보낸다
+    따옴표 안의 줄바꿈(memo 등 여러 줄 셀)은 경계로 보지 않는다 (따옴표 개수의 홀짝으로 판단)
+    '''
+    size = os.path.getsize(path)
+    start = data_start
+    target = data_start + chunk_bytes
+    in_quotes = False
+    with open(path, "rb") as f:
+        f.seek(data_start)
+        offset = data_start
+        while target < size:
+            block = f.read(BLOCK_SIZE)
+            if not block:
+                break
+            pos = 0  # block 안에서 따옴표를 센 위치
+            while target < offset + len(block):
+                cut = max(target - offset, pos)
+                in_quotes ^= block.count(b'"', pos, cut) & 1
+                newline = block.find(b"\n", cut)
+                if newline == -1:
+                    pos = cut
+                    break  # 다음 block 에서 이어서 찾는다
+                in_quotes ^= block.count(b'"', cut, newline) & 1
+                pos = newline + 1
+                if not in_quotes:
+                    yield start, offset + pos
+                    start = offset + pos
+                    target = start + chunk_bytes
+            in_quotes ^= block.count(b'"', pos) & 1
+            offset += len(block)
+    if start < size:
+        yield start, size
+
+
+def _row_bytes(path, data_start):
+    '''앞부분 표본으로 추정한 행당 평균 바이트'''
+    with open(path, "rb") as f:
+        f.seek(data_start)
+        sample = f.read(SAMPLE_SIZE)
+    return max(len(sample) / max(sample.count(b"\n"), 1), 1.0)
+
+
+def plan_parts(path, fields, chunk_size=DEFAULT_CHUNK_SIZE, payload_order=False, header=True, workers=1):
+    '''
+    입력 파일 → 워커 작업을 찾는 대로 내보낸다 (파일을 파싱하지 않고 위치만 정한다)
+    CSV: 약 chunk_size 행 크기의 바이트 구간 / Parquet: 행 그룹 (큰 행 그룹은 최대 workers 조각으로 나눔)
+    '''
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        names = list(fields) if payload_order else None
+        metadata = pq.ParquetFile(path).metadata
+        for group in range(metadata.num_row_groups):
+            rows = metadata.row_group(group).num_rows
+            # 조각마다 행 그룹 전체를 디코딩하므로 조각 수는 workers 이하로 묶는다
+            pieces = max(1, min(workers, -(-rows // chunk_size)))
+            step = -(-rows // pieces)
+            for offset in range(0, rows, step):
+                yield "parquet", path, group, offset, step, names
+        return
+
+    data_start, names = _csv_header(path, fields, payload_order, header)
+    chunk_bytes = max(int(_row_bytes(path, data_start) * chunk_size), 1)
+    for start, end in _csv_ranges(path, data_start, chunk_bytes):
+        yield "csv", path, start, end, names
+
+
+def read_part(part):
+    '''작업 하나의 입력 행 (DataFrame)'''
+    if part[0] == "parquet":
+        import pyarrow.parquet as pq
+        _, path, group, offset, length, names = part
+        rows = pq.ParquetFile(path).read_row_group(group).slice(offset, length).to_pandas()
+        if names is not None:
+            rows.columns = names
+        return rows
+    _, path, start, end, names = part
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return pd.read_csv(io.BytesIO(data), encoding=CSV_ENCODING, dtype=TEXT_COLUMNS, header=None, names=names)
+
+
+def write_part(rows, path):
+    if path.endswith(".parquet"):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        table = pa.Table.from_pandas(rows, preserve_index=False)
+        # 구간 안에서 값이 모두 비어 있는 글자 열은 null 타입이 된다: 부분 파일끼리 스키마를 맞춘다
+        schema = pa.schema([f.with_type(pa.string()) if pa.types.is_null(f.type) else f for f in table.schema],
+                           metadata=table.schema.metadata)
+        pq.write_table(table.cast(schema), path)
+    else:
+        rows.to_csv(path, index=False, encoding="utf-8")
+
+
+def score_part(kind, part, out_path):
+    '''워커 프로세스: 구간 읽기 → 재계산 → 부분 파일 기록. :return: 행 수'''
+    rows = score_chunk(kind, read_part(part))
+    write_part(rows, out_path)
+    return len(rows)
+
+
+class PartAssembler:
+    '''
+    부분 파일 → 결과 (부모 프로세스는 파일 단위 복사/이동만 한다)
+    CSV: 끝난 부분 파일을 입력 순서대로 바로바로 이어 붙여 파일 하나로 (워커가 도는 동안 진행)
+    Parquet: 부분 파일 폴더(part-00000.parquet, ...)를 그대로 결과로 (다시 인코딩하지 않음,
+             pyarrow / pandas.read_parquet 로 폴더째 읽으면 입력 순서)
+    '''
+
+    def __init__(self, dst):
+        self.dst = dst
+        self.parquet = dst.endswith(".parquet")
+        _check_replaceable(dst)
+        self.tmp_dir = tempfile.mkdtemp(prefix=f".{os.path.basename(dst)}.parts-",
+                                        dir=os.path.dirname(os.path.abspath(dst)))
+        self.parts = 0
+        self._finished = set()
+        self._next = 0
+        self._out = None
+
+    def part_path(self, index):
+        self.parts = max(self.parts, index + 1)
+        return os.path.join(self.tmp_dir, f"part-{index:05d}{'.parquet' if self.parquet else '.csv'}")
+
+    def finished(self, index):
+        '''부분 파일 하나 완료 (CSV: 앞 번호가 모두 끝났으면 순서대로 이어 붙인다)'''
+        if self.parquet:
+            return
+        self._finished.add(index)
+        while self._next in self._finished:
+            self._finished.remove(self._next)
+            self._append(self._next)
+            self._next += 1
+
+    def _append(self, index):
+        if self._out is None:
+            # 버퍼 없이 열어야 os.copy_file_range 와 위치가 어긋나지 않는다
+            self._out = open(os.path.join(self.tmp_dir, "merged.csv"), "wb", buffering=0)
+            self._out.write(codecs.BOM_UTF8)  # 엑셀에서 한글이 깨지지 않도록
+        path = self.part_path(index)
+        with open(path, "rb") as f:
+            offset = len(f.readline()) if index else 0  # 첫 부분 파일만 헤더 유지
+            _copy_from(f, offset, self._out)
+        os.remove(path)
+
+    def close(self):
+        '''결과를 dst 에 둔다 (한 행도 없으면 만들지 않는다)'''
+        if self._out is not None:
+            self._out.close()
+        if self.parts:
+            _remove_output(self.dst)
+            if self.parquet:
+                os.replace(self.tmp_dir, self.dst)
+                return
+            os.replace(os.path.join(self.tmp_dir, "merged.csv"), self.dst)
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def abort(self):
+        if self._out is not None:
+            self._out.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+
+def _copy_from(src, offset, out):
+    '''src 의 offset 부터 끝까지 out 뒤에 붙인다 (가능하면 커널 안에서 복사)'''
+    size = os.fstat(src.fileno()).st_size
+    while offset < size:
+        try:
+            copied = os.copy_file_range(src.fileno(), out.fileno(), size - offset, offset)
+        except (AttributeError, OSError):  # Linux 가 아니거나 파일 시스템이 지원하지 않음
+            src.seek(offset)
+            shutil.copyfileobj(src, out, BLOCK_SIZE)
+            return
+        if not copied:
+            return
+        offset += copied
+
+
+def _is_parts_dir(path):
+    return all(name.startswith("part-") and name.endswith(".parquet") for name in os.listdir(path))
+
+
+def _check_replaceable(dst):
+    '''이전 결과(파일 / 부분 파일 폴더)가 아닌 폴더는 덮어쓰지 않는다'''
+    if os.path.isdir(dst) and not _is_parts_dir(dst):
+        raise ValueError(f"{dst} is a directory that is not a previous batch output")
+
+
+def _remove_output(dst):
+    if os.path.isdir(dst):
+        _check_replaceable(dst)
+        shutil.rmtree(dst)
+    elif os.path.exists(dst):
+        os.remove(dst)
+
+
+# ==========================================
+# 실행
+# ==========================================
+def run(kind, src, dst, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+        payload_order=False, header=True, progress=sys.stderr):
+    '''
+    src 를 읽어 재계산한 결과를 dst 에 쓴다
+    :return: (처리 행 수, 소요 시간 초)
+    '''
+    model, _ = ROW_TYPES[kind]
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    assembler = PartAssembler(dst)
+    done = 0
+
+    def report(rows, final=False):
+        elapsed = time.perf_counter() - start
+        rate = rows / elapsed if elapsed > 0 else 0.0
+        end = "\n" if final else ""
+        print(f"\r[{kind}] {rows:,} rows  {elapsed:,.1f}s  {rate:,.0f} rows/s", end=end, file=progress, flush=True)
+
+    # 구간은 찾는 대로 워커에 넘긴다 (CSV 경계 찾기가 재계산과 겹쳐 돈다)
+    parts = plan_parts(src, model.PAYLOAD_FIELDS, chunk_size, payload_order, header, workers)
+    try:
+        if workers == 1:
+            parts = list(parts)
+            for index, part in enumerate(parts):
+                done += score_part(kind, part, assembler.part_path(index))
+                assembler.finished(index)
+                if index + 1 < len(parts):
+                    report(done)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(score_part, kind, part, assembler.part_path(index)): index
+                    for index, part in enumerate(parts)
+                }
+                for finished, future in enumerate(as_completed(futures), 1):
+                    done += future.result()
+                    assembler.finished(futures[future])
+                    if finished < len(futures):
+                        report(done)
+    except BaseException:
+        assembler.abort()
+        raise
+    assembler.close()
+
+    elapsed = time.perf_counter() - start
+    report(done, final=True)  # 최종 처리량은 이 한 줄 (마지막 구간은 진행 표시 없이 여기서)
+    return done, elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="상담 이력 일괄 재계산 (CSV/Parquet)")
+    parser.add_argument("kind", choices=sorted(ROW_TYPES), help="행 종류 (app_type)")
+    parser.add_argument("src", help="입력 파일 (.csv / .parquet)")
+    parser.add_argument("-o", "--output", required=True, help="출력 파일 (.csv) 또는 부분 파일 폴더 (.parquet)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="청크당 행 수")
+    parser.add_argument("--payload-order", action="store_true",
+                        help="컬럼이 to_payload 순서 (헤더 이름은 무시)")
+    parser.add_argument("--no-header", action="store_true", help="CSV 첫 줄부터 데이터 (to_payload 순서)")
+    args = parser.parse_args(argv)
+
+    run(args.kind, args.src, args.output, workers=args.workers, chunk_size=args.chunk_size,
+        payload_order=args.payload_order, header=not args.no_header)
+
+
+if __name__ == "__main__":
+    main()
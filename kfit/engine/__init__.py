@@ -0,0 +1,62 @@
+'''
+KFIT 계산 엔진 (UI 의존성 없음)
+
+    from kfit.engine import WannabeEngine, project_golf_fund, project_estates
+
+서브모듈(life / golf / tax / portfolio)은 이름을 처음 참조할 때 import 한다.
+'''
+import importlib
+
+# 공개 이름 → 서브모듈
+_EXPORTS = {
+    # life: 은퇴 시뮬레이션
+    "WannabeEngine": "life",
+    "LifeInputs": "life",
+    "LifeProjection": "life",
+    "MonteCarloResult": "life",
+    "PropertyLedger": "life",
+    "property_fingerprint": "life",
+    "BatchResult": "life",
+    "simulate_life": "life",
+    "simulate_scenarios": "life",
+    "annual_hobby_cost": "life",
+    "run_batch": "life",
+    "score_batch": "life",
+    "profiles_from_life_rows": "life",
+    "PROFILE_COLUMNS": "life",
+    # portfolio: 부동산 목록 (열 단위 배열)
+    "Portfolio": "portfolio",
+    # golf: 골프 자금
+    "GolfProjection": "golf",
+    "project_golf_fund": "golf",
+    "what_if_grid": "golf",
+    "project_golf_batch": "golf",
+    "funding_status": "golf",
+    "result_message": "golf",
+    # tax: 상속세
+    "TAX_BRACKETS": "tax",
+    "EstateProjection": "tax",
+    "SpouseShareCurve": "tax",
+    "inheritance_tax": "tax",
+    "spouse_deduction": "tax",
+    "project_estates": "tax",
+    "optimize_spouse_share": "tax",
+    "InheritanceResult": "tax",
+    "inheritance_scenarios": "tax",
+}
+
+__all__ = ["life", "golf", "tax", "portfolio", *_EXPORTS]
+
+
+def __getattr__(name):
+    if name in ("life", "golf", "tax", "portfolio"):
+        return importlib.import_module(f"{__name__}.{name}")
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
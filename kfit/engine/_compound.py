@@ -0,0 +1,14 @@
+import numpy as np
+
+
+def compound(start, cash_flow, rate):
+    '''
+    B[i] = B[i-1]*(1+r[i]) + CF[i]  (B[-1] = start) 을 반복문 없이 계산 (마지막 축 = 연차)
+    B[i] = G[i] * (start + Σ CF[k]/G[k]),  G[i] = Π(1+r[0..i])
+    :param start: 시작 잔액 (스칼라 또는 cash_flow[..., 0] 모양의 배열)
+    :param cash_flow: 연차별 현금흐름 (..., 연차)
+    :param rate: 수익률 (스칼라, 행별 [:, None], 또는 cash_flow 모양의 경로별 배열)
+    '''
+    cash_flow = np.asarray(cash_flow, dtype=float)
+    growth = np.cumprod(np.broadcast_to(1 + np.asarray(rate, dtype=float), cash_flow.shape), axis=-1)
+    return growth * (np.asarray(start, dtype=float)[..., None] + np.cumsum(cash_flow / growth, axis=-1))
@@ -0,0 +1,111 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from ._compound import compound
+
+# ==========================================
+# 골프 자금 시뮬레이션 엔진 (Wannabe Golf)
+# ==========================================
+INFLATION_RATE = 0.03   # 라운딩 비용 연 상승률
+ROI_RATE = 0.04         # 골프 자금 연 수익률
+EXTRA_YEARS = 4         # 목표 나이 이후 추가로 계산하는 연수
+TARGET_AGE = 85         # 목표 나이 (이 나이까지 칠 수 있는지 진단)
+WARNING_PERCENT = 70    # 목표 대비 유지 비율이 이 이상이면 WARNING, 미만이면 DANGER
+
+
+@dataclass
+class GolfProjection:
+    ages: np.ndarray      # 나이 축 (current_age ~ target_age + EXTRA_YEARS)
+    balance: np.ndarray   # 해당 나이 말 잔액 (원)
+    bankruptcy_age: int   # 잔액이 처음 음수가 되는 나이 (없으면 target_age + 1)
+    status: str           # "SAFE" / "DANGER"
+
+    def balance_at(self, age: int) -> int:
+        '''해당 나이의 잔액 (원 단위 정수, O(1))'''
+        return int(self.balance[age - self.ages[0]])
+
+
+def _projection_axes(current_age, target_age):
+    ages = np.arange(current_age, target_age + EXTRA_YEARS + 1)
+    return ages, ages - current_age
+
+
+def _balances(assets, annual_income, annual_cost, years_passed):
+    '''B[i] = B[i-1]*(1+roi) + 수입[i] - 비용[i] (마지막 축 = 연차)'''
+    cash_flow = annual_income - annual_cost * (1 + INFLATION_RATE) ** years_passed
+    return compound(assets, cash_flow, ROI_RATE)
+
+
+def _bankruptcy_ages(balance, ages, target_age):
+    '''잔액이 처음 음수로 바뀌는 나이 (마지막 축 기준 벡터 탐색)'''
+    below_zero = balance < 0
+    first = below_zero.argmax(axis=-1)
+    return np.where(below_zero.any(axis=-1), ages[first], target_age + 1)
+
+
+def project_golf_fund(
+    current_age: int, retire_age: int, target_age: int,
+    assets: float, saving: float, rounds: int, cost_per_round: float,
+) -> GolfProjection:
+    '''골프 자금 잔액 추이와 고갈 나이'''
+    ages, years_passed = _projection_axes(current_age, target_age)
+    annual_income = np.where(ages < retire_age, saving * 12, 0)
+    balance = _balances(assets, annual_income, rounds * cost_per_round * 12, years_passed)
+    bankruptcy_age = int(_bankruptcy_ages(balance, ages, target_age))
+    status = "DANGER" if (balance < 0).any() else "SAFE"
+    return GolfProjection(ages=ages, balance=balance, bankruptcy_age=bankruptcy_age, status=status)
+
+
+def what_if_grid(
+    current_age: int, retire_age: int, target_age: int, assets: float, saving: float,
+    rounds_options: Sequence[int], cost_options: Sequence[float],
+) -> np.ndarray:
+    '''
+    (월 라운딩 횟수 × 회당 비용) 조합별 고갈 나이를 한 번에 계산
+    :return: shape (len(rounds_options), len(cost_options)) 정수 배열
+    '''
+    ages, years_passed = _projection_axes(current_age, target_age)
+    annual_income = np.where(ages < retire_age, saving * 12, 0)
+    annual_cost = (np.asarray(rounds_options, dtype=float)[:, None]
+                   * np.asarray(cost_options, dtype=float)[None, :] * 12)
+    balance = _balances(assets, annual_income, annual_cost[..., None], years_passed)
+    return _bankruptcy_ages(balance, ages, target_age)
+
+
+def funding_status(current_age: int, target_age: int, bankruptcy_age: int):
+    '''목표 나이까지 자금이 버티는 비율(%, 0~100)과 상태 ("SAFE" / "WARNING" / "DANGER")'''
+    percent = min(100, max(0, int(((bankruptcy_age - current_age) / (target_age - current_age)) * 100)))
+    if percent >= 100:
+        return percent, "SAFE"
+    if percent >= WARNING_PERCENT:
+        return percent, "WARNING"
+    return percent, "DANGER"
+
+
+def result_message(status: str, target_age: int, balance_at_target: float) -> str:
+    '''상담 기록용 결과 요약 (GolfData.result_msg)'''
+    if status == "SAFE":
+        return "자산 충분 (건강 리스크 대비 필요)"
+    return f"{target_age}세까지 {abs(balance_at_target):,.0f}원 부족"
+
+
+def project_golf_batch(current_age, retire_age, assets, saving, rounds, cost_per_round, target_age=TARGET_AGE):
+    '''
+    고객 행 배열을 한 번에 계산 (행마다 현재 나이가 달라 가장 긴 기간에 맞추고 기간 밖은 마스킹)
+    :return: (고갈 나이 배열, 목표 나이 시점 잔액 배열[원, 소수점 버림])
+    '''
+    current_age = np.asarray(current_age, dtype=int)
+    period = target_age + EXTRA_YEARS + 1 - current_age
+    years = np.arange(period.max(initial=0))
+    ages = current_age[:, None] + years
+    annual_income = np.where(ages < np.asarray(retire_age)[:, None], (np.asarray(saving, dtype=float) * 12)[:, None], 0.0)
+    annual_cost = (np.asarray(rounds, dtype=float) * np.asarray(cost_per_round, dtype=float) * 12)[:, None]
+    balance = _balances(assets, annual_income, annual_cost, years)
+
+    below_zero = (balance < 0) & (years < period[:, None])
+    first = below_zero.argmax(axis=1)
+    bankruptcy_age = np.where(below_zero.any(axis=1), current_age + first, target_age + 1)
+    target_idx = np.clip(target_age - current_age, 0, max(len(years) - 1, 0))[:, None]
+    return bankruptcy_age, np.trunc(np.take_along_axis(balance, target_idx, axis=1)[:, 0])
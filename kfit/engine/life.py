@@ -0,0 +1,513 @@
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ._compound import compound
+from .portfolio import SELL, STRATEGY_LABELS, Portfolio, columns_from_records, strategy_code
+
+# ==========================================
+# 은퇴 시뮬레이션 엔진 (Wannabe Life Plan)
+# ==========================================
+EOK = 100000000   # 1억 (원)
+MAN = 10000       # 1만 (원)
+SELL_STRATEGY = STRATEGY_LABELS[SELL]  # "매각 (Sell)"
+CAPITAL_GAINS_TAX_RATE = 0.25
+
+# 라이프스타일 선택값 → 연간 횟수 / 회당 비용
+GOLF_ROUNDS_PER_YEAR = {"안 함": 0, "월 1회": 12, "월 2회": 24, "월 4회": 48, "VIP": 100}
+TRAVEL_TRIPS_PER_YEAR = {"안 함": 0, "연 1회": 1, "연 2회": 2, "분기별": 4}
+GOLF_COST_PER_ROUND = 400000
+TRAVEL_COST_PER_TRIP = 4000000
+
+# 점수 구간: (기대수명 - 고갈나이) 상한, 점수, 등급
+SCORE_BANDS = (
+    (0, 90, "안정 (Stable)"),
+    (5, 70, "주의 (Caution)"),
+    (10, 50, "위험 (Danger)"),
+)
+SCORE_PERFECT = (100, "완벽 (Perfect)")
+SCORE_CRITICAL = (30, "심각 (Critical)")
+
+# 몬테카를로: 연 수익률 하한 (누적곱이 0 이하로 떨어지지 않도록)
+MIN_ANNUAL_RETURN = -0.95
+
+# 배치 입력 컬럼 순서 (2차원 배열일 때)
+PROFILE_COLUMNS = (
+    "current_age", "retire_age", "death_age",
+    "liquid_billions", "monthly_save", "monthly_spend",
+    "inflation", "return_rate", "annual_hobby_cost",
+)
+
+
+def annual_hobby_cost(golf_freq: str, travel_freq: str) -> int:
+    '''골프/여행 선택값 → 연간 취미 비용(원)'''
+    return (GOLF_ROUNDS_PER_YEAR[golf_freq] * GOLF_COST_PER_ROUND
+            + TRAVEL_TRIPS_PER_YEAR[travel_freq] * TRAVEL_COST_PER_TRIP)
+
+
+@dataclass
+class MonteCarloResult:
+    ages: list                 # 나이 축
+    depletion_prob: np.ndarray # 해당 나이까지 현금이 한 번이라도 고갈된 경로 비율 (0~1)
+    p10: np.ndarray            # 유동자산 하위 10% (억)
+    p50: np.ndarray            # 유동자산 중앙값 (억)
+    p90: np.ndarray            # 유동자산 상위 10% (억)
+
+
+class WannabeEngine:
+    def __init__(self, current_age: int, retire_age: int, death_age: int):
+        self.current_age = current_age
+        self.retire_age = retire_age
+        self.death_age = death_age
+        self.period = death_age - current_age + 1
+
+    def run_simulation(
+        self, liquid_billions, monthly_save, monthly_spend,
+        inflation, return_rate, properties_list, annual_hobby_cost, ledger=None
+    ):
+        '''
+        :param ledger: 같은 (현재 나이, 기간, 물가)용 PropertyLedger 를 주면 부동산은
+                       이전 호출과 달라진 항목만 계산해 합계에 반영한다
+        '''
+        liquid = liquid_billions * EOK
+        annual_save = monthly_save * 12 * MAN
+        base_annual_spend = (monthly_spend * 12 * MAN) + annual_hobby_cost
+
+        # 연차/나이/물가 벡터는 한 번만 만든다
+        years = np.arange(self.period)
+        ages = self.current_age + years
+        inflation_factor = (1 + inflation) ** years
+
+        # 1) 저축/지출 현금흐름 (은퇴 전 저축, 은퇴 후 물가 반영 지출)
+        cash_flow = np.where(
+            ages < self.retire_age,
+            float(annual_save),
+            -base_annual_spend * inflation_factor,
+        )
+
+        # 2) 부동산 순자산 궤적 + 매각 시점의 현금 유입
+        if ledger is not None:
+            if not ledger.matches(self.current_age, self.death_age, inflation):
+                raise ValueError("ledger가 현재 나이/기대 수명/물가 조건과 다릅니다")
+            real_estate, sale_cash = ledger.sync(properties_list)
+        else:
+            real_estate, sale_cash = self._property_totals(properties_list, years, inflation_factor)
+        cash_flow = cash_flow + sale_cash
+
+        # 3) 유동자산: L[i] = L[i-1]*(1+r) + CF[i] 을 누적곱으로 계산
+        current_liquid = compound(liquid, cash_flow, return_rate)
+
+        below_zero = np.flatnonzero(current_liquid < 0)
+        shortfall_age = int(ages[below_zero[0]]) if below_zero.size else None
+
+        return (
+            ages.tolist(),
+            (current_liquid / EOK).tolist(),
+            (real_estate / EOK).tolist(),
+            shortfall_age,
+        )
+
+    def run_monte_carlo(
+        self, liquid_billions, monthly_save, monthly_spend,
+        inflation, return_rate, properties_list, annual_hobby_cost,
+        n_paths=10000, return_vol=0.10, inflation_vol=0.01, seed=None
+    ):
+        '''
+        수익률/물가를 연도별 정규분포로 뽑아 n_paths개 경로를 (경로 × 연차) 행렬로 한 번에 계산
+        :param return_vol: 연 수익률 표준편차
+        :param inflation_vol: 연 물가상승률 표준편차
+        :param seed: 고정하면 같은 결과를 재현 (테스트/화면 재실행용)
+        '''
+        rng = np.random.default_rng(seed)
+        shape = (n_paths, self.period)
+        returns = np.maximum(rng.normal(return_rate, return_vol, shape), MIN_ANNUAL_RETURN)
+        inflations = rng.normal(inflation, inflation_vol, shape)
+
+        # 물가 누적 계수: 0년차는 1, 이후 경로별 누적곱 (결정론 모드의 (1+inf)**i 에 해당)
+        inflations[:, 0] = 0
+        inflation_factor = np.cumprod(1 + inflations, axis=1)
+
+        years = np.arange(self.period)
+        ages = self.current_age + years
+        base_annual_spend = (monthly_spend * 12 * MAN) + annual_hobby_cost
+        cash_flow = np.where(
+            ages < self.retire_age,
+            float(monthly_save * 12 * MAN),
+            -base_annual_spend * inflation_factor,
+        )
+
+        current_val, loan_amt, purchase_val, sell_idx = self._property_arrays(properties_list)
+        rows = np.flatnonzero(sell_idx >= 0)
+        if rows.size:
+            cols = sell_idx[rows]
+            sale_val = current_val[rows] * inflation_factor[:, cols]
+            capital_gain = sale_val - purchase_val[rows]
+            tax = np.where(capital_gain > 0, capital_gain * CAPITAL_GAINS_TAX_RATE, 0)
+            np.add.at(cash_flow, (slice(None), cols), sale_val - loan_amt[rows] - tax)
+
+        liquid = compound(liquid_billions * EOK, cash_flow, returns)
+
+        depleted = np.logical_or.accumulate(liquid < 0, axis=1)
+        p10, p50, p90 = np.percentile(liquid, [10, 50, 90], axis=0) / EOK
+        return MonteCarloResult(
+            ages=ages.tolist(),
+            depletion_prob=depleted.mean(axis=0),
+            p10=p10, p50=p50, p90=p90,
+        )
+
+    def _property_totals(self, properties_list, years, inflation_factor):
+        '''(자산 × 연차) 행렬로 전체 부동산을 한 번에 평가 → (순자산 합계, 매각 유입 합계)'''
+        real_estate = np.zeros(self.period)
+        sale_cash = np.zeros(self.period)
+        current_val, loan_amt, purchase_val, sell_idx = self._property_arrays(properties_list)
+        if not current_val.size:
+            return real_estate, sale_cash
+
+        gross_val = current_val[:, None] * inflation_factor
+        net_equity = np.maximum(0, gross_val - loan_amt[:, None])
+
+        is_sell = sell_idx >= 0
+        hold_until = np.where(is_sell, sell_idx, self.period)
+        real_estate = (net_equity * (years < hold_until[:, None])).sum(axis=0)
+
+        rows = np.flatnonzero(is_sell)
+        if rows.size:
+            cols = sell_idx[rows]
+            sale_val = gross_val[rows, cols]
+            capital_gain = sale_val - purchase_val[rows]
+            tax = np.where(capital_gain > 0, capital_gain * CAPITAL_GAINS_TAX_RATE, 0)
+            np.add.at(sale_cash, cols, sale_val - loan_amt[rows] - tax)
+        return real_estate, sale_cash
+
+    def _property_arrays(self, properties_list):
+        '''부동산 목록(Portfolio 또는 dict 목록) → (현재가, 대출, 매입가[원], 매각 연차 인덱스 or -1) 배열'''
+        if isinstance(properties_list, Portfolio):
+            columns = properties_list.engine_columns()
+        else:
+            columns = columns_from_records(properties_list)
+        current_val, loan, purchase_price, strategy, sell_age = columns
+        sell_idx = np.where(strategy == SELL, sell_age.astype(int) - self.current_age, -1)
+        sell_idx[(sell_idx < 0) | (sell_idx >= self.period)] = -1
+        purchase_val = np.where(sell_idx >= 0, purchase_price, 0) * EOK
+        return current_val * EOK, loan * EOK, purchase_val, sell_idx
+
+    def calculate_score(self, shortfall_age: Optional[int]) -> Tuple[int, str]:
+        if shortfall_age is None:
+            return SCORE_PERFECT
+
+        gap = self.death_age - shortfall_age
+        for limit, score, grade in SCORE_BANDS:
+            if gap <= limit:
+                return score, grade
+        return SCORE_CRITICAL
+
+
+# ==========================================
+# 부동산별 기여 벡터 장부 (증분 재계산)
+# ==========================================
+def property_fingerprint(prop):
+    '''계산에 쓰이는 값만으로 만든 부동산 식별 키 (이름 등 표시용 값은 제외, Portfolio 지문과 같은 형식)'''
+    return (
+        prop['current_val'], prop.get('loan', 0), prop['purchase_price'],
+        strategy_code(prop['strategy']), prop['sell_age'],
+    )
+
+
+class PropertyLedger:
+    '''
+    부동산마다 (순자산 궤적, 매각 현금 유입) 벡터를 지문별로 보관하고 합계를 유지한다.
+    목록에 하나가 추가되면 그 벡터만 계산해 더하고, 삭제되면 빼기만 한다.
+    벡터는 현재 나이 / 기대 수명 / 물가가 같을 때만 유효 (matches 로 확인).
+    '''
+
+    def __init__(self, current_age, death_age, inflation):
+        self.current_age = current_age
+        self.death_age = death_age
+        self.inflation = inflation
+        self.period = death_age - current_age + 1
+        self._inflation_factor = (1 + inflation) ** np.arange(self.period)
+        self._entries = {}  # 지문 → [개수, 순자산 벡터, 매각 유입 벡터]
+        self.equity = np.zeros(self.period)
+        self.sale_cash = np.zeros(self.period)
+        self.computed = 0  # 지금까지 새로 계산한 벡터 수 (확인용)
+        self._synced = (None, -1)  # 마지막으로 맞춘 (Portfolio, version)
+
+    def matches(self, current_age, death_age, inflation):
+        return (current_age, death_age, inflation) == (self.current_age, self.death_age, self.inflation)
+
+    def _contribution(self, fingerprint):
+        current_val, loan, purchase_price, strategy, sell_age = fingerprint
+        gross_val = current_val * EOK * self._inflation_factor
+        equity = np.maximum(0, gross_val - loan * EOK)
+        sale_cash = np.zeros(self.period)
+        sell_idx = sell_age - self.current_age if strategy == SELL else -1
+        if 0 <= sell_idx < self.period:
+            equity[sell_idx:] = 0
+            sale_val = gross_val[sell_idx]
+            capital_gain = sale_val - purchase_price * EOK
+            tax = capital_gain * CAPITAL_GAINS_TAX_RATE if capital_gain > 0 else 0
+            sale_cash[sell_idx] = sale_val - loan * EOK - tax
+        self.computed += 1
+        return equity, sale_cash
+
+    def sync(self, properties_list):
+        '''목록(Portfolio 또는 dict 목록)과 장부를 맞추고 (순자산 합계, 매각 유입 합계) 반환 (읽기 전용으로 사용)'''
+        if isinstance(properties_list, Portfolio):
+            if self._synced == (properties_list, properties_list.version):
+                return self.equity, self.sale_cash
+            wanted = properties_list.fingerprint_counts()
+            self._synced = (properties_list, properties_list.version)
+        else:
+            wanted = Counter(property_fingerprint(p) for p in properties_list if not p.get('is_sold', False))
+            self._synced = (None, -1)
+        current = Counter({fp: entry[0] for fp, entry in self._entries.items()})
+
+        for fp, count in (current - wanted).items():
+            entry = self._entries[fp]
+            self.equity -= entry[1] * count
+            self.sale_cash -= entry[2] * count
+            entry[0] -= count
+            if entry[0] == 0:
+                del self._entries[fp]
+        for fp, count in (wanted - current).items():
+            entry = self._entries.get(fp)
+            if entry is None:
+                entry = self._entries[fp] = [0, *self._contribution(fp)]
+            self.equity += entry[1] * count
+            self.sale_cash += entry[2] * count
+            entry[0] += count
+
+        if not self._entries:  # 빼기를 반복하며 쌓인 부동소수 오차 제거
+            self.equity[:] = 0
+            self.sale_cash[:] = 0
+        return self.equity, self.sale_cash
+
+
+# ==========================================
+# 단건 입력/결과 타입 (헤드리스 호출용)
+# ==========================================
+@dataclass(frozen=True)
+class LifeInputs:
+    current_age: int
+    retire_age: int
+    death_age: int
+    liquid_billions: float     # 유동자산 (억)
+    monthly_save: float        # 월 저축 (만원)
+    monthly_spend: float       # 월 생활비 (만원)
+    inflation: float           # 물가상승률 (0.03 = 3%)
+    return_rate: float         # 투자 수익률
+    annual_hobby_cost: float = 0             # 연간 취미 비용 (원)
+    properties: Sequence[dict] = field(default_factory=tuple)  # 부동산 목록 (dict 목록 또는 Portfolio)
+
+
+@dataclass
+class LifeProjection:
+    ages: List[int]
+    liquid: List[float]          # 유동자산 (억)
+    real_estate: List[float]     # 부동산 순자산 (억)
+    shortfall_age: Optional[int] # 현금 고갈 나이 (없으면 None)
+    score: int
+    grade: str
+
+
+def simulate_life(inputs: LifeInputs) -> LifeProjection:
+    '''LifeInputs 한 건 → 연도별 자산 추이 + 점수'''
+    engine = WannabeEngine(inputs.current_age, inputs.retire_age, inputs.death_age)
+    ages, liquid, real_estate, shortfall_age = engine.run_simulation(
+        inputs.liquid_billions, inputs.monthly_save, inputs.monthly_spend,
+        inputs.inflation, inputs.return_rate, inputs.properties, inputs.annual_hobby_cost,
+    )
+    score, grade = engine.calculate_score(shortfall_age)
+    return LifeProjection(ages, liquid, real_estate, shortfall_age, score, grade)
+
+
+# ==========================================
+# 배치 시뮬레이션 (상담 이력 일괄 재채점)
+# ==========================================
+@dataclass
+class BatchResult:
+    shortfall_age: np.ndarray  # 현금 고갈 나이 (고갈 없으면 NaN)
+    score: np.ndarray          # 은퇴 준비 점수
+    grade: np.ndarray          # 등급 문자열 (object 배열)
+
+    def to_frame(self, index=None):
+        import pandas as pd
+        return pd.DataFrame(
+            {"shortfall_age": self.shortfall_age, "score": self.score, "grade": self.grade},
+            index=index,
+        )
+
+
+def run_batch(profiles, properties=None, chunk_size: int = 20000) -> BatchResult:
+    '''
+    여러 고객 프로필을 한 번에 시뮬레이션
+    :param profiles: PROFILE_COLUMNS 순서의 2차원 배열 또는 같은 이름의 컬럼을 가진 DataFrame
+    :param properties: 행별 부동산 목록(dict 리스트)의 시퀀스 (없으면 부동산 미반영)
+    :param chunk_size: 한 번에 계산할 최대 행 수 (메모리 상한)
+    '''
+    columns = getattr(profiles, "columns", None)
+    if columns is not None:
+        data = profiles[list(PROFILE_COLUMNS)].to_numpy(dtype=float)
+    else:
+        data = np.asarray(profiles, dtype=float)
+    if data.ndim != 2 or data.shape[1] != len(PROFILE_COLUMNS):
+        raise ValueError(f"profiles는 (n, {len(PROFILE_COLUMNS)}) 형태여야 합니다: {data.shape}")
+
+    shortfall = np.full(len(data), np.nan)
+    for start in range(0, len(data), chunk_size):
+        stop = start + chunk_size
+        chunk_props = properties[start:stop] if properties is not None else None
+        shortfall[start:stop] = _batch_shortfall(data[start:stop], chunk_props)
+
+    death_age = data[:, PROFILE_COLUMNS.index("death_age")]
+    score, grade = score_batch(shortfall, death_age)
+    return BatchResult(shortfall_age=shortfall, score=score, grade=grade)
+
+
+def score_batch(shortfall_age, death_age):
+    '''calculate_score의 벡터 버전 (shortfall_age가 NaN이면 만점)'''
+    limits = np.array([band[0] for band in SCORE_BANDS])
+    scores = np.array([band[1] for band in SCORE_BANDS] + [SCORE_CRITICAL[0], SCORE_PERFECT[0]])
+    grades = np.array([band[2] for band in SCORE_BANDS] + [SCORE_CRITICAL[1], SCORE_PERFECT[1]], dtype=object)
+
+    gap = np.asarray(death_age, dtype=float) - shortfall_age
+    band = np.searchsorted(limits, gap, side="left")
+    band = np.where(np.isnan(shortfall_age), len(scores) - 1, band)
+    return scores[band], grades[band]
+
+
+def simulate_scenarios(scenarios: Sequence[LifeInputs]) -> List[LifeProjection]:
+    '''
+    같은 고객의 입력 변형 여러 건 (예: 은퇴 60세 vs 65세) 을 (시나리오 × 연차) 행렬 한 번으로 계산
+    :return: 입력 순서대로 LifeProjection (simulate_life 를 하나씩 부른 결과와 같음)
+    '''
+    if not scenarios:
+        return []
+    data = np.array([[getattr(s, column) for column in PROFILE_COLUMNS] for s in scenarios], dtype=float)
+    properties = [s.properties for s in scenarios]
+    current_age, death_age = data[:, 0], data[:, 2]
+    period = np.maximum(death_age - current_age + 1, 0).astype(int)
+
+    liquid, years, inflation_factor = _batch_liquid(data, period, properties)
+    equity = _batch_equity(properties, current_age, period, inflation_factor)
+    below_zero = (liquid < 0) & (years < period[:, None])
+    shortfall = np.where(below_zero.any(axis=1), current_age + below_zero.argmax(axis=1), np.nan)
+    score, grade = score_batch(shortfall, death_age)
+
+    return [
+        LifeProjection(
+            ages=list(range(int(current_age[i]), int(current_age[i]) + n)),
+            liquid=(liquid[i, :n] / EOK).tolist(),
+            real_estate=(equity[i, :n] / EOK).tolist(),
+            shortfall_age=None if np.isnan(shortfall[i]) else int(shortfall[i]),
+            score=int(score[i]),
+            grade=grade[i],
+        )
+        for i, n in enumerate(period)
+    ]
+
+
+def _batch_shortfall(data, properties=None):
+    current_age = data[:, 0]
+    period = (data[:, 2] - current_age + 1).astype(int)
+    if period.max(initial=0) <= 0:
+        return np.full(len(data), np.nan)
+    current_liquid, years, _ = _batch_liquid(data, period, properties)
+
+    below_zero = (current_liquid < 0) & (years < period[:, None])
+    first = below_zero.argmax(axis=1)
+    return np.where(below_zero.any(axis=1), current_age + first, np.nan)
+
+
+def _batch_liquid(data, period, properties=None):
+    '''(행 × 연차) 유동자산 궤적 (원) → (궤적, 연차, 물가 계수). 행의 기간(period)을 넘는 연차 값은 무시'''
+    current_age, retire_age = data[:, 0], data[:, 1]
+    liquid, monthly_save, monthly_spend = (data[:, i] for i in range(3, 6))
+    inflation, return_rate, hobby_cost = (data[:, i] for i in range(6, 9))
+
+    years = np.arange(period.max(initial=0))
+    ages = current_age[:, None] + years
+    inflation_factor = (1 + inflation[:, None]) ** years
+
+    cash_flow = np.where(
+        ages < retire_age[:, None],
+        (monthly_save * 12 * MAN)[:, None],
+        -((monthly_spend * 12 * MAN) + hobby_cost)[:, None] * inflation_factor,
+    )
+
+    if properties is not None:
+        rows, cols, amount = _sale_injections(properties, current_age, period, inflation_factor)
+        np.add.at(cash_flow, (rows, cols), amount)
+
+    return compound(liquid * EOK, cash_flow, return_rate[:, None]), years, inflation_factor
+
+
+def _batch_equity(properties, current_age, period, inflation_factor):
+    '''행별 부동산 목록 → (행 × 연차) 부동산 순자산 합계 (매각 연차부터 0, _property_totals 의 행렬 버전)'''
+    rows, current_val, loan, hold_until = [], [], [], []
+    for row, props in enumerate(properties):
+        for p in props or ():
+            if p.get('is_sold', False):
+                continue
+            idx = p['sell_age'] - current_age[row] if strategy_code(p['strategy']) == SELL else -1
+            rows.append(row)
+            current_val.append(p['current_val'])
+            loan.append(p.get('loan', 0))
+            hold_until.append(idx if 0 <= idx < period[row] else period[row])
+
+    equity = np.zeros(inflation_factor.shape)
+    if rows:
+        rows = np.array(rows, dtype=int)
+        gross_val = np.array(current_val, dtype=float)[:, None] * EOK * inflation_factor[rows]
+        net_equity = np.maximum(0, gross_val - np.array(loan, dtype=float)[:, None] * EOK)
+        held = np.arange(inflation_factor.shape[1]) < np.array(hold_until)[:, None]
+        np.add.at(equity, rows, net_equity * held)
+    return equity
+
+
+def _sale_injections(properties, current_age, period, inflation_factor):
+    '''행별 부동산 목록 → 매각 시점 현금 유입 (행, 연차, 금액)'''
+    rows, sell_idx, current_val, loan, purchase = [], [], [], [], []
+    for row, props in enumerate(properties):
+        for p in props or ():
+            if p.get('is_sold', False) or strategy_code(p['strategy']) != SELL:
+                continue
+            idx = p['sell_age'] - current_age[row]
+            if 0 <= idx < period[row]:
+                rows.append(row)
+                sell_idx.append(int(idx))
+                current_val.append(p['current_val'])
+                loan.append(p.get('loan', 0))
+                purchase.append(p['purchase_price'])
+
+    rows = np.array(rows, dtype=int)
+    cols = np.array(sell_idx, dtype=int)
+    sale_val = np.array(current_val, dtype=float) * EOK * inflation_factor[rows, cols]
+    capital_gain = sale_val - np.array(purchase, dtype=float) * EOK
+    tax = np.where(capital_gain > 0, capital_gain * CAPITAL_GAINS_TAX_RATE, 0)
+    return rows, cols, sale_val - np.array(loan, dtype=float) * EOK - tax
+
+
+def profiles_from_life_rows(rows):
+    '''
+    시트에서 내보낸 LifeData 행(DataFrame, 컬럼명 = LifeData 필드명) → (프로필 DataFrame, 부동산 목록)
+    '''
+    import pandas as pd
+    profiles = pd.DataFrame({
+        "current_age": rows["age"],
+        "retire_age": rows["retire_age"],
+        "death_age": rows["death_age"],
+        "liquid_billions": rows["asset"],
+        "monthly_save": rows["save"],
+        "monthly_spend": rows["spend"],
+        "inflation": rows["inflation_pct"].astype(float) / 100,
+        "return_rate": rows["rate_pct"].astype(float) / 100,
+        "annual_hobby_cost": [
+            annual_hobby_cost(g, t) for g, t in zip(rows["golf_freq"], rows["travel_freq"])
+        ],
+    }, index=rows.index)
+    properties = [json.loads(s) if isinstance(s, str) and s else [] for s in rows["props_json"]]
+    return profiles, properties
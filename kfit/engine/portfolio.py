@@ -0,0 +1,171 @@
+'''
+부동산 포트폴리오 (Wannabe Life Plan 의 st.session_state.properties)
+
+자산마다 dict 를 두는 대신 열(현재가/대출/매입가/전략/매각 나이)마다 numpy 배열 하나만 둔다.
+엔진은 복사 없이 배열 뷰를 읽고, props_json 직렬화는 내용이 바뀐 뒤 처음 요청될 때만 다시 한다.
+화면 코드는 지금처럼 p['name'] 식으로 읽을 수 있게 순회 시 dict 레코드를 돌려준다.
+'''
+import json
+from collections import Counter
+
+import numpy as np
+
+# 전략 코드 ↔ 화면/시트에 저장되는 문자열
+SELL, INHERIT = 0, 1
+STRATEGY_LABELS = ("매각 (Sell)", "상속 (Inherit)")
+INITIAL_CAPACITY = 8
+
+
+def strategy_code(label):
+    '''"매각 (Sell)" → SELL, 그 외 → INHERIT (엔진은 매각 여부만 구분)'''
+    return SELL if label == STRATEGY_LABELS[SELL] else INHERIT
+
+
+def columns_from_records(records):
+    '''dict 목록 → Portfolio.engine_columns 와 같은 배열 (Portfolio 를 거치지 않는 일회성 입력용)'''
+    held = [p for p in records if not p.get("is_sold", False)]
+    return (
+        np.array([p["current_val"] for p in held], dtype=np.float64),
+        np.array([p.get("loan", 0) for p in held], dtype=np.float64),
+        np.array([p["purchase_price"] for p in held], dtype=np.float64),
+        np.array([SELL if p["strategy"] == STRATEGY_LABELS[SELL] else INHERIT for p in held], dtype=np.int8),
+        np.array([p["sell_age"] for p in held], dtype=np.int16),
+    )
+
+
+def _number(value):
+    '''정수로 떨어지는 값은 int 로 (기존 props_json 과 같은 표기: 10.0 이 아니라 10)'''
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+class Portfolio:
+    '''열 단위 배열로 저장하는 부동산 목록 (append / pop / 순회는 기존 list 와 같은 모양)'''
+
+    __slots__ = (
+        "names", "current_val", "loan", "purchase_price", "strategy", "sell_age", "is_sold",
+        "_size", "version", "_json", "_json_version", "_counts", "_counts_version",
+    )
+    # 배열 열 이름 (억 단위 금액, 전략 코드, 매각 나이, 매각 완료 여부)
+    COLUMNS = ("current_val", "loan", "purchase_price", "strategy", "sell_age", "is_sold")
+    DTYPES = (np.float64, np.float64, np.float64, np.int8, np.int16, np.bool_)
+
+    def __init__(self, capacity=INITIAL_CAPACITY):
+        self.names = []
+        for column, dtype in zip(self.COLUMNS, self.DTYPES):
+            setattr(self, column, np.zeros(capacity, dtype=dtype))
+        self._size = 0
+        self.version = 0  # 변경될 때마다 +1 (직렬화/지문 캐시 무효화 기준)
+        self._json, self._json_version = "[]", 0
+        self._counts, self._counts_version = Counter(), 0
+
+    @classmethod
+    def from_records(cls, records):
+        '''기존 dict 목록 (세션/props_json) → Portfolio'''
+        records = list(records)
+        n = len(records)
+        portfolio = cls(max(n, INITIAL_CAPACITY))
+        if n:  # 열마다 한 번에 채운다 (행 단위 append 보다 빠름)
+            portfolio.names = [p["name"] for p in records]
+            portfolio.current_val[:n] = [p["current_val"] for p in records]
+            portfolio.loan[:n] = [p.get("loan", 0) for p in records]
+            portfolio.purchase_price[:n] = [p["purchase_price"] for p in records]
+            portfolio.strategy[:n] = [strategy_code(p["strategy"]) for p in records]
+            portfolio.sell_age[:n] = [p["sell_age"] for p in records]
+            portfolio.is_sold[:n] = [p.get("is_sold", False) for p in records]
+            portfolio._size = n
+            portfolio.version = 1
+        return portfolio
+
+    @classmethod
+    def from_json(cls, text):
+        return cls.from_records(json.loads(text) if text else [])
+
+    # ------------------------------------------
+    # 변경 (list.append / list.pop 대응)
+    # ------------------------------------------
+    def append(self, name, current_val, loan, purchase_price, strategy, sell_age, is_sold=False):
+        if self._size == len(self.current_val):
+            self._grow()
+        i = self._size
+        self.names.append(name)
+        self.current_val[i] = current_val
+        self.loan[i] = loan
+        self.purchase_price[i] = purchase_price
+        self.strategy[i] = strategy_code(strategy)
+        self.sell_age[i] = sell_age
+        self.is_sold[i] = is_sold
+        self._size += 1
+        self.version += 1
+
+    def pop(self, index=-1):
+        '''index 번째 자산을 빼고 그 레코드(dict)를 반환'''
+        record = self.record(index)
+        i = range(self._size)[index]
+        for column in self.COLUMNS:
+            values = getattr(self, column)
+            values[i:self._size - 1] = values[i + 1:self._size]
+        del self.names[i]
+        self._size -= 1
+        self.version += 1
+        return record
+
+    def _grow(self):
+        '''용량을 두 배로 (append 평균 O(1))'''
+        for column in self.COLUMNS:
+            values = getattr(self, column)
+            grown = np.zeros(max(2 * len(values), INITIAL_CAPACITY), dtype=values.dtype)
+            grown[:self._size] = values[:self._size]
+            setattr(self, column, grown)
+
+    # ------------------------------------------
+    # 읽기
+    # ------------------------------------------
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        return (self.record(i) for i in range(self._size))
+
+    def record(self, index):
+        '''index 번째 자산 → 기존 session_state.properties 와 같은 dict'''
+        i = range(self._size)[index]
+        return {
+            "name": self.names[i],
+            "current_val": _number(self.current_val[i]),
+            "loan": _number(self.loan[i]),
+            "purchase_price": _number(self.purchase_price[i]),
+            "strategy": STRATEGY_LABELS[self.strategy[i]],
+            "sell_age": int(self.sell_age[i]),
+            "is_sold": bool(self.is_sold[i]),
+        }
+
+    def engine_columns(self):
+        '''
+        엔진 입력: 보유 중인 자산의 (현재가, 대출, 매입가, 전략 코드, 매각 나이) 배열.
+        매각 완료분이 없으면 복사 없는 읽기 전용 뷰, 있으면 걸러낸 사본.
+        '''
+        n = self._size
+        held = None if not self.is_sold[:n].any() else ~self.is_sold[:n]
+        views = []
+        for column in self.COLUMNS[:-1]:
+            values = getattr(self, column)[:n]
+            if held is not None:
+                values = values[held]
+            values.flags.writeable = False
+            views.append(values)
+        return tuple(views)
+
+    def fingerprint_counts(self):
+        '''보유 중인 자산의 계산용 지문별 개수 (PropertyLedger.sync 용, 변경 시에만 다시 셈)'''
+        if self._counts_version != self.version:
+            self._counts = Counter(zip(*(values.tolist() for values in self.engine_columns())))
+            self._counts_version = self.version
+        return self._counts
+
+    def to_json(self):
+        '''props_json 문자열 (마지막 변경 이후 처음 호출될 때만 인코딩)'''
+        if self._json_version != self.version:
+            self._json = json.dumps(list(self), ensure_ascii=False)
+            self._json_version = self.version
+        return self._json
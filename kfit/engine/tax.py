@@ -0,0 +1,172 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+# ==========================================
+# 상속세 계산 엔진 (Wannabe Tax)
+# ==========================================
+# 과세표준 구간표: (구간 상한, 세율, 누진공제). 마지막 구간은 상한 없음.
+TAX_BRACKETS = (
+    (100000000, 0.1, 0),
+    (500000000, 0.2, 10000000),
+    (1000000000, 0.3, 60000000),
+    (3000000000, 0.4, 160000000),
+    (float("inf"), 0.5, 460000000),
+)
+BASIC_DEDUCTION = 500000000        # 일괄 공제
+SPOUSE_DEDUCTION_MIN = 500000000   # 배우자 공제 하한
+SPOUSE_DEDUCTION_MAX = 3000000000  # 배우자 공제 상한
+
+_UPPER = np.array([upper for upper, _, _ in TAX_BRACKETS[:-1]], dtype=float)
+_RATE = np.array([rate for _, rate, _ in TAX_BRACKETS])
+_PROGRESSIVE = np.array([deduction for _, _, deduction in TAX_BRACKETS], dtype=float)
+
+
+def inheritance_tax(tax_base):
+    '''과세표준(스칼라 또는 배열) → 상속세. 구간은 searchsorted로 한 번에 찾는다'''
+    base = np.asarray(tax_base, dtype=float)
+    bracket = np.searchsorted(_UPPER, base, side="left")  # 상한 '이하'면 해당 구간
+    tax = np.where(base > 0, base * _RATE[bracket] - _PROGRESSIVE[bracket], 0.0)
+    return tax if tax.ndim else float(tax)
+
+
+def spouse_deduction(total_estate, spouse_share):
+    '''배우자 공제 = 실제 상속분을 하한/상한으로 자른 값 (spouse_share: 0~1)'''
+    return np.clip(np.asarray(total_estate, dtype=float) * spouse_share,
+                   SPOUSE_DEDUCTION_MIN, SPOUSE_DEDUCTION_MAX)
+
+
+@dataclass
+class EstateProjection:
+    years: np.ndarray         # 경과 연수 0..sim_years
+    real_estate: np.ndarray   # (..., 연수) 부동산 평가액
+    financial: np.ndarray     # (..., 연수) 금융자산 (세금 낼 현금)
+    taxes: np.ndarray         # (..., 연수) 그 해 상속 시 상속세
+    crisis_year: np.ndarray   # 상속세 > 현금이 처음 되는 연차 (없으면 -1)
+    shortage: np.ndarray      # 위기 연차의 부족 현금 (없으면 0)
+
+
+def project_estates(
+    real_estate, financial, deduction: float, sim_years: int, growth_re: float, growth_fin: float,
+) -> EstateProjection:
+    '''
+    자산 성장·연도별 상속세·유동성 위기 연차를 한 번에 계산
+    real_estate / financial 은 스칼라 또는 같은 모양의 배열 (여러 자산가를 동시에 평가)
+    '''
+    years = np.arange(sim_years + 1)
+    growth_re_path = np.concatenate(([1.0], np.cumprod(np.full(sim_years, 1 + growth_re))))
+    growth_fin_path = np.concatenate(([1.0], np.cumprod(np.full(sim_years, 1 + growth_fin))))
+
+    assets_re = np.asarray(real_estate, dtype=float)[..., None] * growth_re_path
+    assets_fin = np.asarray(financial, dtype=float)[..., None] * growth_fin_path
+    taxes = inheritance_tax(assets_re + assets_fin - deduction)
+
+    over = taxes > assets_fin
+    first = over.argmax(axis=-1)
+    has_crisis = over.any(axis=-1)
+    gap = np.take_along_axis(taxes - assets_fin, first[..., None], axis=-1)[..., 0]
+    return EstateProjection(
+        years=years,
+        real_estate=assets_re,
+        financial=assets_fin,
+        taxes=taxes,
+        crisis_year=np.where(has_crisis, first, -1),
+        shortage=np.where(has_crisis, gap, 0.0),
+    )
+
+
+@dataclass
+class SpouseShareCurve:
+    shares_pct: np.ndarray   # 배우자 상속 비율 후보 (%)
+    first_tax: np.ndarray    # 1차 상속세 (지금 사망 시)
+    second_tax: np.ndarray   # 2차 상속세 (sim_years 후 배우자 사망 시)
+    total_tax: np.ndarray    # 1차 + 2차
+    best_share_pct: float    # 총 상속세가 최소인 비율
+    best_total_tax: float
+
+
+def optimize_spouse_share(
+    real_estate: float, financial: float, sim_years: int,
+    growth_re: float, growth_fin: float, step_pct: float = 0.5,
+) -> SpouseShareCurve:
+    '''
+    배우자 상속 비율 0~100%(step_pct 간격)를 한 번에 평가해 1차+2차 상속세 합이 최소인 비율을 찾는다
+    real_estate / financial: 현재 자산 (원)
+    '''
+    shares_pct = np.linspace(0, 100, int(round(100 / step_pct)) + 1)
+    shares = shares_pct / 100
+    total_estate = real_estate + financial
+    re_ratio = real_estate / total_estate if total_estate > 0 else 0
+
+    first_tax = inheritance_tax(total_estate - BASIC_DEDUCTION - spouse_deduction(total_estate, shares))
+    spouse_take = (total_estate - first_tax) * shares
+    second = project_estates(
+        spouse_take * re_ratio, spouse_take * (1 - re_ratio), BASIC_DEDUCTION,
+        sim_years, growth_re, growth_fin,
+    )
+    second_tax = second.taxes[:, -1]
+    total_tax = first_tax + second_tax
+    best = int(total_tax.argmin())  # 동률이면 낮은 비율
+    return SpouseShareCurve(
+        shares_pct=shares_pct,
+        first_tax=first_tax,
+        second_tax=second_tax,
+        total_tax=total_tax,
+        best_share_pct=float(shares_pct[best]),
+        best_total_tax=float(total_tax[best]),
+    )
+
+
+# ==========================================
+# 행 단위 일괄 계산 (상담 이력 재계산)
+# ==========================================
+@dataclass
+class InheritanceResult:
+    tax_now: np.ndarray           # 현재 사망 시 (1차) 상속세
+    future_tax: np.ndarray        # sim_years 후 상속세 (배우자 있으면 2차)
+    future_cash: np.ndarray       # 그 시점 금융자산 (세금 낼 현금)
+    liquidity_crisis: np.ndarray  # 기간 중 상속세가 현금을 넘은 적이 있는지
+    shortage: np.ndarray          # 위기면 future_tax - future_cash, 아니면 0
+
+
+def inheritance_scenarios(real_estate, financial, has_spouse, spouse_share, sim_years, growth_re, growth_fin):
+    '''
+    Tax 화면의 계산(1차 상속 → 배우자 몫 성장 → 미래 상속세)을 고객 행 배열로 한 번에 수행
+    모든 인자는 같은 길이의 배열 (금액: 원, spouse_share / growth: 0~1, sim_years: 정수)
+    '''
+    real_estate = np.asarray(real_estate, dtype=float)
+    financial = np.asarray(financial, dtype=float)
+    has_spouse = np.asarray(has_spouse, dtype=bool)
+    share = np.where(has_spouse, spouse_share, 0.0)
+    sim_years = np.asarray(sim_years, dtype=int)
+
+    total = real_estate + financial
+    tax_now = inheritance_tax(total - BASIC_DEDUCTION - np.where(has_spouse, spouse_deduction(total, share), 0.0))
+
+    re_ratio = np.divide(real_estate, total, out=np.zeros_like(total), where=total > 0)
+    spouse_take = (total - tax_now) * share
+    start_re = np.where(has_spouse, spouse_take * re_ratio, real_estate)
+    start_fin = np.where(has_spouse, spouse_take - spouse_take * re_ratio, financial)
+
+    # 행마다 기간이 달라 가장 긴 기간으로 맞춘 뒤 기간 밖은 마스킹
+    horizon = int(sim_years.max(initial=0))
+    years = np.arange(horizon + 1)
+
+    def growth_path(rate):
+        steps = np.broadcast_to(1 + np.asarray(rate, dtype=float)[:, None], (len(total), horizon))
+        return np.concatenate((np.ones((len(total), 1)), np.cumprod(steps, axis=1)), axis=1)
+
+    assets_re = start_re[:, None] * growth_path(growth_re)
+    assets_fin = start_fin[:, None] * growth_path(growth_fin)
+    taxes = inheritance_tax(assets_re + assets_fin - BASIC_DEDUCTION)
+
+    crisis = ((taxes > assets_fin) & (years <= sim_years[:, None])).any(axis=1)
+    future_tax = np.take_along_axis(taxes, sim_years[:, None], axis=1)[:, 0]
+    future_cash = np.take_along_axis(assets_fin, sim_years[:, None], axis=1)[:, 0]
+    return InheritanceResult(
+        tax_now=tax_now,
+        future_tax=future_tax,
+        future_cash=future_cash,
+        liquidity_crisis=crisis,
+        shortage=np.where(crisis, future_tax - future_cash, 0.0),
+    )
@@ -0,0 +1,191 @@
+'''
+상담 신청 열 저장소 (Parquet 데이터셋: <root>/<kind>/*.parquet, 스키마는 kfit.schema)
+
+    python -m kfit.leads export data/leads --since 2025-01-01 --until 2025-02-01
+    python -m kfit.leads scan data/leads tax --columns name,is_liquidity_crisis --since 2025-01-01
+
+export: outbox(상담 신청 원본, data/outbox.sqlite3)의 기간 내 행을 kind 별 파일 하나로 내보낸다.
+        같은 기간을 다시 내보내면 그 파일을 덮어쓴다.
+분석 작업은 scan_leads() 로 필요한 열/기간만 읽는다 (열 투영 + 행 그룹 통계로 거르기, JSON 파싱 없음).
+'''
+import argparse
+import os
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from kfit.schema import CREATED_AT, CURRENT_VERSION, file_version, get_schema, utc_datetime
+
+ROW_GROUP_SIZE = 10000   # 행 그룹 하나의 행 수 (기간/값 거르기의 단위)
+COMPRESSION = "zstd"
+
+
+class LeadWriter:
+    '''상담 신청을 모아 row_group_size 행마다 행 그룹 하나씩 기록 (kind 별 파일 하나, close 때 완성)'''
+
+    def __init__(self, root, kind, row_group_size=ROW_GROUP_SIZE, name=None):
+        '''
+        :param root: 데이터셋 폴더 (파일은 root/kind/ 아래)
+        :param name: 파일 이름 (생략 시 part-<UTC 시각>-<임의값>.parquet)
+        '''
+        self.schema = get_schema(kind)
+        if name is None:
+            name = f"part-{datetime.now(timezone.utc):%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}.parquet"
+        self.path = os.path.join(root, kind, name)
+        # 쓰는 중에는 "." 로 시작하는 임시 파일 (데이터셋 스캔에서 제외) → close 때 이름 변경
+        self._tmp_path = os.path.join(root, kind, f".{name}.tmp")
+        self.row_group_size = row_group_size
+        self.rows = 0
+        self._records = []
+        self._created = []
+        self._writer = None
+
+    def append(self, lead, created_at):
+        '''데이터 모델 인스턴스 (GolfData 등) 하나 추가'''
+        self._add(self.schema.model_to_record(lead), created_at)
+
+    def append_payload(self, data_list, created_at):
+        '''to_payload() 순서 목록 (outbox / 시트 행) 하나 추가'''
+        self._add(self.schema.payload_to_record(data_list), created_at)
+
+    def _add(self, record, created_at):
+        self._records.append(record)
+        self._created.append(created_at)
+        if len(self._records) >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        '''모인 레코드를 행 그룹으로 기록'''
+        if not self._records:
+            return
+        table = self.schema.table(self._records, self._created)
+        if self._writer is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._writer = pq.ParquetWriter(self._tmp_path, self.schema.arrow_schema, compression=COMPRESSION)
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+        self.rows += len(self._records)
+        self._records, self._created = [], []
+
+    def close(self):
+        '''남은 레코드 기록 후 파일 완성 (한 행도 없으면 파일을 만들지 않는다)'''
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            os.replace(self._tmp_path, self.path)
+
+    def abort(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            os.remove(self._tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def _check_files(paths, kind):
+    '''파일마다 스키마 메타데이터 확인: 다른 kind / 모르는(더 새) 버전이면 ValueError'''
+    current = get_schema(kind).version
+    for path in paths:
+        file_kind, version = file_version(pq.read_schema(path))
+        if file_kind != kind or version is None or version > current:
+            raise ValueError(f"{path}: schema {file_kind} v{version} cannot be read as {kind} v{current}")
+
+
+def scan_leads(root, kind, columns=None, filter=None, since=None, until=None, batch_size=None):
+    '''
+    상담 신청 데이터셋을 지연 스캔하는 pyarrow Scanner (to_table / to_batches / to_reader 로 읽음)
+    :param columns: 읽을 열 (모델 필드명 가능: props_json → properties). 생략하면 전체
+    :param filter: pyarrow.dataset 식 (예: ds.field("score") < 60)
+    :param since: 신청 시각 하한 (포함, date / datetime / epoch 초)
+    :param until: 신청 시각 상한 (미포함)
+    '''
+    schema = get_schema(kind)
+    directory = os.path.join(root, kind)
+    dataset = ds.dataset(directory if os.path.isdir(directory) else [], schema=schema.arrow_schema, format="parquet")
+    _check_files(dataset.files, kind)
+
+    created_at = ds.field(CREATED_AT.name)
+    for bound, compare in ((since, created_at.__ge__), (until, created_at.__lt__)):
+        if bound is not None:
+            condition = compare(utc_datetime(bound))
+            filter = condition if filter is None else filter & condition
+    if columns is not None:
+        columns = [schema.column_name(c) for c in columns]
+    options = {} if batch_size is None else {"batch_size": batch_size}
+    return dataset.scanner(columns=columns, filter=filter, **options)
+
+
+def export_outbox(store, root, since, until=None, row_group_size=ROW_GROUP_SIZE):
+    '''
+    outbox 의 [since, until) 신청을 kind 별 파일로 내보낸다 (파일명이 기간이라 다시 내보내면 덮어씀)
+    :param store: outbox.Outbox
+    :param until: 생략하면 since 다음 날
+    :return: {kind: 행 수}
+    '''
+    until = until or since + timedelta(days=1)
+    name = f"outbox-{since:%Y%m%d}-{until:%Y%m%d}.parquet"
+    writers = {}
+    try:
+        for record in store.find_by_date(since, until):
+            kind = record["app_type"]
+            if kind not in CURRENT_VERSION:
+                continue  # 스키마가 없는 app_type 은 내보내지 않는다
+            if kind not in writers:
+                writers[kind] = LeadWriter(root, kind, row_group_size, name=name)
+            writers[kind].append_payload(record["data_list"], record["created_at"])
+    except BaseException:
+        for writer in writers.values():
+            writer.abort()
+        raise
+    for writer in writers.values():
+        writer.close()
+    return {kind: writer.rows for kind, writer in writers.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="상담 신청 Parquet 내보내기 / 조회")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    export = sub.add_parser("export", help="outbox → Parquet (kind 별)")
+    export.add_argument("root", help="데이터셋 폴더")
+    export.add_argument("--since", type=date.fromisoformat, required=True, help="시작일 (포함)")
+    export.add_argument("--until", type=date.fromisoformat, help="종료일 (미포함, 기본: 시작일 다음 날)")
+    export.add_argument("--outbox", default=None, help="outbox 파일 (기본: KFIT_OUTBOX_PATH / data/outbox.sqlite3)")
+
+    scan = sub.add_parser("scan", help="열/기간을 골라 읽기")
+    scan.add_argument("root", help="데이터셋 폴더")
+    scan.add_argument("kind", choices=sorted(CURRENT_VERSION))
+    scan.add_argument("--columns", help="쉼표로 구분한 열 이름")
+    scan.add_argument("--since", type=date.fromisoformat)
+    scan.add_argument("--until", type=date.fromisoformat)
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        import outbox
+        store = outbox.Outbox(args.outbox or outbox.OUTBOX_PATH)
+        try:
+            counts = export_outbox(store, args.root, args.since, args.until)
+        finally:
+            store.close()
+        for kind, rows in sorted(counts.items()):
+            print(f"{kind}: {rows:,} rows")
+        return
+
+    columns = args.columns.split(",") if args.columns else None
+    table = scan_leads(args.root, args.kind, columns, since=args.since, until=args.until).to_table()
+    print(table.to_pandas().to_string(max_rows=20))
+    print(f"{table.num_rows:,} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+'''
+상담 신청 데이터 모델(GolfData / TaxData / LifeData)의 열 스키마 레지스트리
+
+to_payload() 의 위치 기반 목록(시트 컬럼 순서)과 Arrow/Parquet 열을 이름으로 잇는다.
+열 순서는 모델의 PAYLOAD_FIELDS, 열 타입은 dataclass 필드 타입에서 만든다.
+LifeData.props_json(JSON 문자열)은 JSON 을 풀지 않고 읽을 수 있도록 중첩 열(properties)로 저장한다.
+
+버전 규칙:
+    - 파일마다 스키마 메타데이터에 kind / 버전을 기록한다 (kfit.kind, kfit.schema_version).
+    - 열 추가는 버전을 올리고 새 열을 끝에 붙인다. 이전 버전 파일은 새 열이 null 로 읽힌다.
+    - 열 이름/타입 변경과 삭제는 하지 않는다 (필요하면 새 열 추가 + 이전 열 유지).
+      예외: 값을 잃지 않는 넓히기(int → float)는 버전을 올려 허용한다. 이전 버전 파일은 읽을 때 새 타입으로 바뀐다.
+    - 정수 열에 소수 값이 들어오면 잘라 쓰지 않고 ValueError (시트와 Parquet 값이 어긋나지 않도록).
+'''
+import dataclasses
+import json
+from datetime import date, datetime, timezone
+
+import pyarrow as pa
+
+from kfit.engine.portfolio import _number
+from models import GolfData, LifeData, TaxData
+
+KIND_KEY = b"kfit.kind"
+VERSION_KEY = b"kfit.schema_version"
+
+# 파이썬 필드 타입 → Arrow 타입
+ARROW_TYPES = {int: pa.int64(), float: pa.float64(), str: pa.string(), bool: pa.bool_()}
+
+# props_json 의 자산 하나 (kfit.engine.portfolio.Portfolio.record 와 같은 키)
+PROPERTY_TYPE = pa.struct([
+    ("name", pa.string()),
+    ("current_val", pa.float64()),
+    ("loan", pa.float64()),
+    ("purchase_price", pa.float64()),
+    ("strategy", pa.string()),
+    ("sell_age", pa.int16()),
+    ("is_sold", pa.bool_()),
+])
+CREATED_AT = pa.field("created_at", pa.timestamp("ms", tz="UTC"), nullable=False)  # 신청 시각
+
+
+def _phone(value):
+    '''시트용 "'" 접두어 제거 ("'010..." → "010...")'''
+    return str(value).lstrip("'") if value is not None else None
+
+
+def _properties(value):
+    '''props_json 문자열 → PROPERTY_TYPE 목록 (빠진 키는 기본값)'''
+    items = json.loads(value) if isinstance(value, str) and value else (value or [])
+    return [
+        {
+            "name": p.get("name"),
+            "current_val": p.get("current_val"),
+            "loan": p.get("loan", 0),
+            "purchase_price": p.get("purchase_price"),
+            "strategy": p.get("strategy"),
+            "sell_age": p.get("sell_age"),
+            "is_sold": bool(p.get("is_sold", False)),
+        }
+        for p in items
+    ]
+
+
+def properties_json(items):
+    '''properties 열 값 → 기존 props_json 문자열 (시트/엔진 입력으로 되돌릴 때, Portfolio.to_json 과 같은 표기)'''
+    return json.dumps(
+        [{key: _number(value) if isinstance(value, float) else value for key, value in p.items()} for p in items or []],
+        ensure_ascii=False,
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class LeadSchema:
+    '''한 모델의 한 버전 스키마 (열 이름/타입 + 값 변환)'''
+
+    kind: str
+    version: int
+    model: type
+    arrow_schema: pa.Schema
+    columns: tuple          # 모델 필드명 순서 (= PAYLOAD_FIELDS)
+    renames: dict           # 모델 필드명 → 열 이름 (props_json → properties)
+    converters: dict        # 모델 필드명 → 값 변환 함수
+
+    def column_name(self, field):
+        return self.renames.get(field, field)
+
+    def payload_to_record(self, data_list):
+        '''to_payload() 순서 목록 → {모델 필드명: 값}'''
+        if len(data_list) != len(self.columns):
+            raise ValueError(f"{self.kind} payload has {len(data_list)} values, schema v{self.version} expects {len(self.columns)}")
+        return dict(zip(self.columns, data_list))
+
+    def model_to_record(self, lead):
+        '''데이터 모델 인스턴스 → {모델 필드명: 값}'''
+        return {field: getattr(lead, field) for field in self.columns}
+
+    def table(self, records, created_at):
+        '''
+        레코드 목록 → 이 스키마의 Arrow Table (열 단위로 변환)
+        :param created_at: 레코드별 신청 시각 (epoch 초 또는 datetime)
+        '''
+        arrays = [pa.array([utc_datetime(t) for t in created_at], type=CREATED_AT.type)]
+        for field in self.columns:
+            convert = self.converters.get(field)
+            values = [r.get(field) for r in records]
+            if convert is not None:
+                values = [convert(v) for v in values]
+            arrow_type = self.arrow_schema.field(self.column_name(field)).type
+            if pa.types.is_integer(arrow_type):
+                values = _integral(self, field, values)
+            arrays.append(pa.array(values, type=arrow_type))
+        return pa.Table.from_arrays(arrays, schema=self.arrow_schema)
+
+
+INTEGRAL_TOLERANCE = 1e-9  # 부동소수 오차 허용 (상대값, 2.3 * 1e8 = 229999999.99999997)
+
+
+def _integral(schema, field, values):
+    '''
+    정수 열 값: pa.array 는 소수를 조용히 잘라 쓰므로(60.5 → 60) 직접 확인한다
+    부동소수 오차만큼 어긋난 값은 가장 가까운 정수로, 그 밖의 소수는 ValueError
+    '''
+    checked = []
+    for value in values:
+        if isinstance(value, float):
+            nearest = round(value)
+            if abs(value - nearest) > INTEGRAL_TOLERANCE * max(1.0, abs(value)):
+                raise ValueError(f"{schema.kind} v{schema.version} column {field!r} is integer, got {value!r}")
+            value = nearest
+        checked.append(value)
+    return checked
+
+
+def utc_datetime(value):
+    '''epoch 초 / datetime / date(그날 0시) → UTC datetime (시각 정보가 없으면 로컬 시각으로 해석)'''
+    if isinstance(value, datetime):
+        return value.astimezone(timezone.utc)
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day).astimezone(timezone.utc)
+    return datetime.fromtimestamp(float(value), tz=timezone.utc)
+
+
+def build_schema(kind, version, model, renames=None, types=None, converters=None):
+    '''
+    모델의 PAYLOAD_FIELDS / 필드 타입으로 LeadSchema 생성
+    :param renames: 모델 필드명 → 열 이름 (타입을 바꾸는 필드)
+    :param types: 열 이름 → Arrow 타입 (필드 타입 대신)
+    :param converters: 모델 필드명 → 값 변환 함수
+    '''
+    renames, types, converters = renames or {}, types or {}, dict(converters or {})
+    annotations = {f.name: f.type for f in dataclasses.fields(model)}
+    arrow_fields = [CREATED_AT]
+    for field in model.PAYLOAD_FIELDS:
+        name = renames.get(field, field)
+        arrow_fields.append(pa.field(name, types.get(name) or ARROW_TYPES[annotations[field]]))
+    metadata = {KIND_KEY: kind.encode(), VERSION_KEY: str(version).encode()}
+    converters.setdefault("phone", _phone)
+    return LeadSchema(kind, version, model, pa.schema(arrow_fields, metadata=metadata),
+                      tuple(model.PAYLOAD_FIELDS), renames, converters)
+
+
+# ==========================================
+# 레지스트리: (kind, 버전) → LeadSchema, kind → 현재 버전
+# ==========================================
+REGISTRY = {}
+CURRENT_VERSION = {}
+
+
+def register(schema):
+    key = (schema.kind, schema.version)
+    if key in REGISTRY:
+        raise ValueError(f"schema {schema.kind} v{schema.version} is already registered")
+    REGISTRY[key] = schema
+    CURRENT_VERSION[schema.kind] = max(CURRENT_VERSION.get(schema.kind, 0), schema.version)
+    return schema
+
+
+def get_schema(kind, version=None):
+    '''kind 의 스키마 (version 생략 시 현재 버전)'''
+    version = CURRENT_VERSION.get(kind) if version is None else version
+    try:
+        return REGISTRY[(kind, version)]
+    except KeyError:
+        raise ValueError(f"unknown schema {kind} v{version}") from None
+
+
+def file_version(arrow_schema):
+    '''파일 스키마 메타데이터 → (kind, 버전). 메타데이터가 없으면 (None, None)'''
+    metadata = arrow_schema.metadata or {}
+    if KIND_KEY not in metadata:
+        return None, None
+    return metadata[KIND_KEY].decode(), int(metadata[VERSION_KEY])
+
+
+register(build_schema("golf", 1, GolfData))
+register(build_schema("tax", 1, TaxData, types={"spouse_pct": pa.int64()}))
+register(build_schema("tax", 2, TaxData))  # spouse_pct: int64 → float64 (세금 최소 비율이 0.5% 단위)
+register(build_schema(
+    "life", 1, LifeData,
+    renames={"props_json": "properties"},
+    types={"properties": pa.list_(PROPERTY_TYPE)},
+    converters={"props_json": _properties},
+))
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List, Any
+from typing import List, Any, ClassVar, Tuple
 
 # ==========================================
 # 1. 골프 앱 데이터 모델 (Wannabe_Golf)
@@ -25,6 +25,12 @@ class GolfData:
     # 공통 메모
     memo: str = ""          # 상담 폼: "문의사항"
 
+    # 시트 컬럼 순서 (= to_payload 순서의 필드명)
+    PAYLOAD_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "name", "phone", "current_age", "retire_age", "assets", "saving",
+        "rounds", "cost", "bankruptcy_age", "result_msg", "memo",
+    )
+
     def to_payload(self) -> List[Any]:
         return [
             self.name, "'"+self.phone,
@@ -51,7 +57,7 @@ class TaxData:
     total_estate_eok: float    # 총 자산(원)을 1억으로 나눈 값
 
     has_spouse_str: str        # 배우자 유무 문자열 ("있음"/"없음")
-    spouse_pct: int            # "배우자 상속 비율 (%)"
+    spouse_pct: float          # "배우자 상속 비율 (%)" (세금 최소 비율 자동 적용 시 0.5% 단위)
     sim_years: int             # "시뮬레이션 기간 (년)"
     inflation_re_pct: float    # "부동산 연 상승률 (%)"
     inflation_fin_pct: float   # "금융자산 연 수익률 (%)"
@@ -63,6 +69,14 @@ class TaxData:
     # 공통 메모
     memo: str = ""                  # 상담 폼: "문의사항"
 
+    # 시트 컬럼 순서 (= to_payload 순서의 필드명)
+    PAYLOAD_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "name", "phone", "real_estate_billions", "financial_billions", "total_estate_eok",
+        "has_spouse_str", "spouse_pct", "sim_years", "inflation_re_pct", "inflation_fin_pct",
+        "calculated_tax_now", "calculated_future_tax", "calculated_future_cash",
+        "is_liquidity_crisis", "shortage_amount", "memo",
+    )
+
     def to_payload(self) -> List[Any]:
         return [
             self.name, "'"+self.phone,
@@ -122,6 +136,14 @@ class LifeData:
     # ── 7. 공통 메모 ───────────────────────────────
     memo: str = ""          # 상담 폼: 문의사항
 
+    # 시트 컬럼 순서 (= to_payload 순서의 필드명, 필드 선언 순서와 다름)
+    PAYLOAD_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "name", "phone", "age", "retire_age", "death_age",
+        "asset", "re_asset", "save", "rate_pct",
+        "props_str", "props_json", "spend", "golf_freq", "travel_freq",
+        "inflation_label", "inflation_pct", "score", "grade", "shortfall_txt", "memo",
+    )
+
     def to_payload(self) -> List[Any]:
         """
         구글 시트 컬럼 순서:
@@ -0,0 +1,366 @@
+import json
+import logging
+import os
+import random
+import re
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+import gas_client
+
+# ==========================================
+# 상담 신청 전송 대기열 (Outbox)
+# ==========================================
+# 폼 제출은 로컬 SQLite에 기록만 하고 즉시 반환한다.
+# 백그라운드 워커가 GAS로 전송하며, 성공 응답을 받은 뒤에만 sent 처리하므로
+# 전송 도중 프로세스가 죽어도 재시작 후 다시 보낸다 (at-least-once).
+# 같은 app_type의 행은 모아서 한 번의 요청(여러 행)으로 보낸다 (docs/gas_bulk_contract.md).
+# 보낸 행도 지우지 않는다: 상담 신청의 원본은 이 파일이고 시트는 사본이다.
+# 연락처/신청일로 조회할 수 있고, 시트를 다시 채워야 하면 requeue + replay 로 다시 보낸다
+# (tools/replay_outbox.py).
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_PATH = os.environ.get(
+    "KFIT_OUTBOX_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "outbox.sqlite3"),
+)
+POLL_INTERVAL = 0.5      # 대기열 확인 주기 (초)
+CLAIM_LEASE = 60.0       # 전송 중인 행을 다른 워커가 가져가지 않도록 잡아두는 기본 시간 (초)
+# 요청 한 번이 걸릴 수 있는 최대 시간 (초): 연결 재시도(+백오프)를 모두 쓰고 응답을 끝까지 기다린 경우
+SEND_LEASE = (gas_client.RETRIES + 1) * (gas_client.CONNECT_TIMEOUT + 1) + gas_client.READ_TIMEOUT
+BACKOFF_BASE = 2.0       # 재시도 대기: BACKOFF_BASE * 2^(시도횟수-1) 초
+BACKOFF_MAX = 600.0      # 재시도 대기 상한 (초)
+BATCH_SIZE = int(os.environ.get("KFIT_BATCH_SIZE", "50"))        # 이만큼 쌓이면 즉시 전송
+BATCH_WINDOW = float(os.environ.get("KFIT_BATCH_WINDOW", "2"))   # 가장 오래된 행이 이만큼(초) 기다렸으면 전송
+CHECKPOINT_INTERVAL = 30.0  # WAL 체크포인트 주기 (초): 폼 제출(쓰기) 대신 워커가 한가할 때 수행
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    app_type        TEXT    NOT NULL,
+    payload         TEXT    NOT NULL,
+    phone           TEXT,
+    created_at      REAL    NOT NULL,
+    attempts        INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL    NOT NULL,
+    sent_at         REAL,
+    last_error      TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox (sent_at, app_type, next_attempt_at);
+"""
+# 조회용 열/색인 (phone 열이 없던 이전 파일은 열을 추가하고 payload 에서 채운다)
+_LOOKUP_SCHEMA = """
+CREATE INDEX IF NOT EXISTS idx_outbox_phone ON outbox (phone, created_at);
+CREATE INDEX IF NOT EXISTS idx_outbox_created ON outbox (created_at);
+"""
+PHONE_INDEX = 1  # to_payload() 에서 연락처 위치 (모든 모델 공통, 시트용 "'" 접두어 포함)
+_RECORD_COLUMNS = "id, app_type, payload, phone, created_at, attempts, sent_at, last_error"
+
+
+def normalize_phone(phone):
+    '''"'010-6255-9978" → "01062559978" (숫자만 남겨 저장/조회)'''
+    return re.sub(r"\D", "", str(phone or ""))
+
+
+def _timestamp(value):
+    '''date(그날 0시) / datetime / 숫자(epoch) → epoch 초'''
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day).timestamp()
+    return float(value)
+
+
+def _record(row):
+    row_id, app_type, payload, phone, created_at, attempts, sent_at, last_error = row
+    return {
+        "id": row_id, "app_type": app_type, "data_list": json.loads(payload), "phone": phone,
+        "created_at": created_at, "attempts": attempts, "sent_at": sent_at, "last_error": last_error,
+    }
+
+
+class Outbox:
+    '''SQLite 기반 전송 대기열 (여러 스레드/프로세스에서 공유 가능)'''
+
+    def __init__(self, path=OUTBOX_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # 자동 체크포인트는 그때 쓰던 INSERT 를 수 ms~수십 ms 붙잡는다 → 워커가 checkpoint() 로 대신 수행
+        self._conn.execute("PRAGMA wal_autocheckpoint=0")
+        self._conn.execute("PRAGMA journal_size_limit=4194304")  # 다시 쓰기 시작한 WAL 파일은 4MB 로 줄인다
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+        self._conn.executescript(_LOOKUP_SCHEMA)
+
+    def _migrate(self):
+        '''이전 버전 파일에 phone 열 추가 + 기존 행의 연락처 채우기'''
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(outbox)")}
+        if "phone" in columns:
+            return
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.execute("ALTER TABLE outbox ADD COLUMN phone TEXT")
+            rows = self._conn.execute("SELECT id, payload FROM outbox").fetchall()
+            self._conn.executemany(
+                "UPDATE outbox SET phone = ? WHERE id = ?",
+                [(normalize_phone(_payload_phone(payload)), row_id) for row_id, payload in rows],
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def enqueue(self, app_type, data_list, phone=None):
+        '''
+        행 하나를 기록하고 id 반환 (디스크에 기록된 뒤 반환, 네트워크 전송 전)
+        :param phone: 조회용 연락처 (없으면 data_list[PHONE_INDEX])
+        '''
+        now = time.time()
+        payload = json.dumps(data_list, ensure_ascii=False)
+        if phone is None:
+            phone = data_list[PHONE_INDEX] if len(data_list) > PHONE_INDEX else ""
+        with self._lock:
+            cur = self._conn.execute(
+                "INSERT INTO outbox (app_type, payload, phone, created_at, next_attempt_at) VALUES (?, ?, ?, ?, ?)",
+                (app_type, payload, normalize_phone(phone), now, now),
+            )
+            return cur.lastrowid
+
+    # ------------------------------------------
+    # 조회 (연락처 / 신청일)
+    # ------------------------------------------
+    def find_by_phone(self, phone):
+        '''연락처(하이픈 등 무시)로 신청 내역 조회, 오래된 순'''
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_RECORD_COLUMNS} FROM outbox WHERE phone = ? ORDER BY created_at, id",
+                (normalize_phone(phone),),
+            ).fetchall()
+        return [_record(row) for row in rows]
+
+    def find_by_date(self, start, end=None):
+        '''
+        신청일로 조회 (start 이상 end 미만, 오래된 순)
+        :param start: date / datetime / epoch 초
+        :param end: 생략하면 start 가 date 일 때 그날 하루, 아니면 현재까지
+        '''
+        if end is None and isinstance(start, date) and not isinstance(start, datetime):
+            end = start + timedelta(days=1)
+        low, high = _timestamp(start), (time.time() + 1 if end is None else _timestamp(end))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_RECORD_COLUMNS} FROM outbox WHERE created_at >= ? AND created_at < ? ORDER BY created_at, id",
+                (low, high),
+            ).fetchall()
+        return [_record(row) for row in rows]
+
+    def claim_batches(self, batch_size=BATCH_SIZE, window=BATCH_WINDOW, lease=CLAIM_LEASE, per_row=SEND_LEASE):
+        '''
+        전송할 묶음을 app_type별로 가져오고, 전송이 끝날 때까지 다른 워커가 못 가져가게 표시
+        - batch_size 이상 쌓였거나, 가장 오래된 행이 window초 이상 기다린 app_type만 대상
+        - 묶음은 차례로 (단건 형식이면 한 행씩) 보내므로, 각 묶음은
+          lease + per_row * (앞 묶음까지 포함해 가져온 행 수) 동안 잡아둔다
+        :return: [(app_type, [(id, data_list, attempts), ...]), ...]
+        '''
+        now = time.time()
+        batches = []
+        claimed = 0
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                groups = self._conn.execute(
+                    "SELECT app_type, COUNT(*), MIN(created_at) FROM outbox "
+                    "WHERE sent_at IS NULL AND next_attempt_at <= ? GROUP BY app_type",
+                    (now,),
+                ).fetchall()
+                for app_type, count, oldest in groups:
+                    if count < batch_size and now - oldest < window:
+                        continue
+                    rows = self._conn.execute(
+                        "SELECT id, payload, attempts FROM outbox "
+                        "WHERE sent_at IS NULL AND app_type = ? AND next_attempt_at <= ? ORDER BY id LIMIT ?",
+                        (app_type, now, batch_size),
+                    ).fetchall()
+                    claimed += len(rows)
+                    self._conn.executemany(
+                        "UPDATE outbox SET next_attempt_at = ? WHERE id = ?",
+                        [(now + lease + per_row * claimed, row[0]) for row in rows],
+                    )
+                    batches.append((app_type, [(row_id, json.loads(payload), attempts) for row_id, payload, attempts in rows]))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return batches
+
+    def mark_sent(self, row_ids):
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE outbox SET sent_at = ?, attempts = attempts + 1, last_error = NULL WHERE id = ?",
+                [(time.time(), row_id) for row_id in row_ids],
+            )
+
+    def mark_failed(self, row_id, error, retry_at):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE outbox SET attempts = attempts + 1, next_attempt_at = ?, last_error = ? WHERE id = ?",
+                (retry_at, str(error)[:500], row_id),
+            )
+
+    def requeue(self, start=None, end=None, app_type=None):
+        '''
+        이미 보낸 행을 다시 미전송으로 (시트를 다시 채울 때). 바뀐 행 수 반환
+        :param start/end: 신청일 범위 (find_by_date 와 같은 형식, 생략하면 제한 없음)
+        '''
+        conditions, params = ["sent_at IS NOT NULL"], []
+        if start is not None:
+            conditions.append("created_at >= ?")
+            params.append(_timestamp(start))
+        if end is not None:
+            conditions.append("created_at < ?")
+            params.append(_timestamp(end))
+        if app_type is not None:
+            conditions.append("app_type = ?")
+            params.append(app_type)
+        with self._lock:
+            cur = self._conn.execute(
+                f"UPDATE outbox SET sent_at = NULL, next_attempt_at = ? WHERE {' AND '.join(conditions)}",
+                [time.time(), *params],
+            )
+            return cur.rowcount
+
+    def checkpoint(self):
+        '''
+        WAL 내용을 본 파일로 옮긴다. 별도 연결에서 PASSIVE 로 하므로
+        같은 프로세스의 enqueue(self._lock)나 다른 연결의 쓰기를 막지 않는다
+        '''
+        if self.path == ":memory:":
+            return
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+        finally:
+            conn.close()
+
+    def pending_count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM outbox WHERE sent_at IS NULL").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _payload_phone(payload):
+    data_list = json.loads(payload)
+    return data_list[PHONE_INDEX] if isinstance(data_list, list) and len(data_list) > PHONE_INDEX else ""
+
+
+def backoff_delay(attempts):
+    '''n번째 실패 후 대기 시간 (지수 증가 + 지터)'''
+    delay = min(BACKOFF_BASE * (2 ** max(attempts - 1, 0)), BACKOFF_MAX)
+    return delay * random.uniform(0.8, 1.2)
+
+
+class SubmissionWorker(threading.Thread):
+    '''Outbox를 비우는 백그라운드 전송 스레드'''
+
+    def __init__(self, outbox, send_batch, poll_interval=POLL_INTERVAL):
+        super().__init__(name="kfit-outbox-worker", daemon=True)
+        self.outbox = outbox
+        # send_batch(app_type, [data_list, ...]) -> (성공여부, 메시지[, 앞에서부터 저장된 행 수])
+        self.send_batch = send_batch
+        self.poll_interval = poll_interval
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+
+    def notify(self):
+        '''새 행이 들어왔음을 알림 (묶음이 다 찼으면 바로 전송)'''
+        self._wakeup.set()
+
+    def stop(self, timeout=5):
+        self._stopped.set()
+        self._wakeup.set()
+        self.join(timeout)
+
+    def run(self):
+        last_checkpoint = time.monotonic()
+        while not self._stopped.is_set():
+            try:
+                delivered = self.drain_once()
+                if not delivered and time.monotonic() - last_checkpoint >= CHECKPOINT_INTERVAL:
+                    self.outbox.checkpoint()
+                    last_checkpoint = time.monotonic()
+            except Exception:
+                logger.exception("outbox drain failed")
+                delivered = 0
+            if not delivered:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+
+    def drain_once(self, window=BATCH_WINDOW):
+        '''전송할 묶음을 한 번씩 보내고, 성공한 행 수 반환 (window=0 이면 덜 찬 묶음도 바로)'''
+        delivered = 0
+        for app_type, rows in self.outbox.claim_batches(window=window):
+            try:
+                result = self.send_batch(app_type, [data_list for _, data_list, _ in rows])
+            except Exception as e:
+                result = (False, str(e))
+            ok, msg = result[:2]
+            # 한 행씩 보내다 중간에 실패하면 이미 저장된 앞쪽 행은 sent 처리해 다시 보내지 않는다
+            saved = len(rows) if ok else (result[2] if len(result) > 2 else 0)
+            if saved:
+                self.outbox.mark_sent([row_id for row_id, _, _ in rows[:saved]])
+                delivered += saved
+            if ok:
+                continue
+            logger.warning("outbox batch of %s %s rows failed after %s: %s", len(rows), app_type, saved, msg)
+            for row_id, _, attempts in rows[saved:]:
+                self.outbox.mark_failed(row_id, msg, time.time() + backoff_delay(attempts + 1))
+        return delivered
+
+
+def replay(outbox, send_batch):
+    '''
+    지금 보낼 수 있는 미전송 행을 모두 묶음 전송 (워커 없이 한 번에, 실패한 묶음은 다음 재시도로 미룸)
+    :return: (보낸 행 수, 남은 미전송 행 수)
+    '''
+    drainer = SubmissionWorker(outbox, send_batch)
+    delivered = 0
+    while True:
+        sent = drainer.drain_once(window=0)
+        if not sent:
+            break
+        delivered += sent
+    return delivered, outbox.pending_count()
+
+
+_outbox = None
+_worker = None
+_init_lock = threading.Lock()
+
+
+def get_outbox(send_batch):
+    '''프로세스 공용 Outbox (처음 호출될 때 워커 스레드를 함께 시작)'''
+    global _outbox, _worker
+    with _init_lock:
+        if _outbox is None:
+            _outbox = Outbox()
+            _worker = SubmissionWorker(_outbox, send_batch)
+            _worker.start()
+    return _outbox
+
+
+def enqueue(app_type, data_list, send_batch, phone=None):
+    '''대기열에 기록하고 워커를 깨운 뒤 바로 반환'''
+    row_id = get_outbox(send_batch).enqueue(app_type, data_list, phone=phone)
+    _worker.notify()
+    return row_id
@@ -1,106 +1,12 @@
 import streamlit as st
-from utils import show_footer, hide_header
+from utils import show_footer
+import images
+import theme
 
 st.set_page_config(page_title="Company - Kfit", page_icon="🏢", layout="wide")
 
-hide_header()
-
-# 사이드바 강제 숨김
-st.markdown(
-    """
-    <style>
-    [data-testid="stSidebar"] {
-        display: none;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
-
-# 전역 스타일 (네비게이션, 배경, 카드, 미션 영역)
-st.markdown(
-    """
-    <style>
-    /* ✅ 전체 배경을 항상 흰색으로 고정 (다크모드에서도) */
-    .stApp {
-        background-color: #ffffff !important;
-        background-image: none !important;
-        color: #111827 !important;
-    }
-
-    /* 기본 텍스트 색을 어두운 색으로 강제 (다크모드 대비) */
-    html, body, [data-testid="stMarkdownContainer"] {
-        color: #111827 !important;
-    }
-
-    /* 네비게이션 스타일 */
-    [data-testid="stPageLink-NavLink"] {
-        background-color: transparent !important;
-        border: none !important;
-        box-shadow: none !important;
-        padding: 0px 10px !important;
-        margin: 0 !important;
-    }
-    [data-testid="stPageLink-NavLink"] p {
-        color: #555555 !important;
-        font-size: 1.3rem !important;
-        font-weight: 600 !important;
-        margin: 0 !important;
-        padding: 5px 10px !important;
-    }
-    [data-testid="stPageLink-NavLink"]:hover p {
-        color: #1E3A8A !important;
-        font-weight: 900 !important;
-        transform: scale(1.05);
-        transition: all 0.2s ease-in-out;
-    }
-
-    /* CEO 섹션 카드 스타일 */
-    .ceo-card {
-        background: linear-gradient(135deg, #ffffff 0%, #f9fafb 55%, #eff6ff 100%);
-        border-radius: 24px;
-        padding: 2.5rem 3rem;
-        box-shadow: 0 18px 40px rgba(15, 23, 42, 0.12);
-        margin-top: 1.5rem;
-        margin-bottom: 2.5rem;
-    }
-    .ceo-name {
-        font-weight: 700;
-        font-size: 1rem;
-        margin-top: 0.5rem;
-        color: #111827;
-    }
-    .ceo-title {
-        font-size: 0.85rem;
-        color: #6B7280;
-    }
-
-    /* Mission 영역 스타일 */
-    .mission-wrap {
-        text-align: center;
-        margin: 3rem 0 2.5rem 0;
-    }
-    .mission-label {
-        font-size: 0.9rem;
-        letter-spacing: 0.25em;
-        color: #6B7280;
-        text-transform: uppercase;
-        margin-bottom: 0.3rem;
-    }
-    .mission-text {
-        font-size: 2rem;
-        font-weight: 800;
-        color: #111827;
-    }
-    .mission-sub {
-        font-size: 0.95rem;
-        color: #6B7280;
-        margin-top: 0.4rem;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
+# 전역 스타일 (사이드바 숨김, 네비게이션, 배경, 카드, 미션 영역: assets/css)
+theme.apply("company")
 
 # 상단 네비게이션
 col_nav1, col_nav2, col_empty = st.columns([0.2, 0.2, 0.6])
@@ -125,11 +31,8 @@ with c1:
     # 내부 3컬럼으로 가운데 정렬
     left, center, right = st.columns([1, 1, 2])
     with right:
-        st.image(
-            "pages/ceo.jpg",  # 대표 사진 파일 경로
-            caption=None,
-            width=220,
-        )
+        # 대표 사진: 220px 표시용 변형본 (images.IMAGE_ASSETS, 원본 pages/ceo.jpg)
+        images.image("pages/ceo.jpg", width=220, alt="노일용 대표")
         # ✅ 이름 + 회사명을 하나의 블록으로 묶어서 정중앙 배치
         st.markdown(
             """
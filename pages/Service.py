@@ -1,59 +1,14 @@
 import streamlit as st
-from utils import show_footer, hide_header
-from apps import Wannabe_Golf, Wannabe_Tax, Wannabe_Life_Plan
+from utils import show_footer
+import theme
+from app_loader import APP_REGISTRY, load_app, prewarm
+import profiling
 
 st.set_page_config(page_title="Services - Kfit", page_icon="🚀", layout="wide")
+profiling.begin_rerun("service")  # KFIT_PROFILE / ?profile= 일 때만 동작
 
-hide_header()
-
-# [CSS] 사이드바 숨김 & 스타일링 & [NEW] 가로 스크롤 방지
-st.markdown("""
-    <style>
-    [data-testid="stSidebar"] { display: none; }
-    [data-testid="stSidebarCollapsedControl"] { display: none; }
-
-    /* [핵심 수정] 모바일 가로 스크롤(좌우 흔들림) 방지 */
-    html, body, [data-testid="stAppViewContainer"] {
-        overflow-x: hidden !important; /* 가로 넘침 숨김 */
-        max-width: 100vw !important;   /* 화면 폭을 뷰포트 너비로 제한 */
-        touch-action: pan-y !important; /* 터치 동작을 수직 스크롤로만 제한 (일부 브라우저 지원) */
-    }
-    
-    /* 컨텐츠 컨테이너도 가로 폭 제한 */
-    .block-container {
-        max-width: 100% !important;
-        overflow-x: hidden !important;
-        padding-left: 1rem !important; /* 모바일에서 너무 딱 붙지 않게 여백 조정 */
-        padding-right: 1rem !important;
-    }
-
-    [data-testid="stPageLink-NavLink"] { 
-        border: none !important; 
-        background: transparent !important; 
-        padding: 0px !important; 
-    }
-
-    /* 기본 상태 */
-    [data-testid="stPageLink-NavLink"] p { 
-        font-size: 1.2rem;            
-        font-weight: 600; 
-        color: var(--text-color); 
-        padding: 4px 6px;             
-        margin: 0; 
-        transition: all 0.15s ease-in-out; 
-    }
-
-    /* 호버 상태 */
-    [data-testid="stPageLink-NavLink"]:hover p { 
-        color: var(--primary-color) !important; 
-        font-weight: 900 !important; 
-        font-size: 1.2rem;            
-    }
-
-    /* 상단 여백 조정 */
-    .block-container { padding-top: 1rem !important; }
-    </style>
-""", unsafe_allow_html=True)
+# [CSS] 툴바/사이드바 숨김 & 스타일링 & 가로 스크롤 방지 (assets/css)
+theme.apply("service")
 
 
 # ==============================================================================
@@ -62,7 +17,7 @@ st.markdown("""
 query_params = st.query_params
 target_tool = query_params.get("tool", "life") 
 
-tool_options = ["Wannabe Life Plan", "Wannabe Tax", "Wannabe Golf"]
+tool_options = list(APP_REGISTRY)
 tool_map = {
     "life": 0,  
     "tax": 1,   
@@ -95,12 +50,13 @@ with left_col:
     st.markdown("---")
 
 with right_col:
-    if selected_app == "Wannabe Golf":
-        Wannabe_Golf.app(left_col)
-    elif selected_app == "Wannabe Tax":
-        Wannabe_Tax.app(left_col)
-    elif selected_app == "Wannabe Life Plan":
-        Wannabe_Life_Plan.app(left_col)
+    # 선택된 앱 모듈만 import (나머지는 첫 화면 이후 백그라운드에서 미리 로드)
+    with profiling.stage("load_app"):
+        app_module = load_app(selected_app)
+    with profiling.stage("app"):
+        app_module.app(left_col)
 
 
 show_footer()
+prewarm(exclude=(selected_app,))
+profiling.end_rerun(app=selected_app)
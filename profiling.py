@@ -0,0 +1,199 @@
+import cProfile
+import functools
+import io
+import json
+import logging
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+
+import streamlit as st
+
+try:
+    from pyinstrument import Profiler as _Pyinstrument  # 선택 의존성
+except ImportError:
+    _Pyinstrument = None
+
+# ==========================================
+# 재실행(rerun) 단위 구간별 시간 측정 (개발용, 기본 꺼짐)
+# ==========================================
+# 켜는 방법 (쉼표로 조합):
+#   KFIT_PROFILE=timing              구간별 시간만 기록
+#   KFIT_PROFILE=overlay             + 화면 하단에 결과 패널 표시
+#   KFIT_PROFILE=cprofile            + cProfile 캡처 (.prof 저장, 상위 함수 기록)
+#   KFIT_PROFILE=pyinstrument        + pyinstrument 캡처 (.html 저장, 설치된 경우)
+#   URL ?profile=overlay             해당 세션만 (timing/overlay 만 허용, 캡처는 환경변수로만)
+# 기록: KFIT_PROFILE_LOG (기본 data/profile.jsonl) 에 재실행마다 JSON 한 줄.
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = os.environ.get("KFIT_PROFILE", "")
+PROFILE_LOG = os.environ.get("KFIT_PROFILE_LOG", os.path.join("data", "profile.jsonl"))
+PROFILE_DIR = os.environ.get("KFIT_PROFILE_DIR", os.path.join("data", "profiles"))
+QUERY_MODES = {"timing", "overlay"}   # URL 로 켤 수 있는 모드 (파일 캡처 제외)
+TOP_FUNCTIONS = 15                    # 기록에 남길 cProfile 상위 함수 수
+
+_local = threading.local()  # 세션마다 스크립트가 별도 스레드에서 실행된다
+_log_lock = threading.Lock()
+
+
+def _parse_modes(value):
+    '''"overlay,cprofile" → {"timing", "overlay", "cprofile"} (하나라도 켜지면 timing 포함)'''
+    modes = {m.strip().lower() for m in str(value).split(",")} - {"", "0", "false", "off"}
+    if not modes:
+        return set()
+    return (modes - {"1", "true", "on"}) | {"timing"}
+
+
+def requested_modes():
+    '''환경변수 + URL 쿼리로 요청된 모드 집합 (비어 있으면 꺼짐)'''
+    modes = _parse_modes(PROFILE_ENV)
+    try:
+        query = st.query_params.get("profile")
+    except Exception:  # 스크립트 컨텍스트 밖 (배치/테스트)
+        query = None
+    if query:
+        modes |= _parse_modes(query) & QUERY_MODES
+    return modes
+
+
+class _Rerun:
+    def __init__(self, page, modes, tags):
+        self.page = page
+        self.modes = modes
+        self.tags = tags
+        self.stages = []   # [(이름, ms)] 끝난 순서
+        self.stack = []    # 진행 중인 구간 이름 (중첩 시 "app/engine")
+        self.profiler = None
+        self.started = time.perf_counter()
+
+
+def _current():
+    return getattr(_local, "rerun", None)
+
+
+def begin_rerun(page, **tags):
+    '''페이지 스크립트 맨 앞에서 호출. 꺼져 있으면 아무 것도 하지 않는다'''
+    previous = _current()
+    if previous is not None and previous.profiler is not None:
+        _stop_profiler(previous)  # st.rerun 등으로 end_rerun 없이 끝난 이전 실행 정리
+    _local.rerun = None
+
+    modes = requested_modes()
+    if not modes:
+        return
+    rerun = _Rerun(page, modes, tags)
+    if "pyinstrument" in modes and _Pyinstrument is not None:
+        rerun.profiler = _Pyinstrument()
+        rerun.profiler.start()
+    elif "cprofile" in modes or "pyinstrument" in modes:
+        if "pyinstrument" in modes:
+            logger.warning("pyinstrument is not installed; falling back to cProfile")
+        rerun.profiler = cProfile.Profile()
+        rerun.profiler.enable()
+    _local.rerun = rerun
+
+
+@contextmanager
+def _timed_stage(rerun, name):
+    rerun.stack.append(name)
+    full_name = "/".join(rerun.stack)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        rerun.stages.append((full_name, (time.perf_counter() - start) * 1000))
+        rerun.stack.pop()
+
+
+def stage(name):
+    '''with stage("engine"): ... 구간 시간 측정 (꺼져 있으면 빈 컨텍스트)'''
+    rerun = _current()
+    if rerun is None:
+        return nullcontext()
+    return _timed_stage(rerun, name)
+
+
+def timed(name):
+    '''함수 전체를 하나의 구간으로 측정하는 데코레이터'''
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _stop_profiler(rerun):
+    '''프로파일러를 멈추고 (저장 경로, 요약 텍스트) 반환'''
+    profiler, rerun.profiler = rerun.profiler, None
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    base = os.path.join(PROFILE_DIR, f"{datetime.now():%Y%m%d-%H%M%S-%f}-{rerun.page}")
+    if isinstance(profiler, cProfile.Profile):
+        profiler.disable()
+        path = base + ".prof"
+        profiler.dump_stats(path)
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+        return path, out.getvalue()
+    profiler.stop()
+    path = base + ".html"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(profiler.output_html())
+    return path, profiler.output_text(unicode=True)
+
+
+def end_rerun(**tags):
+    '''페이지 스크립트 맨 끝에서 호출: 기록 저장 + (overlay 모드면) 결과 패널 표시 (tags: 기록에 추가할 값)'''
+    rerun = _current()
+    _local.rerun = None
+    if rerun is None:
+        return None
+
+    total_ms = (time.perf_counter() - rerun.started) * 1000
+    stages = {}  # 같은 이름이 여러 번 나오면 합산
+    for name, ms in rerun.stages:
+        stages[name] = stages.get(name, 0.0) + ms
+    record = {
+        "ts": datetime.now().isoformat(timespec="milliseconds"),
+        "page": rerun.page,
+        **rerun.tags,
+        **tags,
+        "total_ms": round(total_ms, 2),
+        "stages": {name: round(ms, 2) for name, ms in stages.items()},
+    }
+    top_level = sum(ms for name, ms in stages.items() if "/" not in name)
+    record["unattributed_ms"] = round(total_ms - top_level, 2)
+
+    summary = None
+    if rerun.profiler is not None:
+        record["profile_path"], summary = _stop_profiler(rerun)
+
+    _write_record(record)
+    if "overlay" in rerun.modes:
+        _render_overlay(record, summary)
+    return record
+
+
+def _write_record(record):
+    try:
+        os.makedirs(os.path.dirname(PROFILE_LOG) or ".", exist_ok=True)
+        line = json.dumps(record, ensure_ascii=False)
+        with _log_lock, open(PROFILE_LOG, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+    except OSError:
+        logger.exception("failed to write profile record")
+
+
+def _render_overlay(record, summary):
+    with st.expander(f"⏱️ Profile: {record['total_ms']:.1f} ms", expanded=True):
+        rows = [f"| `{name}` | {ms:,.2f} |" for name, ms in record["stages"].items()]
+        rows.append(f"| *(기타)* | {record['unattributed_ms']:,.2f} |")
+        st.markdown("| 구간 | ms |\n|---|---:|\n" + "\n".join(rows))
+        if summary:
+            st.caption(record["profile_path"])
+            st.code(summary, language="text")
@@ -0,0 +1,68 @@
+import functools
+import hashlib
+import os
+import threading
+
+import streamlit as st
+
+# ==========================================
+# 화면 스타일시트 (assets/css → 해시 이름의 정적 CSS 파일)
+# ==========================================
+# 페이지/앱마다 재실행(rerun)마다 보내던 인라인 <style> 블록을 assets/css/*.css 로 옮겼다.
+# 화면별 묶음을 프로세스당 한 번 이어 붙여 static/ 에 내용 해시 이름으로 저장하고,
+# 재실행마다는 <link> 한 줄만 보낸다 (CSS 본문은 브라우저 캐시에서 읽음).
+# 여러 화면이 함께 쓰는 규칙(툴바/사이드바 숨김, 풋터)은 base.css 한 곳에만 둔다.
+# 정적 서빙(server.enableStaticServing)이 꺼져 있으면 묶음을 <style> 하나로 인라인.
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CSS_DIR = os.path.join(ROOT, "assets", "css")
+STATIC_DIR = os.path.join(ROOT, "static")
+
+# 화면별 묶음: assets/css 파일을 적힌 순서대로 이어 붙인다 (뒤 파일이 우선)
+# 앱(life/tax/golf)은 Service 페이지 안에서 그려지므로 base.css 없이 자기 규칙만
+BUNDLES = {
+    "home": ("base.css", "home.css"),
+    "company": ("base.css", "company.css"),
+    "service": ("base.css", "service.css"),
+    "life": ("life.css",),
+    "tax": ("tax.css",),
+    "golf": ("golf.css",),
+}
+
+
+def _sources(name):
+    return tuple(os.path.join(CSS_DIR, filename) for filename in BUNDLES[name])
+
+
+def bundle_css(name):
+    '''묶음 name 의 CSS 본문 (파일들을 이어 붙인 문자열)'''
+    parts = []
+    for path in _sources(name):
+        with open(path, encoding="utf-8") as f:
+            parts.append(f.read())
+    return "\n".join(parts)
+
+
+@functools.lru_cache(maxsize=32)
+def _bundle_tag(name, mtimes, static):
+    '''묶음 → 화면에 넣을 HTML (정적 서빙이면 <link>, 아니면 <style>). mtimes 는 파일 수정 시 캐시 무효화용'''
+    css = bundle_css(name)
+    if not static:
+        return f"<style>\n{css}</style>"
+    data = css.encode("utf-8")
+    filename = f"kfit-{name}.{hashlib.sha256(data).hexdigest()[:12]}.css"
+    path = os.path.join(STATIC_DIR, filename)
+    if not os.path.exists(path):
+        os.makedirs(STATIC_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"  # 다른 세션이 반쯤 쓴 파일을 받지 않도록 바꿔치기
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    return f'<link rel="stylesheet" href="app/static/{filename}">'
+
+
+def apply(name):
+    '''화면 스타일 적용 (재실행마다 호출: 같은 <link> 한 줄이라 전송량/DOM 변경이 거의 없다)'''
+    static = bool(st.get_option("server.enableStaticServing"))
+    mtimes = tuple(os.path.getmtime(path) for path in _sources(name))
+    st.markdown(_bundle_tag(name, mtimes, static), unsafe_allow_html=True)
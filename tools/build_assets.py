@@ -0,0 +1,48 @@
+'''
+페이지 이미지 변형본 미리 만들기 (배포 전 1회, 없으면 앱이 첫 사용 때 만든다)
+
+    python tools/build_assets.py [--force]
+
+images.IMAGE_ASSETS 의 원본마다 폭 × 포맷(AVIF/WebP/JPEG) 변형본을 static/img/ 에 내용 해시 이름으로
+저장하고 static/img/manifest.json 을 갱신한 뒤, 페이지 방문 1회당 이미지 바이트를 비교해 출력한다.
+'''
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import images  # noqa: E402
+
+# 브라우저가 고르는 파일: 표시 폭 × 화면 배율 이상인 가장 작은 변형본 (지원 포맷 중 우선 순위 순)
+DISPLAY_WIDTHS = {"pages/ceo.jpg": 220}
+
+
+def chosen(entry, fmt, width):
+    variants = sorted((v for v in entry["variants"] if v["format"] == fmt), key=lambda v: v["width"])
+    return next((v for v in variants if v["width"] >= width), variants[-1]) if variants else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--force", action="store_true", help="manifest 가 최신이어도 다시 만든다")
+    args = parser.parse_args()
+
+    manifest = images.build_all(force=args.force)
+    for source, entry in manifest.items():
+        original = os.path.getsize(os.path.join(images.ROOT, source))
+        print(f"{source}  ({entry['width']}x{entry['height']}, {original:,} bytes)")
+        for v in entry["variants"]:
+            print(f"  {v['file']:<40} {v['bytes']:>9,} bytes")
+        width = DISPLAY_WIDTHS.get(source)
+        if width is None:
+            continue
+        print(f"  방문 1회당 (표시 폭 {width}px): 원본 {original:,} bytes →")
+        for dpr in (1, 2, 3):
+            picks = [chosen(entry, fmt, width * dpr) for fmt, _, _ in images.FORMATS]
+            row = ", ".join(f"{v['format']} {v['bytes']:,}" for v in picks if v)
+            print(f"    배율 {dpr}x: {row}")
+
+
+if __name__ == "__main__":
+    main()
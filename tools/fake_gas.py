@@ -0,0 +1,106 @@
+'''
+구글 앱스 스크립트(GAS) 로컬 대역 서버 (전송 대기열/부하 테스트용)
+
+    python tools/fake_gas.py --port 8765 --fail-rate 0.2 --delay 0.5
+    KFIT_GAS_URL=http://127.0.0.1:8765/exec KFIT_GAS_BULK=1 streamlit run Home.py
+
+단건({"type", "payload"})과 일괄({"type", "rows"}) 요청을 모두 받으며
+(docs/gas_bulk_contract.md), 받은 요청은 --log 파일(JSONL)에 한 줄씩 기록한다.
+'''
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeGAS:
+    '''스레드로 띄우는 GAS 대역. received 에 받은 요청, rows 에 시트에 추가될 행이 쌓인다'''
+
+    def __init__(self, host="127.0.0.1", port=0, fail_rate=0.0, delay=0.0, log_path=None):
+        self.fail_rate = fail_rate
+        self.delay = delay
+        self.log_path = log_path
+        self.received = []
+        self.rows = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/exec"
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive 지원
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if fake.delay:
+                    time.sleep(fake.delay)
+                if random.random() < fake.fail_rate:
+                    return self.reply(500, b'{"result":"error"}')
+                try:
+                    payload = json.loads(body)
+                except ValueError:
+                    return self.reply(400, b'{"result":"bad request"}')
+                count = fake.record(payload)
+                self.reply(200, json.dumps({"result": "success", "count": count}).encode())
+
+            def reply(self, status, body):
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def record(self, payload):
+        rows = payload["rows"] if "rows" in payload else [payload.get("payload")]
+        with self._lock:
+            self.received.append(payload)
+            self.rows.extend(rows)
+            if self.log_path:
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        return len(rows)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GAS 로컬 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="500 응답 비율 (0~1)")
+    parser.add_argument("--delay", type=float, default=0.0, help="응답 지연 (초)")
+    parser.add_argument("--log", default="fake_gas.jsonl", help="받은 요청 기록 파일")
+    args = parser.parse_args()
+
+    fake = FakeGAS(args.host, args.port, args.fail_rate, args.delay, args.log)
+    print(f"fake GAS listening on {fake.url}")
+    try:
+        fake._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,416 @@
+'''
+Service 페이지 동시 세션 부하 테스트 (실제 Streamlit 서버 + 웹소켓 프로토콜)
+
+    python tools/loadtest.py --sessions 1,5,10,20 --reruns 20
+    python tools/loadtest.py --apps life --sessions 10 --think 0.5
+    python tools/loadtest.py --url http://127.0.0.1:8501 --pid 12345 --sessions 5
+
+--url 을 주지 않으면 빈 포트에 streamlit run Home.py 를 직접 띄운다
+(KFIT_GAS_URL = tools/fake_gas 대역, KFIT_OUTBOX_PATH = 임시 파일).
+앱 × 세션 수 단계마다 N 개의 헤드리스 세션(웹소켓 연결 하나씩)을 동시에 돌린다. 세션 하나는
+    1) ?tool=<앱> 으로 Service 페이지 첫 실행
+    2) 폼 밖의 슬라이더/숫자 입력을 무작위로 바꿔 --reruns 회 재실행 (Life Plan 은 중간중간 부동산 추가 폼 제출)
+    3) 마지막에 상담 신청 폼 제출 (→ outbox → GAS 대역)
+재실행 지연 = rerun 요청을 보낸 뒤 script_finished 를 받을 때까지.
+RSS/세션 = (단계 중 서버 최대 RSS − 단계 시작 전 RSS) / N  (Linux /proc 기준, --url 이면 --pid 필요).
+streamlit.testing.AppTest 는 전역 Runtime 을 바꿔 끼우므로 한 프로세스에서 동시에 돌릴 수 없어 쓰지 않는다.
+'''
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from tools.fake_gas import FakeGAS  # noqa: E402
+
+APPS = ("life", "tax", "golf")
+PAGE_NAME = "Service"
+RERUN_TIMEOUT = 60.0     # 재실행 하나가 이보다 오래 걸리면 실패로 센다 (초)
+RSS_INTERVAL = 0.2       # 서버 RSS 샘플링 간격 (초)
+PROPERTY_EVERY = 5       # Life Plan: 재실행 이 횟수마다 부동산 추가 폼 제출
+
+# 폼 라벨 (utils.render_common_form / apps/Wannabe_Life_Plan.py)
+PROPERTY_FORM = "prop_form"
+PROPERTY_SUBMIT = "➕ 자산 추가"
+PROPERTY_NAME = "자산명"
+LEAD_SUBMIT = "🚀 신청 완료 하기"
+LEAD_NAME = "성함"
+LEAD_PHONE = "연락처"
+LEAD_MEMO = "문의사항 (선택)"
+LEAD_AGREE = "개인정보 수집 및 이용에 동의합니다."
+
+# 무작위로 바꾸는 위젯 (폼 밖, disabled 아님)
+RANDOM_TYPES = ("slider", "number_input")
+WIDGET_TYPES = RANDOM_TYPES + ("selectbox", "radio", "button", "text_input", "text_area", "checkbox")
+
+
+class RerunFailed(Exception):
+    pass
+
+
+# ==========================================
+# 위젯 값 → WidgetState (브라우저 / AppTest 와 같은 표현)
+# ==========================================
+def set_state(ws, kind, value):
+    if kind == "slider":
+        ws.double_array_value.data[:] = [value]
+    elif kind == "number_input":
+        ws.double_value = value
+    elif kind == "button":
+        ws.trigger_value = True
+    elif kind == "checkbox":
+        ws.bool_value = value
+    else:  # selectbox / radio / text_input / text_area: 선택지/입력 문자열
+        ws.string_value = value
+
+
+def random_value(kind, proto, rng):
+    '''슬라이더/숫자 입력의 범위 안, step 에 맞춘 무작위 값 (정수형은 int)'''
+    step = proto.step or 1
+    low = proto.min if kind == "slider" or proto.has_min else 0
+    if kind == "slider" or proto.has_max:
+        high = proto.max
+    else:
+        # 상한이 없는 숫자 입력: 기본값의 두 배까지 (기본값이 0 이면 step 100 칸)
+        default = proto.default if proto.HasField("default") else low
+        high = max(default * 2, low + step * 100)
+    value = low + step * rng.randint(0, max(int((high - low) / step), 0))
+    if proto.data_type == proto.INT:
+        return int(round(value))
+    return round(value, 6)
+
+
+# ==========================================
+# 세션 하나 = 웹소켓 연결 하나
+# ==========================================
+class Session:
+    def __init__(self, ws_url, query_string):
+        self.ws_url = ws_url
+        self.query_string = query_string
+        self.widgets = {}       # 라벨 → (종류, proto)  (마지막 실행에서 그려진 위젯)
+        self.states = {}        # 위젯 id → (종류, 값)  (폼 밖 위젯: 브라우저처럼 매번 다시 보냄)
+        self.latencies = []     # 재실행 지연 (ms)
+        self.errors = 0         # 화면에 나온 예외 / 시간 초과
+        self.submitted = 0      # 상담 신청 성공 (st.balloons 표시)
+        self.properties = 0     # 부동산 추가 폼 제출
+        self._ws = None
+
+    async def connect(self):
+        self._ws = await websockets.connect(self.ws_url, subprotocols=["streamlit"], max_size=None)
+
+    async def close(self):
+        if self._ws is not None:
+            await self._ws.close()
+
+    async def rerun(self, once=None):
+        '''
+        유지 중인 위젯 값 + once(이번 실행에만: 폼 값 / 버튼)로 재실행하고 script_finished 까지 기다린다
+        :param once: [(종류, proto, 값)]
+        '''
+        msg = BackMsg()
+        msg.rerun_script.query_string = self.query_string
+        msg.rerun_script.page_name = PAGE_NAME
+        widget_states = msg.rerun_script.widget_states.widgets
+        for widget_id, (kind, value) in self.states.items():
+            ws = widget_states.add()
+            ws.id = widget_id
+            set_state(ws, kind, value)
+        for kind, proto, value in once or ():
+            ws = widget_states.add()
+            ws.id = proto.id
+            set_state(ws, kind, value)
+
+        start = time.perf_counter()
+        await self._ws.send(msg.SerializeToString())
+        try:
+            await asyncio.wait_for(self._receive(), RERUN_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.errors += 1
+            raise RerunFailed(f"rerun timed out after {RERUN_TIMEOUT:.0f}s") from None
+        self.latencies.append((time.perf_counter() - start) * 1000)
+
+    async def _receive(self):
+        widgets = {}
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(await self._ws.recv())
+            kind = fwd.WhichOneof("type")
+            if kind == "script_finished":
+                if fwd.script_finished == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    widgets = {}  # 앱의 st.rerun(): 이어지는 실행까지 한 번의 재실행으로 잰다
+                    continue
+                if fwd.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    self.errors += 1
+                self.widgets = widgets
+                return
+            if kind != "delta" or fwd.delta.WhichOneof("type") != "new_element":
+                continue
+            element = fwd.delta.new_element
+            element_type = element.WhichOneof("type")
+            if element_type == "exception":
+                self.errors += 1
+            elif element_type == "balloons":
+                self.submitted += 1
+            elif element_type in WIDGET_TYPES:
+                proto = getattr(element, element_type)
+                widgets[proto.label] = (element_type, proto)
+
+    def form_widgets(self, form_id):
+        return {label: w for label, w in self.widgets.items() if w[1].form_id == form_id}
+
+    # ---------- 사용자 동작 ----------
+    async def change_random(self, rng):
+        '''폼 밖 슬라이더/숫자 입력 하나를 무작위 값으로 바꿔 재실행'''
+        candidates = [
+            (kind, proto) for kind, proto in self.widgets.values()
+            if kind in RANDOM_TYPES and not proto.form_id and not proto.disabled
+            and not (kind == "slider" and len(proto.options))  # select_slider 제외
+        ]
+        if not candidates:
+            return await self.rerun()
+        kind, proto = rng.choice(candidates)
+        self.states[proto.id] = (kind, random_value(kind, proto, rng))
+        await self.rerun()
+
+    async def submit_form(self, form_id, values, submit_label, rng):
+        '''
+        폼 값 입력 + 제출 버튼 (values 에 없는 폼 위젯은 숫자/슬라이더는 무작위, 나머지는 기본값)
+        :param values: {라벨: 값}
+        '''
+        widgets = self.form_widgets(form_id)
+        once = []
+        for label, (kind, proto) in widgets.items():
+            if kind == "button":
+                continue
+            if label in values:
+                once.append((kind, proto, values[label]))
+            elif kind in RANDOM_TYPES:
+                once.append((kind, proto, random_value(kind, proto, rng)))
+            elif kind == "radio" and len(proto.options):
+                once.append((kind, proto, rng.choice(list(proto.options))))
+        submit = widgets.get(submit_label)
+        if submit is None:
+            raise RerunFailed(f"form {form_id!r} has no {submit_label!r} button")
+        once.append(("button", submit[1], True))
+        await self.rerun(once)
+
+    async def add_property(self, rng):
+        self.properties += 1
+        await self.submit_form(PROPERTY_FORM, {PROPERTY_NAME: f"부하{self.properties}"}, PROPERTY_SUBMIT, rng)
+
+    async def submit_lead(self, app, rng):
+        values = {
+            LEAD_NAME: f"부하테스트{rng.randint(0, 9999):04d}",
+            LEAD_PHONE: f"010{rng.randint(0, 99999999):08d}",
+            LEAD_MEMO: "loadtest",
+            LEAD_AGREE: True,
+        }
+        await self.submit_form(f"{app}_common_form", values, LEAD_SUBMIT, rng)
+
+
+async def run_session(ws_url, app, reruns, think, seed, opened):
+    '''세션 하나의 시나리오 (첫 실행 → 무작위 재실행 → 상담 신청)'''
+    rng = random.Random(seed)
+    session = Session(ws_url, f"tool={app}")
+    try:
+        await session.connect()
+        opened.append(session)
+        await session.rerun()
+        for i in range(1, reruns + 1):
+            if think:
+                await asyncio.sleep(rng.uniform(0, 2 * think))
+            if app == "life" and i % PROPERTY_EVERY == 0:
+                await session.add_property(rng)
+            else:
+                await session.change_random(rng)
+        await session.submit_lead(app, rng)
+    except (RerunFailed, OSError, websockets.WebSocketException) as e:
+        session.errors += 1
+        print(f"  [{app}] session failed: {e}", file=sys.stderr)
+    finally:
+        await session.close()
+    return session
+
+
+# ==========================================
+# 서버 / 측정
+# ==========================================
+def rss_bytes(pid):
+    '''프로세스 RSS (바이트, /proc 이 없으면 None)'''
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+async def sample_rss(pid, peak):
+    while True:
+        rss = rss_bytes(pid)
+        if rss is not None:
+            peak[0] = max(peak[0], rss)
+        await asyncio.sleep(RSS_INTERVAL)
+
+
+def percentile(samples, pct):
+    '''가장 가까운 순위 방식 백분위수'''
+    ordered = sorted(samples)
+    return ordered[max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))]
+
+
+async def run_step(ws_url, app, n, reruns, think, pid, seed):
+    '''N 개 세션 동시 실행 → 결과 한 줄 (dict)'''
+    baseline = rss_bytes(pid) if pid else None
+    peak = [baseline or 0]
+    sampler = asyncio.create_task(sample_rss(pid, peak)) if baseline is not None else None
+    opened = []
+    start = time.perf_counter()
+    sessions = await asyncio.gather(*(
+        run_session(ws_url, app, reruns, think, seed + i, opened) for i in range(n)
+    ))
+    elapsed = time.perf_counter() - start
+    if sampler is not None:
+        sampler.cancel()
+
+    latencies = [ms for s in sessions for ms in s.latencies]
+    return {
+        "app": app,
+        "sessions": n,
+        "reruns": len(latencies),
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+        "p50": percentile(latencies, 50) if latencies else None,
+        "p95": percentile(latencies, 95) if latencies else None,
+        "p99": percentile(latencies, 99) if latencies else None,
+        "mean": statistics.fmean(latencies) if latencies else None,
+        "errors": sum(s.errors for s in sessions),
+        "submitted": sum(s.submitted for s in sessions),
+        "rss_base": baseline,
+        "rss_per_session": (peak[0] - baseline) / n if baseline is not None else None,
+    }
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port, gas_url, outbox_path):
+    '''streamlit run Home.py 를 띄우고 /_stcore/health 가 응답할 때까지 기다린다'''
+    env = dict(os.environ, KFIT_GAS_URL=gas_url, KFIT_OUTBOX_PATH=outbox_path)
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", "Home.py", "--server.headless", "true",
+         "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"streamlit exited with code {proc.returncode}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return proc
+        except OSError:
+            time.sleep(0.3)
+    proc.terminate()
+    raise RuntimeError("streamlit did not become healthy within 60s")
+
+
+def wait_for_rows(fake, expected, timeout):
+    '''outbox 워커가 GAS 대역으로 다 보낼 때까지 대기 → 받은 행 수'''
+    deadline = time.monotonic() + timeout
+    while len(fake.rows) < expected and time.monotonic() < deadline:
+        time.sleep(0.2)
+    return len(fake.rows)
+
+
+def _mb(value):
+    return f"{value / 1024 / 1024:.1f}" if value is not None else "-"
+
+
+def _ms(value):
+    return f"{value:.0f}" if value is not None else "-"
+
+
+def print_row(row):
+    print(
+        f"{row['app']:<5} {row['sessions']:>4} {row['reruns']:>7} {row['throughput']:>9.1f}"
+        f" {_ms(row['p50']):>7} {_ms(row['p95']):>7} {_ms(row['p99']):>7}"
+        f" {row['errors']:>6} {row['submitted']:>6} {_mb(row['rss_base']):>8} {_mb(row['rss_per_session']):>8}",
+        flush=True,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="이미 떠 있는 서버 (생략하면 직접 띄움)")
+    parser.add_argument("--pid", type=int, help="--url 서버의 프로세스 id (RSS 측정용)")
+    parser.add_argument("--apps", default=",".join(APPS), help="쉼표로 구분 (life,tax,golf)")
+    parser.add_argument("--sessions", default="1,5,10,20", help="동시 세션 수 단계 (쉼표로 구분)")
+    parser.add_argument("--reruns", type=int, default=20, help="세션당 무작위 재실행 횟수 (첫 실행/폼 제출 제외)")
+    parser.add_argument("--think", type=float, default=0.0, help="재실행 사이 평균 대기 (초, 0~2배 무작위)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--gas-delay", type=float, default=0.0, help="GAS 대역 응답 지연 (초)")
+    parser.add_argument("--flush-timeout", type=float, default=30.0, help="끝난 뒤 GAS 전송 완료 대기 (초)")
+    args = parser.parse_args()
+
+    apps = [a.strip() for a in args.apps.split(",") if a.strip()]
+    unknown = set(apps) - set(APPS)
+    if unknown:
+        parser.error(f"unknown app: {', '.join(sorted(unknown))}")
+    steps = [int(n) for n in args.sessions.split(",")]
+
+    fake = proc = None
+    pid = args.pid
+    if args.url:
+        base = args.url.rstrip("/")
+    else:
+        fake = FakeGAS(delay=args.gas_delay).start()
+        workdir = tempfile.mkdtemp(prefix="kfit-loadtest-")
+        port = free_port()
+        proc = start_server(port, fake.url, os.path.join(workdir, "outbox.sqlite3"))
+        pid = proc.pid
+        base = f"http://127.0.0.1:{port}"
+    ws_url = base.replace("http", "ws", 1) + "/_stcore/stream"
+
+    try:
+        print(f"server {base}  (pid {pid or '-'})  reruns/session {args.reruns}  think {args.think}s")
+        print(f"{'app':<5} {'N':>4} {'reruns':>7} {'rerun/s':>9} {'p50':>7} {'p95':>7} {'p99':>7}"
+              f" {'errors':>6} {'leads':>6} {'RSS MB':>8} {'MB/sess':>8}")
+        submitted = 0
+        for app in apps:
+            # 앱 모듈 import / 캐시 채우기는 측정에서 뺀다
+            asyncio.run(run_step(ws_url, app, 1, 0, 0, None, args.seed))
+            for n in steps:
+                row = asyncio.run(run_step(ws_url, app, n, args.reruns, args.think, pid, args.seed))
+                submitted += row["submitted"]
+                print_row(row)
+        if fake is not None:
+            received = wait_for_rows(fake, submitted + len(apps), args.flush_timeout)
+            print(f"GAS 대역 수신: {received} rows (측정 신청 {submitted} + 준비 실행 {len(apps)})")
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=10)
+        if fake is not None:
+            fake.stop()
+
+
+if __name__ == "__main__":
+    main()
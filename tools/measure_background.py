@@ -0,0 +1,48 @@
+'''
+Home 배경 이미지가 재실행(rerun)마다 보내는 바이트 측정
+
+    python tools/measure_background.py [background.jpg]
+'''
+import base64
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils  # noqa: E402
+
+
+def legacy_css_bytes(path):
+    '''기존 방식: 원본 JPEG 전체를 base64로 매번 인라인'''
+    with open(path, "rb") as f:
+        encoded = base64.b64encode(f.read()).decode()
+    css = f"""
+             <style>
+             .stApp {{
+                 background: url(data:image/jpg;base64,{encoded});
+                 background-size: cover; background-position: center; background-repeat: no-repeat; background-attachment: fixed;
+             }}
+             </style>
+             """
+    return len(css.encode("utf-8"))
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else "background.jpg"
+    mtime = os.path.getmtime(path)
+    ext, variant = utils._background_asset(path, mtime, utils.BG_MAX_WIDTH, utils.BG_WEBP_QUALITY)
+    inline = utils._background_css(path, mtime, utils.BG_MAX_WIDTH, utils.BG_WEBP_QUALITY, False)
+    static = utils._background_css(path, mtime, utils.BG_MAX_WIDTH, utils.BG_WEBP_QUALITY, True)
+
+    rows = [
+        ("before: 원본 인라인 (rerun마다)", legacy_css_bytes(path)),
+        (f"after: {ext} 변형본 인라인 (rerun마다)", len(inline.encode("utf-8"))),
+        ("after: 정적 URL (rerun마다)", len(static.encode("utf-8"))),
+        (f"  + 정적 {ext} 파일 (브라우저 캐시, 최초 1회)", len(variant)),
+    ]
+    for label, size in rows:
+        print(f"{label:<45} {size:>12,} bytes")
+
+
+if __name__ == "__main__":
+    main()
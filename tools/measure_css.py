@@ -0,0 +1,37 @@
+'''
+화면별 스타일시트가 재실행(rerun)마다 보내는 바이트 측정
+
+    python tools/measure_css.py
+'''
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import theme  # noqa: E402
+
+# 각 페이지가 그리는 묶음 (Service 는 선택한 앱 하나를 함께 그린다)
+PAGES = {
+    "Home": ("home",),
+    "Company": ("company",),
+    "Service + Life Plan": ("service", "life"),
+    "Service + Tax": ("service", "tax"),
+    "Service + Golf": ("service", "golf"),
+}
+
+
+def tag_bytes(name, static):
+    mtimes = tuple(os.path.getmtime(path) for path in theme._sources(name))
+    return len(theme._bundle_tag(name, mtimes, static).encode("utf-8"))
+
+
+def main():
+    for page, bundles in PAGES.items():
+        inline = sum(tag_bytes(name, False) for name in bundles)
+        link = sum(tag_bytes(name, True) for name in bundles)
+        cached = sum(len(theme.bundle_css(name).encode("utf-8")) for name in bundles)
+        print(f"{page:<22} 인라인 {inline:>7,} → <link> {link:>5,} bytes/rerun  (+ CSS 파일 {cached:,} bytes, 브라우저 캐시)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+'''
+상담 신청 저장소(outbox) 조회 / 시트로 다시 보내기
+
+    python tools/replay_outbox.py                         미전송 행을 지금 GAS 로 묶음 전송
+    python tools/replay_outbox.py --resend --since 2025-01-01 [--until 2025-02-01] [--app-type life]
+                                                          이미 보낸 행도 다시 보냄 (시트 재구성, 중복 행 주의)
+    python tools/replay_outbox.py --phone 010-1234-5678   연락처로 조회만
+    python tools/replay_outbox.py --date 2025-01-15       신청일로 조회만
+
+KFIT_OUTBOX_PATH / KFIT_GAS_URL 환경변수를 앱과 똑같이 따른다.
+'''
+import argparse
+import os
+import sys
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import outbox  # noqa: E402
+
+
+def _print_records(records):
+    for r in records:
+        created = datetime.fromtimestamp(r["created_at"]).strftime("%Y-%m-%d %H:%M:%S")
+        status = "sent" if r["sent_at"] else f"pending (attempts={r['attempts']}, {r['last_error'] or '-'})"
+        print(f"#{r['id']:<6} {created}  {r['app_type']:<5} {r['phone']:<12} {status}")
+    print(f"{len(records)} rows")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--path", default=outbox.OUTBOX_PATH)
+    parser.add_argument("--phone", help="연락처로 조회")
+    parser.add_argument("--date", type=date.fromisoformat, help="신청일(YYYY-MM-DD)로 조회")
+    parser.add_argument("--resend", action="store_true", help="보낸 행을 미전송으로 되돌린 뒤 전송")
+    parser.add_argument("--since", type=date.fromisoformat, help="--resend 범위 시작일 (포함)")
+    parser.add_argument("--until", type=date.fromisoformat, help="--resend 범위 종료일 (미포함)")
+    parser.add_argument("--app-type", help="--resend 대상 app_type (life/tax/golf)")
+    args = parser.parse_args()
+
+    store = outbox.Outbox(args.path)
+    try:
+        if args.phone or args.date:
+            _print_records(store.find_by_phone(args.phone) if args.phone else store.find_by_date(args.date))
+            return
+        if args.resend:
+            print(f"requeued {store.requeue(args.since, args.until, args.app_type)} rows")
+
+        import utils  # GAS_URL / 전송 함수 (streamlit 을 함께 불러오므로 전송할 때만)
+        delivered, pending = outbox.replay(store, utils.send_batch_to_api)
+        print(f"delivered {delivered} rows, {pending} still pending")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
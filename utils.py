@@ -1,10 +1,21 @@
 import streamlit as st
 import base64
-import requests
-import json
+import functools
+import hashlib
+import io
+import os
+import threading
+import gas_client
+import outbox
+import profiling
 
-# [필수] 구글 앱스 스크립트(GAS) 배포 URL
-GAS_URL = "https://script.google.com/macros/s/AKfycbwF9R_qvwl1yhXaXsohYnTOBx1NR0s8tDNfzXL3jy8_WJm96RSiMBxS4tYFQAULSexu/exec"
+# [필수] 구글 앱스 스크립트(GAS) 배포 URL (로컬 테스트 시 KFIT_GAS_URL 로 대체)
+GAS_URL = os.environ.get(
+    "KFIT_GAS_URL",
+    "https://script.google.com/macros/s/AKfycbwF9R_qvwl1yhXaXsohYnTOBx1NR0s8tDNfzXL3jy8_WJm96RSiMBxS4tYFQAULSexu/exec",
+)
+# 일괄 형식({"type", "rows"})은 새 GAS 스크립트(docs/gas_bulk_contract.md) 배포를 확인한 뒤 KFIT_GAS_BULK=1 로 켠다
+GAS_BULK = os.environ.get("KFIT_GAS_BULK", "") == "1"
 
 def send_data_to_api(app_type, data_list):
     '''API 전송 함수'''
@@ -12,63 +23,113 @@ def send_data_to_api(app_type, data_list):
         return False, "utils.py에 GAS_URL을 입력해주세요."
     try:
         payload = {"type": app_type, "payload": data_list}
-        response = requests.post(GAS_URL, data=json.dumps(payload), headers={'Content-Type': 'application/json'})
+        response = gas_client.post_json(GAS_URL, payload)
         if response.status_code == 200: return True, "저장 성공"
         else: return False, f"서버 오류: {response.status_code}"
     except Exception as e: return False, f"전송 실패: {str(e)}"
 
-def set_bg_hack(main_bg):
-    '''Home 배경 설정'''
+def send_batch_to_api(app_type, rows):
+    '''
+    여러 행 일괄 전송 함수 (서버 규약: docs/gas_bulk_contract.md)
+    GAS_BULK 가 꺼져 있으면 기존 단건 형식으로 한 행씩 보낸다
+    :return: (성공여부, 메시지) / 한 행씩 보내다 실패하면 (False, 메시지, 앞에서부터 저장된 행 수)
+    '''
+    if "여기에" in GAS_URL:
+        return False, "utils.py에 GAS_URL을 입력해주세요."
+    if not GAS_BULK:
+        for i, data_list in enumerate(rows):
+            ok, msg = send_data_to_api(app_type, data_list)
+            if not ok:
+                return False, f"{i}/{len(rows)}행 저장 후 실패: {msg}", i
+        return True, "저장 성공"
+    try:
+        response = gas_client.post_json(GAS_URL, {"type": app_type, "rows": rows})
+        if response.status_code != 200:
+            return False, f"서버 오류: {response.status_code}"
+        # Apps Script 는 스크립트 예외도 200 + HTML 오류 페이지로 돌려주므로, 규약대로의 응답만 성공으로 본다
+        try:
+            result = response.json()
+        except ValueError:
+            return False, "서버 오류: JSON 이 아닌 응답"
+        if not isinstance(result, dict) or result.get("result") != "success":
+            message = result.get("message") if isinstance(result, dict) else None
+            return False, f"서버 오류: {message or repr(result)}"
+        if result.get("count") != len(rows):
+            return False, f"일부만 저장됨: {result.get('count')}/{len(rows)}"
+        return True, "저장 성공"
+    except Exception as e: return False, f"전송 실패: {str(e)}"
+
+def start_outbox_worker():
+    '''전송 워커를 바로 시작 (이전 프로세스가 못 보낸 행을 새 신청 없이도 보낸다)'''
+    return outbox.get_outbox(send_batch_to_api)
+
+# 앱 서버 안에서 처음 불러올 때 시작 (replay_outbox 같은 도구에서 불러올 때는 시작하지 않음)
+if st.runtime.exists():
+    start_outbox_worker()
+
+# 배경 이미지: 프로세스당 한 번만 인코딩하고, 가능하면 정적 파일 URL로 내려보낸다
+BG_MAX_WIDTH = 1920       # 축소 변형본 최대 가로 폭 (px), None이면 원본 그대로
+BG_WEBP_QUALITY = 75      # WebP 품질
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+@functools.lru_cache(maxsize=8)
+def _background_asset(main_bg, mtime, max_width, quality):
+    '''배경 이미지 → (확장자, 바이트). 축소/WebP 변환은 더 작아질 때만 사용'''
+    with open(main_bg, "rb") as f:
+        raw = f.read()
+    ext = os.path.splitext(main_bg)[1].lstrip(".").lower() or "jpg"
+    if max_width is None:
+        return ext, raw
     try:
-        main_bg_ext = "jpg"
-        st.markdown(
-             f"""
+        from PIL import Image
+    except ImportError:
+        return ext, raw
+
+    img = Image.open(io.BytesIO(raw))
+    img.thumbnail((max_width, max_width * 10))
+    buf = io.BytesIO()
+    img.save(buf, "WEBP", quality=quality)
+    variant = buf.getvalue()
+    return ("webp", variant) if len(variant) < len(raw) else (ext, raw)
+
+@functools.lru_cache(maxsize=8)
+def _background_css(main_bg, mtime, max_width, quality, static):
+    '''배경 CSS 문자열 (정적 서빙이면 URL, 아니면 base64 data URI)'''
+    ext, data = _background_asset(main_bg, mtime, max_width, quality)
+    if static:
+        stem = os.path.splitext(os.path.basename(main_bg))[0]
+        name = f"{stem}.{hashlib.sha256(data).hexdigest()[:12]}.{ext}"
+        path = os.path.join(STATIC_DIR, name)
+        if not os.path.exists(path):
+            os.makedirs(STATIC_DIR, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"  # 다른 세션이 반쯤 쓴 파일을 받지 않도록 바꿔치기
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        url = f"app/static/{name}"
+    else:
+        url = f"data:image/{ext};base64,{base64.b64encode(data).decode()}"
+    return f"""
              <style>
              .stApp {{
-                 background: url(data:image/{main_bg_ext};base64,{base64.b64encode(open(main_bg, "rb").read()).decode()});
+                 background: url({url});
                  background-size: cover; background-position: center; background-repeat: no-repeat; background-attachment: fixed;
              }}
              </style>
-             """, unsafe_allow_html=True)
-    except: pass
-
-def hide_header():
-    '''상단 툴바 숨기기'''
-    st.markdown("""<style>[data-testid="stHeader"] {visibility: hidden;} #MainMenu {visibility: hidden;} footer {visibility: hidden;} .block-container {padding-top: 0rem !important;}</style>""", unsafe_allow_html=True)
+             """
 
-def hide_sidebar():
-    '''사이드바 숨기기'''
-    st.markdown("""<style>[data-testid="stSidebar"] {display: none;} [data-testid="stSidebarCollapsedControl"] {display: none;}</style>""", unsafe_allow_html=True)
+def set_bg_hack(main_bg, max_width=BG_MAX_WIDTH, quality=BG_WEBP_QUALITY):
+    '''Home 배경 설정'''
+    try:
+        static = bool(st.get_option("server.enableStaticServing"))
+        css = _background_css(main_bg, os.path.getmtime(main_bg), max_width, quality, static)
+        st.markdown(css, unsafe_allow_html=True)
+    except: pass
 
 def show_footer():
-    '''공통 풋터'''
+    '''공통 풋터 (스타일은 assets/css/base.css, theme.apply 로 적용)'''
     st.markdown(
         """
-        <style>
-        .kfit-footer {
-            position: fixed;
-            left: 0;
-            bottom: 0;
-            width: 100%;
-            text-align: center;
-            padding: 10px 0;
-            
-            color: rgba(255, 255, 255, 0.85);
-            background: linear-gradient(to top, rgba(0,0,0,0.9), rgba(0,0,0,0));
-            z-index: 999;
-            
-            /* [핵심 수정 1] 반응형 폰트 크기: 화면 폭에 따라 폰트가 자동으로 줄어듭니다.
-               최소 10px, 권장 3.2vw(화면폭의 3.2%), 최대 0.85rem */
-            font-size: clamp(10px, 3.2vw, 0.85rem);
-            
-            /* [핵심 수정 2] 강제 줄바꿈 방지: <br> 태그 외에는 줄이 바뀌지 않습니다. */
-            white-space: nowrap;
-            
-            /* 혹시라도 글자가 화면을 넘어갈 경우를 대비한 안전장치 */
-            overflow: hidden;
-            text-overflow: ellipsis;
-        }
-        </style>
         <div class="kfit-footer">
             본 사이트의 모든 컨텐츠는 저작권법의 보호를 받으므로 무단 전재, 복사, 배포를 금합니다. <br> 
             Copyright © 2025 Korea Financial Investment Technology(KFIT)® All rights reserved.
@@ -81,6 +142,7 @@ def show_footer():
 # ==========================================
 # [NEW] 공통 상담 신청 폼 컴포넌트
 # ==========================================
+@profiling.timed("form")
 def render_common_form(app_type, DataModelClass, **simulation_data):
     """
     모든 앱에서 공통으로 사용하는 상담 신청 폼
@@ -123,14 +185,10 @@ def render_common_form(app_type, DataModelClass, **simulation_data):
                         **simulation_data
                     )
                     
-                    with st.spinner('데이터 전송 중...'):
-                        res, msg = send_data_to_api(app_type, data_obj.to_payload())
-                    
-                    if res:
-                        st.balloons()
-                        st.success(f"✅ {name}님, 신청이 완료되었습니다!")
-                    else:
-                        st.error(f"❌ 전송 실패: {msg}")
+                    # 로컬 대기열에 안전하게 기록되면 바로 완료 처리 (전송은 백그라운드 워커가 담당)
+                    outbox.enqueue(app_type, data_obj.to_payload(), send_batch=send_batch_to_api, phone=phone)
+                    st.balloons()
+                    st.success(f"✅ {name}님, 신청이 완료되었습니다!")
                 except Exception as e:
 
                     st.error(f"데이터 처리 중 오류 발생: {str(e)}")